@@ -0,0 +1,369 @@
+import asyncio
+import logging
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from playwright.async_api import async_playwright, Error as PlaywrightError
+from interface import Interface, implements
+from core.playwright_manager import get_launch_profile, _launch_options, _context_options
+
+
+def async_playwright_manager_factory(browser_type, launch_profile=None):
+    """
+    Factory function to return appropriate AsyncPlaywrightManager implementation
+    based on browser type
+
+    Args:
+        browser_type: Browser type string ('chrome', 'firefox', 'edge', 'webkit')
+        launch_profile: Launch profile dict from get_launch_profile (default: headless profile)
+
+    Returns:
+        Appropriate AsyncPlaywrightManager implementation instance
+    """
+    b_type = browser_type.lower()
+
+    if launch_profile is None:
+        launch_profile = get_launch_profile()
+
+    if b_type in ['chrome', 'chromium']:
+        return AsyncChromiumPlaywrightManager(launch_profile)
+
+    elif b_type in ['firefox']:
+        return AsyncFirefoxPlaywrightManager(launch_profile)
+
+    elif b_type in ['edge', 'msedge']:
+        return AsyncEdgePlaywrightManager(launch_profile)
+
+    elif b_type in ['webkit', 'safari']:
+        return AsyncWebKitPlaywrightManager(launch_profile)
+
+    else:
+        # Default to Chromium
+        return AsyncChromiumPlaywrightManager(launch_profile)
+
+
+def run_async(coroutine):
+    """
+    Run a coroutine to completion from synchronous code (e.g. a pytest test)
+
+    The sync Playwright API owns an event loop on the test thread, so the coroutine
+    is executed on its own loop in a worker thread, in a copy of the caller's context
+    (e.g. the step timing span of the running test).
+
+    Args:
+        coroutine: Coroutine to run
+
+    Returns:
+        Result of the coroutine
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(contextvars.copy_context().run, asyncio.run, coroutine).result()
+
+
+class AsyncPlaywrightManager(Interface):
+    """
+    Interface for asyncio based Playwright Browser Management
+    All concrete implementations must implement these methods
+    """
+
+    def __init__(self, launch_profile=None):
+        '''
+        Initiate the Playwright instance and browser configuration
+        '''
+        pass
+
+    async def launch_browser(self, playwright):
+        '''
+        Launch and return a browser on an already started async Playwright instance
+        Returns: Browser
+        '''
+        pass
+
+    def context_options(self):
+        '''
+        Keyword arguments for Browser.new_context derived from the launch profile
+        Returns: dict
+        '''
+        pass
+
+    async def create_browser(self):
+        '''
+        Create and return Playwright page, context, browser, and playwright objects
+        Returns: tuple(page, context, browser, playwright)
+        '''
+        pass
+
+
+class AsyncChromiumPlaywrightManager(implements(AsyncPlaywrightManager)):
+    """
+    Chromium/Chrome browser implementation using the async Playwright API
+    """
+
+    def __init__(self, launch_profile=None):
+        self.launch_profile = launch_profile or get_launch_profile()
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        self.page = None
+
+    async def launch_browser(self, playwright):
+        """
+        Launch Chromium browser on the given async Playwright instance
+
+        Returns:
+            Browser object
+        """
+        return await playwright.chromium.launch(
+            **_launch_options(self.launch_profile)
+        )
+
+    def context_options(self):
+        """
+        Context options for Chromium from the launch profile
+
+        Returns:
+            dict: Keyword arguments for Browser.new_context
+        """
+        return _context_options(self.launch_profile)
+
+    async def create_browser(self):
+        """
+        Launch Chromium browser and create page context
+
+        Returns:
+            tuple: (page, context, browser, playwright) objects
+        """
+        self.playwright = await async_playwright().start()
+        self.browser = await self.launch_browser(self.playwright)
+        self.context = await self.browser.new_context(**self.context_options())
+        self.page = await self.context.new_page()
+
+        return self.page, self.context, self.browser, self.playwright
+
+
+class AsyncFirefoxPlaywrightManager(implements(AsyncPlaywrightManager)):
+    """
+    Firefox browser implementation using the async Playwright API
+    """
+
+    def __init__(self, launch_profile=None):
+        self.launch_profile = launch_profile or get_launch_profile()
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        self.page = None
+
+    async def launch_browser(self, playwright):
+        """
+        Launch Firefox browser on the given async Playwright instance
+
+        Returns:
+            Browser object
+        """
+        # Profile args are Chromium switches, not passed to Firefox
+        return await playwright.firefox.launch(
+            **_launch_options(self.launch_profile, with_args=False)
+        )
+
+    def context_options(self):
+        """
+        Context options for Firefox from the launch profile
+
+        Returns:
+            dict: Keyword arguments for Browser.new_context
+        """
+        return _context_options(self.launch_profile)
+
+    async def create_browser(self):
+        """
+        Launch Firefox browser and create page context
+
+        Returns:
+            tuple: (page, context, browser, playwright) objects
+        """
+        self.playwright = await async_playwright().start()
+        self.browser = await self.launch_browser(self.playwright)
+        self.context = await self.browser.new_context(**self.context_options())
+        self.page = await self.context.new_page()
+
+        return self.page, self.context, self.browser, self.playwright
+
+
+class AsyncEdgePlaywrightManager(implements(AsyncPlaywrightManager)):
+    """
+    Microsoft Edge browser implementation using the async Playwright API
+    """
+
+    def __init__(self, launch_profile=None):
+        self.launch_profile = launch_profile or get_launch_profile()
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        self.page = None
+
+    async def launch_browser(self, playwright):
+        """
+        Launch Edge browser on the given async Playwright instance
+
+        Returns:
+            Browser object
+        """
+        return await playwright.chromium.launch(
+            channel='msedge',  # This launches Edge specifically
+            **_launch_options(self.launch_profile)
+        )
+
+    def context_options(self):
+        """
+        Context options for Edge from the launch profile
+
+        Returns:
+            dict: Keyword arguments for Browser.new_context
+        """
+        return _context_options(self.launch_profile)
+
+    async def create_browser(self):
+        """
+        Launch Edge browser and create page context
+
+        Returns:
+            tuple: (page, context, browser, playwright) objects
+        """
+        self.playwright = await async_playwright().start()
+        self.browser = await self.launch_browser(self.playwright)
+        self.context = await self.browser.new_context(**self.context_options())
+        self.page = await self.context.new_page()
+
+        return self.page, self.context, self.browser, self.playwright
+
+
+class AsyncWebKitPlaywrightManager(implements(AsyncPlaywrightManager)):
+    """
+    WebKit/Safari browser implementation using the async Playwright API
+    """
+
+    def __init__(self, launch_profile=None):
+        self.launch_profile = launch_profile or get_launch_profile()
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        self.page = None
+
+    async def launch_browser(self, playwright):
+        """
+        Launch WebKit browser on the given async Playwright instance
+
+        Returns:
+            Browser object
+        """
+        return await playwright.webkit.launch(
+            **_launch_options(self.launch_profile, with_args=False)
+        )
+
+    def context_options(self):
+        """
+        Context options for WebKit from the launch profile
+
+        Returns:
+            dict: Keyword arguments for Browser.new_context
+        """
+        # WebKit can not follow a maximized window, always use a fixed viewport
+        return _context_options(self.launch_profile, default_viewport={'width': 1920, 'height': 1080})
+
+    async def create_browser(self):
+        """
+        Launch WebKit browser and create page context
+
+        Returns:
+            tuple: (page, context, browser, playwright) objects
+        """
+        self.playwright = await async_playwright().start()
+        self.browser = await self.launch_browser(self.playwright)
+        self.context = await self.browser.new_context(**self.context_options())
+        self.page = await self.context.new_page()
+
+        return self.page, self.context, self.browser, self.playwright
+
+
+class AsyncBrowserPool:
+    """
+    Async counterpart of BrowserPool. One process keeps N browsers alive and drives
+    many BrowserContexts concurrently, bounded by max_contexts.
+    """
+
+    def __init__(self, manager, size=1, max_contexts=20):
+        '''
+        Args:
+            manager: AsyncPlaywrightManager implementation used to launch the browsers
+            size: Number of browser processes to keep alive (default: 1)
+            max_contexts: Maximum number of contexts leased at the same time (default: 20)
+        '''
+        self.manager = manager
+        self.size = max(1, int(size))
+        self.playwright = None
+        self.browsers = []
+        self._slots = asyncio.Semaphore(max(1, int(max_contexts)))
+
+    async def start(self):
+        """
+        Start async Playwright and launch the pool browsers
+
+        Returns:
+            AsyncBrowserPool: self, to allow await AsyncBrowserPool(...).start()
+        """
+        self.playwright = await async_playwright().start()
+        self.browsers = list(await asyncio.gather(
+            *[self.manager.launch_browser(self.playwright) for _ in range(self.size)]
+        ))
+        logging.info(f'Async browser pool started with {self.size} browser(s)')
+        return self
+
+    async def lease_context(self, **context_options):
+        """
+        Create a fresh BrowserContext on the least loaded browser, waits while
+        max_contexts contexts are already leased
+
+        Args:
+            context_options: Extra Browser.new_context options, override the launch profile ones
+
+        Returns:
+            BrowserContext object, give it back with release_context
+        """
+        await self._slots.acquire()
+
+        try:
+            options = self.manager.context_options()
+            options.update(context_options)
+            browser = min(self.browsers, key=lambda pool_browser: len(pool_browser.contexts))
+            return await browser.new_context(**options)
+        except Exception:
+            self._slots.release()
+            raise
+
+    async def release_context(self, context):
+        """
+        Close a leased context and free its slot
+
+        Args:
+            context: BrowserContext returned by lease_context
+        """
+        try:
+            await context.close()
+        except PlaywrightError as err:
+            logging.warning(f'Leased context could not be closed cleanly: {str(err)}')
+        finally:
+            self._slots.release()
+
+    async def close(self):
+        """
+        Close all browsers of the pool and stop Playwright
+        """
+        for browser in self.browsers:
+            try:
+                await browser.close()
+            except PlaywrightError as err:
+                logging.warning(f'Pool browser could not be closed cleanly: {str(err)}')
+        self.browsers = []
+
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
@@ -1,35 +1,186 @@
-from playwright.sync_api import sync_playwright
+import os
+import sys
+import copy
+import json
+import logging
+import tempfile
+import threading
+import subprocess
+from playwright.sync_api import sync_playwright, Error as PlaywrightError
 from interface import Interface, implements
 
 
-def playwright_manager_factory(browser_type):
+DEFAULT_LAUNCH_PROFILE = 'headless'
+
+# Environment variable through which the pytest controller hands the shared
+# browser server endpoint to the pytest-xdist workers
+BROWSER_SERVER_ENV = 'PW_BROWSER_WS_ENDPOINT'
+
+# Launch profiles shared by every PlaywrightManager implementation.
+# 'headless' is tuned for CI throughput, 'headed' is for a person debugging locally.
+# A viewport of None means "no fixed viewport", i.e. the window size drives the page (maximized).
+LAUNCH_PROFILES = {
+    'headless': {
+        'headless': True,
+        'viewport': {'width': 1920, 'height': 1080},
+        'device_scale_factor': 1,
+        'args': [
+            '--disable-gpu',
+            '--disable-dev-shm-usage',
+            '--disable-extensions',
+            '--disable-background-networking',
+            '--mute-audio',
+            '--no-first-run',
+        ],
+        'slow_mo': 0
+    },
+    'headed': {
+        'headless': False,
+        'viewport': None,
+        'device_scale_factor': None,
+        'args': ['--start-maximized'],
+        'slow_mo': 0
+    }
+}
+
+
+def get_launch_profile(profile_name=None, overrides=None):
+    """
+    Build the launch profile to be used by a PlaywrightManager
+
+    Args:
+        profile_name: Name of a profile from LAUNCH_PROFILES ('headless', 'headed').
+                      Defaults to DEFAULT_LAUNCH_PROFILE
+        overrides: Optional dict of profile keys to override, e.g. the matching
+                   'launch_profiles' block of config.json
+
+    Returns:
+        dict: Launch profile with keys headless, viewport, device_scale_factor, args, slow_mo
+
+    Raises:
+        ValueError: If the profile name is unknown
+    """
+    name = (profile_name or DEFAULT_LAUNCH_PROFILE).lower()
+
+    if name not in LAUNCH_PROFILES:
+        raise ValueError(
+            f"Unknown launch profile '{profile_name}'.\n"
+            f"Available profiles: {list(LAUNCH_PROFILES)}"
+        )
+
+    profile = copy.deepcopy(LAUNCH_PROFILES[name])
+    profile['name'] = name
+
+    for key, value in (overrides or {}).items():
+        if key not in profile:
+            raise ValueError(
+                f"Unknown launch profile option '{key}' for profile '{name}'.\n"
+                f"Available options: {[opt for opt in profile if opt != 'name']}"
+            )
+        profile[key] = value
+
+    return profile
+
+
+def _launch_options(launch_profile, with_args=True):
+    """
+    Translate a launch profile into keyword arguments for BrowserType.launch
+
+    Args:
+        launch_profile: Profile returned by get_launch_profile
+        with_args: Pass the Chromium command line switches of the profile (default: True)
+    """
+    options = {
+        'headless': launch_profile['headless'],
+        'slow_mo': launch_profile['slow_mo'] or 0
+    }
+
+    if with_args and launch_profile['args']:
+        options['args'] = list(launch_profile['args'])
+
+    return options
+
+
+def _context_options(launch_profile, default_viewport=None):
+    """
+    Translate a launch profile into keyword arguments for Browser.new_context
+
+    Args:
+        launch_profile: Profile returned by get_launch_profile
+        default_viewport: Viewport to use when the profile has none and the engine
+                          cannot follow the window size (e.g. WebKit)
+    """
+    viewport = launch_profile['viewport'] or default_viewport
+
+    if viewport is None:
+        # Maximized window decides the page size
+        return {'no_viewport': True}
+
+    options = {'viewport': viewport}
+
+    if launch_profile['device_scale_factor']:
+        options['device_scale_factor'] = launch_profile['device_scale_factor']
+
+    return options
+
+
+def _to_camel_case(option_name):
+    """
+    Convert a Python launch option name to the Node API name (e.g. slow_mo -> slowMo)
+    """
+    first, *rest = option_name.split('_')
+    return first + ''.join(part.title() for part in rest)
+
+
+def _read_server_output(stdout, endpoint: list, endpoint_read: threading.Event):
+    """
+    Read the endpoint line of the browser server, then log its further output until the process exits
+
+    Args:
+        stdout: Output pipe of the server process
+        endpoint: Receives the first line
+        endpoint_read: Set once the first line is read (or the output ended)
+    """
+    endpoint.append(stdout.readline().strip())
+    endpoint_read.set()
+
+    for line in stdout:
+        if line.strip():
+            logging.debug(f'Browser server: {line.strip()}')
+
+
+def playwright_manager_factory(browser_type, launch_profile=None):
     """
     Factory function to return appropriate PlaywrightManager implementation
     based on browser type
     
     Args:
         browser_type: Browser type string ('chrome', 'firefox', 'edge', 'webkit')
+        launch_profile: Launch profile dict from get_launch_profile (default: headless profile)
     
     Returns:
         Appropriate PlaywrightManager implementation instance
     """
     b_type = browser_type.lower()
 
+    if launch_profile is None:
+        launch_profile = get_launch_profile()
+
     if b_type in ['chrome', 'chromium']:
-        return ChromiumPlaywrightManager()
+        return ChromiumPlaywrightManager(launch_profile)
 
     elif b_type in ['firefox']:
-        return FirefoxPlaywrightManager()
+        return FirefoxPlaywrightManager(launch_profile)
 
     elif b_type in ['edge', 'msedge']:
-        return EdgePlaywrightManager()
+        return EdgePlaywrightManager(launch_profile)
 
     elif b_type in ['webkit', 'safari']:
-        return WebKitPlaywrightManager()
+        return WebKitPlaywrightManager(launch_profile)
 
     else:
         # Default to Chromium
-        return ChromiumPlaywrightManager()
+        return ChromiumPlaywrightManager(launch_profile)
 
 
 class PlaywrightManager(Interface):
@@ -38,12 +189,40 @@ class PlaywrightManager(Interface):
     All concrete implementations must implement these methods
     """
 
-    def __init__(self):
+    def __init__(self, launch_profile=None):
         '''
         Initiate the Playwright instance and browser configuration
         '''
         pass
 
+    def launch_browser(self, playwright):
+        '''
+        Launch and return a browser on an already started Playwright instance
+        Returns: Browser
+        '''
+        pass
+
+    def context_options(self):
+        '''
+        Keyword arguments for Browser.new_context derived from the launch profile
+        Returns: dict
+        '''
+        pass
+
+    def server_options(self):
+        '''
+        Browser type name and launch options for a shared browser server
+        Returns: tuple(browser_type_name, launch_options)
+        '''
+        pass
+
+    def connect_browser(self, playwright, ws_endpoint):
+        '''
+        Connect to a running browser server instead of launching a browser
+        Returns: Browser
+        '''
+        pass
+
     def create_browser(self):
         '''
         Create and return Playwright page, context, browser, and playwright objects
@@ -57,12 +236,53 @@ class ChromiumPlaywrightManager(implements(PlaywrightManager)):
     Chromium/Chrome browser implementation using Playwright
     """
 
-    def __init__(self):
+    def __init__(self, launch_profile=None):
+        self.launch_profile = launch_profile or get_launch_profile()
         self.playwright = None
         self.browser = None
         self.context = None
         self.page = None
 
+    def launch_browser(self, playwright):
+        """
+        Launch Chromium browser on the given Playwright instance
+
+        Returns:
+            Browser object
+        """
+        # Launch Chrome (Chromium)
+        return playwright.chromium.launch(
+            **_launch_options(self.launch_profile)
+        )
+
+    def context_options(self):
+        """
+        Context options for Chromium from the launch profile
+
+        Returns:
+            dict: Keyword arguments for Browser.new_context
+        """
+        # Headed profile has no viewport to allow maximized window
+        return _context_options(self.launch_profile)
+
+    def server_options(self):
+        """
+        Browser type and launch options to start a shared Chromium browser server
+
+        Returns:
+            tuple: (browser_type_name, launch_options)
+        """
+        return 'chromium', _launch_options(self.launch_profile)
+
+    def connect_browser(self, playwright, ws_endpoint):
+        """
+        Connect to a running Chromium browser server
+
+        Returns:
+            Browser object
+        """
+        return playwright.chromium.connect(ws_endpoint)
+
     def create_browser(self):
         """
         Launch Chromium browser and create page context
@@ -72,15 +292,11 @@ class ChromiumPlaywrightManager(implements(PlaywrightManager)):
         """
         self.playwright = sync_playwright().start()
         
-        # Launch Chrome (Chromium)
-        self.browser = self.playwright.chromium.launch(
-            headless=False,
-            args=['--start-maximized']
-        )
+        self.browser = self.launch_browser(self.playwright)
         
-        # Create context with no viewport to allow maximized window
+        # Create context
         self.context = self.browser.new_context(
-            no_viewport=True
+            **self.context_options()
         )
         
         # Create page
@@ -94,12 +310,52 @@ class FirefoxPlaywrightManager(implements(PlaywrightManager)):
     Firefox browser implementation using Playwright
     """
 
-    def __init__(self):
+    def __init__(self, launch_profile=None):
+        self.launch_profile = launch_profile or get_launch_profile()
         self.playwright = None
         self.browser = None
         self.context = None
         self.page = None
 
+    def launch_browser(self, playwright):
+        """
+        Launch Firefox browser on the given Playwright instance
+
+        Returns:
+            Browser object
+        """
+        # Launch Firefox (profile args are Chromium switches, not passed to Firefox)
+        return playwright.firefox.launch(
+            **_launch_options(self.launch_profile, with_args=False)
+        )
+
+    def context_options(self):
+        """
+        Context options for Firefox from the launch profile
+
+        Returns:
+            dict: Keyword arguments for Browser.new_context
+        """
+        return _context_options(self.launch_profile)
+
+    def server_options(self):
+        """
+        Browser type and launch options to start a shared Firefox browser server
+
+        Returns:
+            tuple: (browser_type_name, launch_options)
+        """
+        return 'firefox', _launch_options(self.launch_profile, with_args=False)
+
+    def connect_browser(self, playwright, ws_endpoint):
+        """
+        Connect to a running Firefox browser server
+
+        Returns:
+            Browser object
+        """
+        return playwright.firefox.connect(ws_endpoint)
+
     def create_browser(self):
         """
         Launch Firefox browser and create page context
@@ -109,15 +365,11 @@ class FirefoxPlaywrightManager(implements(PlaywrightManager)):
         """
         self.playwright = sync_playwright().start()
         
-        # Launch Firefox
-        self.browser = self.playwright.firefox.launch(
-            headless=False,
-            args=['--start-maximized']
-        )
+        self.browser = self.launch_browser(self.playwright)
         
         # Create context
         self.context = self.browser.new_context(
-            no_viewport=True
+            **self.context_options()
         )
         
         # Create page
@@ -131,12 +383,53 @@ class EdgePlaywrightManager(implements(PlaywrightManager)):
     Microsoft Edge browser implementation using Playwright
     """
 
-    def __init__(self):
+    def __init__(self, launch_profile=None):
+        self.launch_profile = launch_profile or get_launch_profile()
         self.playwright = None
         self.browser = None
         self.context = None
         self.page = None
 
+    def launch_browser(self, playwright):
+        """
+        Launch Edge browser on the given Playwright instance
+
+        Returns:
+            Browser object
+        """
+        # Launch Edge (using Chromium with Edge channel)
+        return playwright.chromium.launch(
+            channel='msedge',  # This launches Edge specifically
+            **_launch_options(self.launch_profile)
+        )
+
+    def context_options(self):
+        """
+        Context options for Edge from the launch profile
+
+        Returns:
+            dict: Keyword arguments for Browser.new_context
+        """
+        return _context_options(self.launch_profile)
+
+    def server_options(self):
+        """
+        Browser type and launch options to start a shared Edge browser server
+
+        Returns:
+            tuple: (browser_type_name, launch_options)
+        """
+        return 'chromium', dict(_launch_options(self.launch_profile), channel='msedge')
+
+    def connect_browser(self, playwright, ws_endpoint):
+        """
+        Connect to a running Edge browser server
+
+        Returns:
+            Browser object
+        """
+        return playwright.chromium.connect(ws_endpoint)
+
     def create_browser(self):
         """
         Launch Edge browser and create page context
@@ -146,16 +439,11 @@ class EdgePlaywrightManager(implements(PlaywrightManager)):
         """
         self.playwright = sync_playwright().start()
         
-        # Launch Edge (using Chromium with Edge channel)
-        self.browser = self.playwright.chromium.launch(
-            channel='msedge',  # This launches Edge specifically
-            headless=False,
-            args=['--start-maximized']
-        )
+        self.browser = self.launch_browser(self.playwright)
         
         # Create context
         self.context = self.browser.new_context(
-            no_viewport=True
+            **self.context_options()
         )
         
         # Create page
@@ -169,12 +457,53 @@ class WebKitPlaywrightManager(implements(PlaywrightManager)):
     WebKit/Safari browser implementation using Playwright
     """
 
-    def __init__(self):
+    def __init__(self, launch_profile=None):
+        self.launch_profile = launch_profile or get_launch_profile()
         self.playwright = None
         self.browser = None
         self.context = None
         self.page = None
 
+    def launch_browser(self, playwright):
+        """
+        Launch WebKit browser on the given Playwright instance
+
+        Returns:
+            Browser object
+        """
+        # Launch WebKit (Safari engine)
+        return playwright.webkit.launch(
+            **_launch_options(self.launch_profile, with_args=False)
+        )
+
+    def context_options(self):
+        """
+        Context options for WebKit from the launch profile
+
+        Returns:
+            dict: Keyword arguments for Browser.new_context
+        """
+        # WebKit can not follow a maximized window, always use a fixed viewport
+        return _context_options(self.launch_profile, default_viewport={'width': 1920, 'height': 1080})
+
+    def server_options(self):
+        """
+        Browser type and launch options to start a shared WebKit browser server
+
+        Returns:
+            tuple: (browser_type_name, launch_options)
+        """
+        return 'webkit', _launch_options(self.launch_profile, with_args=False)
+
+    def connect_browser(self, playwright, ws_endpoint):
+        """
+        Connect to a running WebKit browser server
+
+        Returns:
+            Browser object
+        """
+        return playwright.webkit.connect(ws_endpoint)
+
     def create_browser(self):
         """
         Launch WebKit browser and create page context
@@ -184,17 +513,198 @@ class WebKitPlaywrightManager(implements(PlaywrightManager)):
         """
         self.playwright = sync_playwright().start()
         
-        # Launch WebKit (Safari engine)
-        self.browser = self.playwright.webkit.launch(
-            headless=False
-        )
+        self.browser = self.launch_browser(self.playwright)
         
         # Create context
         self.context = self.browser.new_context(
-            viewport={'width': 1920, 'height': 1080}
+            **self.context_options()
         )
         
         # Create page
         self.page = self.context.new_page()
         
         return self.page, self.context, self.browser, self.playwright
+
+
+class BrowserPool:
+    """
+    Keeps N warm browser processes alive and leases a fresh BrowserContext per test.
+    Creating a context is far cheaper than launching a browser, so every test gets
+    isolated cookies/storage/cache without paying the browser launch cost.
+    """
+
+    def __init__(self, manager, size=1, ws_endpoint=None):
+        '''
+        Args:
+            manager: PlaywrightManager implementation used to launch the browsers
+            size: Number of browser processes (or server connections) to keep alive (default: 1)
+            ws_endpoint: Endpoint of a shared BrowserServer, connect to it instead of launching
+        '''
+        self.manager = manager
+        self.size = max(1, int(size))
+        self.ws_endpoint = ws_endpoint
+        self.playwright = None
+        self.browsers = []
+
+    def start(self):
+        """
+        Start Playwright and launch the pool browsers
+
+        Returns:
+            BrowserPool: self, to allow BrowserPool(...).start()
+        """
+        self.playwright = sync_playwright().start()
+        self.browsers = [self._new_browser() for _ in range(self.size)]
+
+        if self.ws_endpoint:
+            logging.info(f'Browser pool connected {self.size} time(s) to browser server {self.ws_endpoint}')
+        else:
+            logging.info(f'Browser pool started with {self.size} browser(s)')
+        return self
+
+    def lease_context(self, **context_options):
+        """
+        Create a fresh BrowserContext on the least loaded browser of the pool
+
+        Args:
+            context_options: Extra Browser.new_context options, override the launch profile ones
+
+        Returns:
+            BrowserContext object, give it back with release_context
+        """
+        options = self.manager.context_options()
+        options.update(context_options)
+        return self._least_loaded_browser().new_context(**options)
+
+    def release_context(self, context):
+        """
+        Close a leased context, the browser process stays alive for the next test
+
+        Args:
+            context: BrowserContext returned by lease_context
+        """
+        try:
+            context.close()
+        except PlaywrightError as err:
+            logging.warning(f'Leased context could not be closed cleanly: {str(err)}')
+
+    def close(self):
+        """
+        Close all browsers of the pool and stop Playwright
+        """
+        for browser in self.browsers:
+            try:
+                browser.close()
+            except PlaywrightError as err:
+                logging.warning(f'Pool browser could not be closed cleanly: {str(err)}')
+        self.browsers = []
+
+        if self.playwright:
+            self.playwright.stop()
+            self.playwright = None
+
+    def _least_loaded_browser(self):
+        """
+        Pick the browser with the fewest open contexts, relaunching crashed ones
+        so a single bad process does not fail the rest of the session
+        """
+        for index, browser in enumerate(self.browsers):
+            if not browser.is_connected():
+                logging.warning(f'Pool browser {index} disconnected, launching a replacement')
+                self.browsers[index] = self._new_browser()
+
+        return min(self.browsers, key=lambda browser: len(browser.contexts))
+
+    def _new_browser(self):
+        """
+        Launch a browser, or connect to the shared browser server when one is given
+        """
+        if self.ws_endpoint:
+            return self.manager.connect_browser(self.playwright, self.ws_endpoint)
+        return self.manager.launch_browser(self.playwright)
+
+
+class BrowserServer:
+    """
+    A single Playwright browser server process shared by all the pytest-xdist workers.
+    Workers connect to its websocket endpoint and open their own contexts, so N workers
+    drive one browser process instead of launching N browsers.
+    """
+
+    def __init__(self, manager):
+        '''
+        Args:
+            manager: PlaywrightManager implementation providing the server launch options
+        '''
+        self.manager = manager
+        self.process = None
+        self.ws_endpoint = None
+        self._config_path = None
+
+    def start(self, timeout=60):
+        """
+        Launch the browser server through the Playwright driver CLI and wait for its endpoint
+
+        Args:
+            timeout: Maximum wait time in seconds for the server to come up (default: 60)
+
+        Returns:
+            str: Websocket endpoint the workers connect to
+
+        Raises:
+            TimeoutError: If the server did not print its endpoint within timeout
+        """
+        browser_type_name, launch_options = self.manager.server_options()
+
+        # launch-server hands the config file to the Node API, which expects camelCase keys (slow_mo -> slowMo)
+        server_config = {_to_camel_case(key): value for key, value in launch_options.items()}
+
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as config_file:
+            json.dump(server_config, config_file)
+            self._config_path = config_file.name
+
+        self.process = subprocess.Popen(
+            [sys.executable, '-m', 'playwright', 'launch-server',
+             '--browser', browser_type_name, '--config', self._config_path],
+            stdout=subprocess.PIPE,
+            text=True
+        )
+
+        # The server prints its endpoint as the first line, read it without blocking forever.
+        # The reader keeps draining the pipe afterwards, a full pipe would block the server
+        endpoint = []
+        endpoint_read = threading.Event()
+        threading.Thread(
+            target=_read_server_output, args=(self.process.stdout, endpoint, endpoint_read), daemon=True
+        ).start()
+        endpoint_read.wait(timeout)
+
+        if not endpoint or not endpoint[0].startswith('ws'):
+            exit_code = self.process.poll()
+            self.stop()
+            raise TimeoutError(
+                f"Browser server did not start within {timeout}s.\n"
+                f"Browser: {browser_type_name}\n"
+                f"Server exit code: {exit_code}\n"
+                f"Output: {endpoint[0] if endpoint else ''}"
+            )
+
+        self.ws_endpoint = endpoint[0]
+        logging.info(f'Browser server ({browser_type_name}) listening on {self.ws_endpoint}')
+        return self.ws_endpoint
+
+    def stop(self):
+        """
+        Stop the browser server process and remove its temporary config
+        """
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        self.process = None
+
+        if self._config_path and os.path.exists(self._config_path):
+            os.remove(self._config_path)
+        self._config_path = None
@@ -10,15 +10,80 @@ Author: example QA Team
 
 import xml.etree.ElementTree as ET
 import os
+import re
+import ast
+import glob
+import argparse
 from datetime import datetime
 from collections import defaultdict
 import json
 import base64
+from utility.results_store import ResultsStore, DEFAULT_WINDOW
+
+# Docstring steps of every test module already read: abs path -> (mtime, {qualified test name: formatted steps})
+_STEPS_INDEX_CACHE = {}
+
+
+def get_test_steps_index(test_file_path):
+    """
+    Formatted docstring steps of all the test functions of a module, parsed once with ast and cached by
+    path and modification time. Keys are the qualified names ('TestClass.test_x', 'TestOuter.TestInner.test_y')
+    and, for lookups without a class, the bare function names
+    """
+    abs_path = os.path.abspath(test_file_path)
+    mtime = os.path.getmtime(abs_path)
+    cached = _STEPS_INDEX_CACHE.get(abs_path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    
+    with open(abs_path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=abs_path)
+    
+    index = {}
+    
+    def visit(nodes, prefix):
+        for node in nodes:
+            if isinstance(node, ast.ClassDef):
+                visit(node.body, f"{prefix}{node.name}.")
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                steps = _format_docstring_steps(ast.get_docstring(node) or '')
+                index[f"{prefix}{node.name}"] = steps
+                index.setdefault(node.name, steps)
+    
+    visit(tree.body, '')
+    _STEPS_INDEX_CACHE[abs_path] = (mtime, index)
+    print(f"  📚 Indexed docstring steps of {test_file_path}")
+    return index
+
+
+def _format_docstring_steps(docstring):
+    """Format the 'Steps:' section of a docstring as a numbered HTML list, empty when there is none"""
+    steps_start = docstring.lower().find("steps:")
+    if steps_start == -1:
+        return ""
+    
+    # Clean up and format steps
+    steps_lines = [line.strip() for line in docstring[steps_start + 6:].strip().split('\n') if line.strip()]
+    
+    # Remove leading "1.", "2.", etc. or "1 ", "2 ", or "- "
+    cleaned_steps = [step.lstrip('0123456789.-) ').strip() for step in steps_lines]
+    cleaned_steps = [step for step in cleaned_steps if step]
+    
+    # Format as numbered list with HTML line breaks
+    return '<br/>'.join([f"{i+1}. {step}" for i, step in enumerate(cleaned_steps)])
+
 
 class TestDashboardGenerator:
     
-    def __init__(self, xml_file_path="report/old_report.xml", output_path="report/dashboard.html"):
+    def __init__(self, xml_file_path="report/old_report.xml", output_path="report/dashboard.html", results_store=None, trend_window=DEFAULT_WINDOW):
+        # One path, a glob pattern (e.g. report/report_*.xml) or a list of them, all merged into one dashboard
         self.xml_file_path = xml_file_path
+        self.xml_file_paths = self._resolve_xml_files(xml_file_path)
+        # JUnit classname -> (test module path, nested class names), resolved once per class
+        self.test_files = {}
+        # SQLite results store of the previous runs, renders the trends section when given
+        self.results_store = results_store
+        self.trend_window = trend_window
         self.output_path = output_path
         self.test_data = defaultdict(lambda: {
             'total': 0,
@@ -30,37 +95,75 @@ class TestDashboardGenerator:
             'tests': []
         })
         
+    def _resolve_xml_files(self, xml_file_path):
+        """Expand the given path(s) and glob patterns into the list of XML files, in a stable order"""
+        patterns = [xml_file_path] if isinstance(xml_file_path, str) else list(xml_file_path)
+        files = []
+        
+        for pattern in patterns:
+            matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+            files.extend(match for match in matches if match not in files)
+        
+        return files
+    
     def parse_xml_results(self):
-        """Parse the pytest XML file and extract test results"""
+        """Parse the pytest XML file(s) and extract test results"""
+        existing_files = [path for path in self.xml_file_paths if os.path.exists(path)]
+        
+        for path in self.xml_file_paths:
+            if path not in existing_files:
+                print(f"XML file not found: {path}")
+        
+        if not existing_files:
+            print("Make sure to run pytest first to generate the XML report")
+            return False
+        
+        parsed = 0
+        for path in existing_files:
+            source = os.path.splitext(os.path.basename(path))[0] if len(existing_files) > 1 else None
+            if self._parse_xml_file(path, source):
+                parsed += 1
+        
+        return parsed > 0
+    
+    def _parse_xml_file(self, path, source=None):
+        """
+        Stream one JUnit XML file with iterparse, every testcase is processed as soon as it is complete
+        and then dropped from the tree, so memory stays flat however many testcases and captured logs the file has
+        """
         try:
-            if not os.path.exists(self.xml_file_path):
-                print(f"XML file not found: {self.xml_file_path}")
-                print("Make sure to run pytest first to generate the XML report")
-                return False
-                
-            tree = ET.parse(self.xml_file_path)
-            root = tree.getroot()
+            print(f"📊 Parsing XML results from: {path}")
             
-            print(f"📊 Parsing XML results from: {self.xml_file_path}")
+            # Open elements from the root down to the current one, the last one is the parent of an ending element
+            open_elements = []
             
-            # Handle both testsuite and testsuites root elements
-            testsuites = root.findall('.//testsuite') if root.tag == 'testsuites' else [root]
+            for event, elem in ET.iterparse(path, events=('start', 'end')):
+                if event == 'start':
+                    open_elements.append(elem)
+                    continue
+                
+                open_elements.pop()
+                
+                if elem.tag in ('system-out', 'system-err'):
+                    # Captured logs are never shown on the dashboard, free them before the testcase ends
+                    elem.clear()
+                elif elem.tag == 'testcase':
+                    self._process_testcase(elem, source)
+                    elem.clear()
+                    if open_elements:
+                        open_elements[-1].remove(elem)
             
-            for testsuite in testsuites:
-                for testcase in testsuite.findall('testcase'):
-                    self._process_testcase(testcase)
-                    
             return True
             
         except ET.ParseError as e:
-            print(f"Error parsing XML file: {e}")
+            print(f"Error parsing XML file {path}: {e}")
             return False
         except Exception as e:
-            print(f"Unexpected error: {e}")
+            print(f"Unexpected error while parsing {path}: {e}")
             return False
     
-    def _process_testcase(self, testcase):
-        """Process individual test case and extract module information"""
+    def _process_testcase(self, testcase, source=None):
+        """Process individual test case and extract module information, source names the XML file when merging several"""
         classname = testcase.get('classname', '')
         test_name = testcase.get('name', '')
         duration = float(testcase.get('time', 0))
@@ -79,7 +182,7 @@ class TestDashboardGenerator:
         
         # Store individual test details
         test_info = {
-            'name': self._format_test_name(test_name),
+            'name': self._format_test_name(test_name) + (f' [{source}]' if source else ''),
             'raw_name': test_name,  # Keep original name for reference
             'status': status,
             'duration': duration,
@@ -99,8 +202,46 @@ class TestDashboardGenerator:
         if test_steps:
             test_info['steps'] = test_steps
         
+        # Step timings recorded by the conftest (page-object methods and helpers)
+        step_timings = self._extract_step_timings(testcase)
+        if step_timings:
+            test_info['step_timings'] = step_timings
+        
         module_data['tests'].append(test_info)
     
+    def _extract_step_timings(self, testcase):
+        """Extract the step timings property of a test case (list of spans), empty when not recorded"""
+        for prop in testcase.iter('property'):
+            if prop.get('name') == 'step_timings':
+                try:
+                    return json.loads(prop.get('value', '[]'))
+                except ValueError:
+                    print(f"  ⚠️  Invalid step timings for {testcase.get('name', '')}")
+        return []
+    
+    def _format_step_timings(self, step_timings):
+        """Format step timings as a table, nested calls are indented under their caller"""
+        rows = ""
+        for span in step_timings:
+            name = span['step'].split(' > ')[-1]
+            rows += f"""
+                                <tr>
+                                    <td style="padding-left: {span['depth'] * 20 + 8}px;">{name}</td>
+                                    <td>{span['calls']}</td>
+                                    <td>{span['seconds']:.3f}s</td>
+                                    <td>{span['round_trips']}</td>
+                                    <td>{span['sleep_seconds']:.3f}s</td>
+                                </tr>"""
+        
+        return f"""
+                            <table class="step-timings">
+                                <thead>
+                                    <tr><th>Step</th><th>Calls</th><th>Wall Time</th><th>Round Trips</th><th>Sleep</th></tr>
+                                </thead>
+                                <tbody>{rows}
+                                </tbody>
+                            </table>"""
+    
     def _extract_module_name(self, classname):
         """Extract readable module name from test classname"""
         if not classname:
@@ -195,7 +336,7 @@ class TestDashboardGenerator:
         return formatted_name
     
     def _extract_test_steps(self, classname, test_name):
-        """Extract test steps from test file docstring"""
+        """Extract test steps from test file docstring, through the per-module index"""
         try:
             # Parse classname to get test file path
             # e.g., test_demo.test_example_bank_statement.TestBankStatement
@@ -203,94 +344,41 @@ class TestDashboardGenerator:
                 print(f"  ⚠️  No classname for {test_name}")
                 return ""
             
-            parts = classname.split('.')
-            if len(parts) < 2:
-                print(f"  ⚠️  Invalid classname format: {classname}")
-                return ""
-            
-            # Get test file name
-            # Format can be either:
-            # - test_example_bank_statement.TestBankStatement (2 parts)
-            # - test_demo.test_example_bank_statement.TestBankStatement (3 parts)
-            if len(parts) == 2:
-                # Format: test_example_bank_statement.TestBankStatement
-                test_file = parts[0]  # test_example_bank_statement
-                test_dir = "test_demo"  # Default directory
-            else:
-                # Format: test_demo.test_example_bank_statement.TestBankStatement
-                test_dir = parts[0]  # test_demo
-                test_file = parts[1]  # test_example_bank_statement
-            
-            # Construct file path
-            test_file_path = os.path.join(test_dir, f"{test_file}.py")
-            
-            print(f"  🔍 Looking for: {test_file_path} -> {test_name}")
-            
-            if not os.path.exists(test_file_path):
-                print(f"  ❌ File not found: {test_file_path}")
-                return ""
-            
-            # Read the file and find the test function
-            with open(test_file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Find the test function definition
-            function_pattern = f"def {test_name}("
-            if function_pattern not in content:
-                return ""
-            
-            # Extract the docstring
-            start_idx = content.find(function_pattern)
-            if start_idx == -1:
-                return ""
-            
-            # Find the docstring (look for ''' or """)
-            docstring_start = content.find("'''", start_idx)
-            if docstring_start == -1:
-                docstring_start = content.find('"""', start_idx)
-                if docstring_start == -1:
-                    return ""
-                quote_type = '"""'
-            else:
-                quote_type = "'''"
-            
-            # Find the end of docstring
-            docstring_end = content.find(quote_type, docstring_start + 3)
-            if docstring_end == -1:
+            if classname not in self.test_files:
+                self.test_files[classname] = self._resolve_test_file(classname)
+            test_file_path, class_path = self.test_files[classname]
+            if not test_file_path:
+                print(f"  ❌ Test file not found for: {classname}")
                 return ""
             
-            # Extract docstring content
-            docstring = content[docstring_start + 3:docstring_end].strip()
-            
-            # Extract only the "Steps:" section
-            if "Steps:" in docstring or "steps:" in docstring:
-                # Find Steps section
-                steps_start = docstring.lower().find("steps:")
-                if steps_start != -1:
-                    steps_content = docstring[steps_start + 6:].strip()
-                    # Clean up and format steps
-                    steps_lines = [line.strip() for line in steps_content.split('\n') if line.strip()]
-                    
-                    # Remove leading numbers, hyphens, and clean up each step
-                    cleaned_steps = []
-                    for step in steps_lines:
-                        # Remove leading "1.", "2.", etc. or "1 ", "2 ", or "- "
-                        step = step.lstrip('0123456789.-) ').strip()
-                        if step:  # Only add non-empty steps
-                            cleaned_steps.append(step)
-                    
-                    # Format as numbered list with HTML line breaks
-                    formatted_steps = '<br/>'.join([f"{i+1}. {step}" for i, step in enumerate(cleaned_steps)])
-                    print(f"  ✅ Extracted steps for {test_name}")
-                    return formatted_steps
+            index = get_test_steps_index(test_file_path)
             
-            print(f"  ⚠️  No steps found in docstring for {test_name}")
-            return ""
+            # Parametrized tests are reported as 'test_x[param-id]', the docstring belongs to 'test_x'
+            function_name = re.sub(r'\[.*\]$', '', test_name)
+            qualified_name = '.'.join(class_path + [function_name])
+            return index.get(qualified_name, index.get(function_name, ""))
             
         except Exception as e:
             print(f"Error extracting steps for {test_name}: {e}")
             return ""
     
+    def _resolve_test_file(self, classname):
+        """
+        Split a JUnit classname into the test module path and the (nested) class names, e.g.
+        'test_demo.test_example_bank_statement.TestBankStatement' -> ('test_demo/test_example_bank_statement.py', ['TestBankStatement']).
+        Classnames without the package ('test_example_bank_statement.TestBankStatement') are looked up in test_demo
+        """
+        parts = classname.split('.')
+        
+        for prefix in ([], ["test_demo"]):
+            candidate_parts = prefix + parts
+            for end in range(len(candidate_parts), len(prefix), -1):
+                test_file_path = os.path.join(*candidate_parts[:end]) + ".py"
+                if os.path.exists(test_file_path):
+                    return test_file_path, candidate_parts[end:]
+        
+        return None, []
+    
     def _calculate_success_rate(self, module_data):
         """Calculate success rate for a module"""
         total = module_data['total']
@@ -378,6 +466,9 @@ class TestDashboardGenerator:
         # Generate module cards HTML
         module_cards_html = self._generate_module_cards()
         
+        # Duration trends and flakiness across runs, from the results store
+        trends_html = self._generate_trends_section()
+        
         # Get logo as base64 for embedding
         logo_base64 = self._get_logo_base64()
 
@@ -653,6 +744,32 @@ class TestDashboardGenerator:
             color: #555;
         }}
         
+        .trends-table {{
+            width: 100%;
+            background: white;
+            border-radius: 15px;
+            box-shadow: 0 10px 25px rgba(0, 0, 0, 0.1);
+            margin-bottom: 25px;
+            font-size: 0.9rem;
+        }}
+        
+        .trends-table th, .trends-table td {{
+            padding: 8px 12px;
+            border-bottom: 1px solid #e9ecef;
+        }}
+        
+        .step-timings {{
+            width: 100%;
+            margin-top: 10px;
+            font-size: 0.85rem;
+            color: #555;
+        }}
+        
+        .step-timings th, .step-timings td {{
+            padding: 4px 8px;
+            border-bottom: 1px solid #e9ecef;
+        }}
+        
         .test-status {{
             display: flex;
             align-items: center;
@@ -986,6 +1103,8 @@ class TestDashboardGenerator:
                 {module_cards_html}
             </div>
             
+            {trends_html}
+            
             <!-- Footer -->
             <div class="footer">
                 <p><i class="fas fa-robot"></i> Generated by example</p>
@@ -1045,16 +1164,22 @@ class TestDashboardGenerator:
                 status_class = f"status-{test['status']}"
                 icon = self._get_status_icon(test['status'])
                 
-                # Get test steps if available
+                # Get test steps and step timings if available
                 test_steps = test.get('steps', '')
-                has_steps = bool(test_steps)
+                step_timings = test.get('step_timings', [])
+                has_steps = bool(test_steps or step_timings)
                 
                 # Generate unique ID for collapse
                 collapse_id = f"collapse-{module_name.replace(' ', '-')}-{idx}"
+                onclick = f'onclick="toggleSteps(\'{collapse_id}\')"' if has_steps else ''
+                steps_html = f"""<strong><i class="fas fa-list-ol"></i> Test Steps:</strong>
+                            <div class="steps-list">{test_steps}</div>""" if test_steps else ''
+                timings_html = f"""<strong><i class="fas fa-stopwatch"></i> Step Timings:</strong>
+                            {self._format_step_timings(step_timings)}""" if step_timings else ''
                 
                 test_details_html += f"""
                 <div class="test-item-container">
-                    <div class="test-item" {'onclick="toggleSteps(\'' + collapse_id + '\')"' if has_steps else ''} style="cursor: {'pointer' if has_steps else 'default'};">
+                    <div class="test-item" {onclick} style="cursor: {'pointer' if has_steps else 'default'};">
                         <div class="test-name-container">
                             {f'<i class="fas fa-chevron-right collapse-icon" id="icon-{collapse_id}"></i>' if has_steps else ''}
                             <span class="test-name">{test['name']}</span>
@@ -1068,8 +1193,8 @@ class TestDashboardGenerator:
                     </div>
                     {f'''<div class="test-steps-collapse" id="{collapse_id}" style="display: none;">
                         <div class="test-steps-content">
-                            <strong><i class="fas fa-list-ol"></i> Test Steps:</strong>
-                            <div class="steps-list">{test_steps}</div>
+                            {steps_html}
+                            {timings_html}
                         </div>
                     </div>''' if has_steps else ''}
                 </div>
@@ -1125,6 +1250,94 @@ class TestDashboardGenerator:
         
         return cards_html
     
+    def _generate_trends_section(self):
+        """Generate HTML for the duration trends, p50/p95 and flakiness of the tests over the stored runs"""
+        if not self.results_store or not os.path.exists(self.results_store):
+            return ""
+        
+        with ResultsStore(self.results_store) as store:
+            runs = store.get_runs(self.trend_window)
+            duration_stats = store.get_duration_stats(self.trend_window)
+            flakiness = store.get_flakiness(self.trend_window)
+            step_stats = store.get_step_stats(self.trend_window)
+        
+        if not runs:
+            return ""
+        
+        print(f"📈 Rendering trends of the last {len(runs)} run(s) from: {self.results_store}")
+        
+        # Tests flipping between pass and fail first, then the slowest
+        tests = sorted(
+            {stat['test'] for stat in duration_stats} | set(flakiness),
+            key=lambda name: (-flakiness.get(name, {}).get('flip_rate', 0), name)
+        )
+        durations = {stat['test']: stat for stat in duration_stats}
+        
+        rows = ""
+        for name in tests:
+            stat = durations.get(name, {})
+            flaky = flakiness.get(name, {})
+            trend = stat.get('trend_percent')
+            trend_class = 'text-danger' if trend is not None and trend > 10 else 'text-success' if trend is not None and trend < -10 else ''
+            rows += f"""
+                    <tr>
+                        <td>{self._format_test_name(name.split('::')[-1])}</td>
+                        <td>{flaky.get('runs', stat.get('runs', 0))}</td>
+                        <td>{f"{stat['p50']:.2f}s" if stat else '-'}</td>
+                        <td>{f"{stat['p95']:.2f}s" if stat else '-'}</td>
+                        <td class="{trend_class}">{f"{trend:+.1f}%" if trend is not None else '-'}</td>
+                        <td>{self._get_sparkline(stat.get('durations', []))}</td>
+                        <td>{flaky.get('fail_rate', 0):.1f}%</td>
+                        <td>{flaky.get('flip_rate', 0):.1f}%</td>
+                    </tr>"""
+        
+        step_rows = "".join(f"""
+                    <tr>
+                        <td>{step['step']}</td>
+                        <td>{step['samples']}</td>
+                        <td>{step['p50']:.2f}s</td>
+                        <td>{step['p95']:.2f}s</td>
+                        <td>{step['round_trips']}</td>
+                    </tr>""" for step in step_stats)
+        
+        steps_table = f"""
+            <table class="trends-table">
+                <thead>
+                    <tr><th>Page-object Step</th><th>Samples</th><th>p50</th><th>p95</th><th>Round Trips</th></tr>
+                </thead>
+                <tbody>{step_rows}
+                </tbody>
+            </table>""" if step_rows else ""
+        
+        return f"""
+            <!-- Trends across runs -->
+            <div class="modules-section">
+                <h2 class="section-title">
+                    <i class="fas fa-chart-area"></i> Trends of the last {len(runs)} Run(s)
+                </h2>
+                <table class="trends-table">
+                    <thead>
+                        <tr><th>Test</th><th>Runs</th><th>p50</th><th>p95</th><th>Trend</th><th>Duration History</th><th>Fail Rate</th><th>Flip Rate</th></tr>
+                    </thead>
+                    <tbody>{rows}
+                    </tbody>
+                </table>
+                {steps_table}
+            </div>"""
+    
+    def _get_sparkline(self, values, width=120, height=24):
+        """Inline SVG polyline of the durations in run order"""
+        if len(values) < 2:
+            return ""
+        
+        low, high = min(values), max(values)
+        span = (high - low) or 1
+        step = width / (len(values) - 1)
+        points = " ".join(
+            f"{i * step:.1f},{height - (value - low) / span * (height - 2) - 1:.1f}" for i, value in enumerate(values)
+        )
+        return f'<svg width="{width}" height="{height}"><polyline points="{points}" fill="none" stroke="#667eea" stroke-width="1.5"/></svg>'
+    
     def _get_status_icon(self, status):
         """Get Font Awesome icon for test status"""
         icons = {
@@ -1141,7 +1354,24 @@ def main():
     print("🚀 example Test Dashboard Generator")
     print("=" * 50)
     
-    generator = TestDashboardGenerator()
+    parser = argparse.ArgumentParser(description="Generate the HTML dashboard from pytest JUnit XML results")
+    parser.add_argument("xml_files", nargs="*", default=["report/old_report.xml"],
+                        help="JUnit XML files or glob patterns (e.g. 'report/report_*.xml'), merged into one dashboard")
+    parser.add_argument("-o", "--output", default="report/dashboard.html", help="dashboard HTML file")
+    parser.add_argument("--store", default=None,
+                        help="SQLite results store (e.g. report/results.db), adds duration trends and flakiness across runs")
+    parser.add_argument("--ingest", action="store_true",
+                        help="add the given XML files to the results store as one run before rendering")
+    parser.add_argument("--window", type=int, default=DEFAULT_WINDOW, help="number of latest runs in the trends")
+    args = parser.parse_args()
+    
+    generator = TestDashboardGenerator(args.xml_files, args.output, args.store, args.window)
+    
+    existing_files = [path for path in generator.xml_file_paths if os.path.exists(path)]
+    if args.store and args.ingest and existing_files:
+        with ResultsStore(args.store) as store:
+            run_id = store.ingest_junit(existing_files)
+        print(f"🗄️  {'Stored as run ' + str(run_id) if run_id else 'Already stored'} in: {args.store}")
     
     success = generator.generate_dashboard()
     
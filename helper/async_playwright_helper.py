@@ -0,0 +1,314 @@
+"""
+Async counterparts of helper/playwright_helper.py
+
+The sync helper works on the session page (pytest.page). With the async engine one process
+drives many pages concurrently, so every helper here takes the page as first argument.
+The same exception taxonomy from helper/playwright_exceptions.py is raised.
+"""
+
+import logging
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError, Error as PlaywrightError
+from helper.playwright_exceptions import (
+    NoSuchElementException,
+    ElementClickInterceptedException,
+    StaleElementReferenceException,
+    TimeoutException,
+    InvalidSelectorException
+)
+from helper.playwright_helper import (
+    _ELEMENT_STATE_SCRIPT,
+    _LOCATOR_STATES,
+    _HANDLE_STATES,
+    _CHECKED_STATES,
+    _raise_for_element_state,
+    _raise_for_state_error
+)
+
+
+async def _check_element_state(page, locator_str: str):
+    """
+    Internal method to check why element is not accessible and raise specific exception,
+    uses the same single evaluate diagnostic as the sync helper
+
+    Args:
+        page: Async Playwright page
+        locator_str: The locator string to check
+
+    Raises:
+        NoSuchElementException: Element not in DOM
+        ElementNotVisibleException: Element in DOM but not visible
+        ElementNotInteractableException: Element visible but not interactable
+        StaleElementReferenceException: Element reference is stale
+        ElementClickInterceptedException: Element is covered by another element
+        InvalidSelectorException: Invalid locator syntax
+    """
+    try:
+        state = await page.locator(locator_str).evaluate_all(_ELEMENT_STATE_SCRIPT)
+    except PlaywrightError as e:
+        _raise_for_state_error(locator_str, e, page.url)
+        return
+
+    _raise_for_element_state(locator_str, state, page.url)
+
+
+def _raise_for_playwright_error(page, locator: str, err):
+    """
+    Map a Playwright error message to the framework exception taxonomy
+    """
+    error_msg = str(err).lower()
+
+    if "intercept" in error_msg or "covered" in error_msg:
+        raise ElementClickInterceptedException(
+            f"ElementClickInterceptedException: Click was intercepted.\n"
+            f"Locator: {locator}\n"
+            f"Current URL: {page.url}\n"
+            f"Error: {str(err)}"
+        ) from err
+    elif "detached" in error_msg or "stale" in error_msg:
+        raise StaleElementReferenceException(
+            f"StaleElementReferenceException: Element reference is stale.\n"
+            f"Locator: {locator}\n"
+            f"Error: {str(err)}"
+        ) from err
+    elif "selector" in error_msg or "parsing" in error_msg:
+        raise InvalidSelectorException(
+            f"InvalidSelectorException: Invalid locator syntax.\n"
+            f"Locator: {locator}\n"
+            f"Error: {str(err)}"
+        ) from err
+    else:
+        raise Exception(
+            f"Unexpected Playwright error.\n"
+            f"Locator: {locator}\n"
+            f"Current URL: {page.url}\n"
+            f"Error: {str(err)}"
+        ) from err
+
+
+async def is_element_clickable(page, locator: str, timeout=10):
+    """
+    Method to wait for element to be clickable and return the locator
+
+    Args:
+        page: Async Playwright page
+        locator: CSS selector or XPATH locator string
+        timeout: Maximum wait time in seconds (default: 10)
+
+    Returns:
+        Locator object if element is clickable
+
+    Raises:
+        Same exceptions as playwright_helper.is_element_clickable
+    """
+    element = page.locator(locator)
+
+    try:
+        await element.first.wait_for(state='visible', timeout=timeout*1000)
+        return element.first
+    except PlaywrightTimeoutError as err:
+        logging.error(f"Timeout waiting for element: {locator}")
+        await _check_element_state(page, locator)
+
+        raise TimeoutException(
+            f"TimeoutException: Timeout waiting for element to be clickable ({timeout}s).\n"
+            f"Locator: {locator}\n"
+            f"Current URL: {page.url}\n"
+            f"Element might be loading or taking too long to appear"
+        ) from err
+    except PlaywrightError as err:
+        _raise_for_playwright_error(page, locator, err)
+
+
+async def is_element_present(page, locator: str, timeout=10):
+    """
+    Method to wait for element to be present in DOM and return the locator
+
+    Args:
+        page: Async Playwright page
+        locator: CSS selector or XPATH locator string
+        timeout: Maximum wait time in seconds (default: 10)
+
+    Returns:
+        Locator object if element is present
+
+    Raises:
+        Same exceptions as playwright_helper.is_element_present
+    """
+    element = page.locator(locator)
+
+    try:
+        await element.first.wait_for(state='attached', timeout=timeout*1000)
+        return element.first
+    except PlaywrightTimeoutError as err:
+        logging.error(f"Timeout waiting for element in DOM: {locator}")
+
+        if await page.locator(locator).count() == 0:
+            raise NoSuchElementException(
+                f"NoSuchElementException: Element not found in DOM.\n"
+                f"Locator: {locator}\n"
+                f"Current URL: {page.url}\n"
+                f"Possible reasons:\n"
+                f"  - Incorrect locator\n"
+                f"  - Element not loaded yet\n"
+                f"  - Wrong page"
+            ) from err
+
+        raise TimeoutException(
+            f"TimeoutException: Timeout waiting for element in DOM ({timeout}s).\n"
+            f"Locator: {locator}\n"
+            f"Current URL: {page.url}"
+        ) from err
+    except PlaywrightError as err:
+        _raise_for_playwright_error(page, locator, err)
+
+
+async def wait_for_element_state(page, locator: str, state='visible', timeout=10):
+    """
+    Wait for the first element matching the locator to reach a state
+
+    Args:
+        page: Async Playwright page
+        locator: CSS selector or XPATH locator string
+        state: attached | detached | visible | hidden | enabled | disabled | editable | stable | checked | unchecked
+        timeout: Maximum wait time in seconds (default: 10)
+
+    Returns:
+        Locator object of the element
+
+    Raises:
+        Same exceptions as playwright_helper.wait_for_element_state
+    """
+    element = page.locator(locator).first
+
+    try:
+        if state in _LOCATOR_STATES:
+            await element.wait_for(state=state, timeout=timeout*1000)
+
+        elif state in _HANDLE_STATES:
+            await element.wait_for(state='attached', timeout=timeout*1000)
+            await (await element.element_handle()).wait_for_element_state(state, timeout=timeout*1000)
+
+        elif state in _CHECKED_STATES:
+            await element.wait_for(state='attached', timeout=timeout*1000)
+            await page.wait_for_function(_CHECKED_STATES[state], arg=await element.element_handle(), timeout=timeout*1000)
+
+        else:
+            raise ValueError(
+                f"Unknown element state '{state}'.\n"
+                f"Available states: {list(_LOCATOR_STATES + _HANDLE_STATES + tuple(_CHECKED_STATES))}"
+            )
+
+        return element
+    except PlaywrightTimeoutError as err:
+        raise TimeoutException(
+            f"TimeoutException: Element did not become {state} within {timeout}s.\n"
+            f"Locator: {locator}\n"
+            f"Current URL: {page.url}"
+        ) from err
+
+
+async def wait_for_attribute_value(page, locator: str, attribute: str, value: str, timeout=10):
+    """
+    Wait until an attribute of the first element matching the locator has the expected value
+
+    Args:
+        page: Async Playwright page
+        locator: CSS selector or XPATH locator string
+        attribute: Attribute name (e.g. 'aria-selected', 'data-testid')
+        value: Expected attribute value
+        timeout: Maximum wait time in seconds (default: 10)
+
+    Returns:
+        Locator object of the element
+
+    Raises:
+        TimeoutException: Attribute did not get the value within timeout
+    """
+    element = await is_element_present(page, locator, timeout)
+
+    try:
+        await page.wait_for_function(
+            "([el, name, value]) => el.getAttribute(name) !== null && el.getAttribute(name).trim() === value",
+            arg=[await element.element_handle(), attribute, value],
+            timeout=timeout*1000
+        )
+        return element
+    except PlaywrightTimeoutError as err:
+        raise TimeoutException(
+            f"TimeoutException: Attribute '{attribute}' did not become '{value}' within {timeout}s.\n"
+            f"Locator: {locator}\n"
+            f"Current value: {await element.get_attribute(attribute)}\n"
+            f"Current URL: {page.url}"
+        ) from err
+
+
+async def wait_for_network_idle(page, timeout=10):
+    """
+    Wait until the page has no network connections for at least 500 ms
+
+    Args:
+        page: Async Playwright page
+        timeout: Maximum wait time in seconds (default: 10)
+
+    Returns:
+        bool: True if the network settled, False if it was still busy after timeout
+    """
+    try:
+        await page.wait_for_load_state('networkidle', timeout=timeout*1000)
+        return True
+    except PlaywrightTimeoutError:
+        logging.warning(f'Network was still busy after {timeout}s, continuing')
+        return False
+
+
+async def wait_for_page_to_load(page, url: str, timeout=10):
+    """
+    Method to wait for page URL to contain specified substring
+
+    Args:
+        page: Async Playwright page
+        url: URL substring to wait for
+        timeout: Maximum wait time in seconds (default: 10)
+    """
+    try:
+        await page.wait_for_url(f"**/*{url}*", timeout=timeout*1000)
+    except PlaywrightTimeoutError as err:
+        raise PlaywrightTimeoutError(
+            f"Expected URL not loaded within {timeout}s.\n"
+            f"Expected to contain: {url}\n"
+            f"Current URL: {page.url}"
+        ) from err
+
+
+async def execute_script(page, script):
+    """
+    Execute JavaScript on the page
+
+    Returns:
+        Result of JavaScript execution
+    """
+    return await page.evaluate(script)
+
+
+async def scroll_to_element(page, locator: str):
+    """
+    Scroll element into view
+    """
+    await page.locator(locator).scroll_into_view_if_needed()
+
+
+async def get_all_elements(page, locator: str):
+    """
+    Get all elements matching the locator
+
+    Returns:
+        List of all matching locators
+    """
+    return await page.locator(locator).all()
+
+
+async def select_element_by_value(page, locator: str, value: str):
+    """
+    Select option from dropdown by value attribute
+    """
+    await page.locator(locator).select_option(value=value)
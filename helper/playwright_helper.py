@@ -1,3 +1,10 @@
+import os
+import sys
+import time
+import asyncio
+import threading
+import uuid
+import fnmatch
 import pytest
 import logging
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError, Error as PlaywrightError
@@ -12,13 +19,45 @@ from helper.playwright_exceptions import (
 )
 
 
-def _check_element_state(locator_str: str, timeout: int = 2):
+# Everything _check_element_state needs, collected in the page with a single evaluate
+_ELEMENT_STATE_SCRIPT = """elements => {
+    const state = {count: elements.length, title: document.title};
+    if (!elements.length) {
+        return state;
+    }
+
+    const el = elements[0];
+    const style = window.getComputedStyle(el);
+    const rect = el.getBoundingClientRect();
+    state.connected = el.isConnected;
+    state.box = {x: rect.x, y: rect.y, width: rect.width, height: rect.height};
+    state.visible = rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden';
+    state.enabled = !el.matches(':disabled') && !el.closest('[aria-disabled="true"]');
+    state.readonly = el.hasAttribute('readonly');
+
+    if (state.visible) {
+        const x = rect.x + rect.width / 2;
+        const y = rect.y + rect.height / 2;
+        state.in_viewport = x >= 0 && y >= 0 && x <= window.innerWidth && y <= window.innerHeight;
+
+        const hit = state.in_viewport ? document.elementFromPoint(x, y) : null;
+        if (hit && hit !== el && !el.contains(hit)) {
+            const id = hit.id ? '#' + hit.id : '';
+            const cls = typeof hit.className === 'string' && hit.className.trim() ? '.' + hit.className.trim().split(/\\s+/).join('.') : '';
+            state.occluded_by = hit.tagName.toLowerCase() + id + cls;
+        }
+    }
+    return state;
+}"""
+
+
+def _check_element_state(locator_str: str):
     """
-    Internal method to check why element is not accessible and raise specific exception
+    Internal method to check why element is not accessible and raise specific exception.
+    DOM presence, visibility, enabled state, geometry and the covering element are read in one round trip
     
     Args:
         locator_str: The locator string to check
-        timeout: Quick timeout for state checking (default: 2s)
         
     Raises:
         NoSuchElementException: Element not in DOM
@@ -26,132 +65,99 @@ def _check_element_state(locator_str: str, timeout: int = 2):
         ElementNotInteractableException: Element visible but not interactable
         StaleElementReferenceException: Element reference is stale
         ElementClickInterceptedException: Element is covered by another element
+        InvalidSelectorException: Invalid locator syntax
     """
     try:
-        element = pytest.page.locator(locator_str)
-        
-        # Check if element exists in DOM at all
-        try:
-            count = element.count()
-            if count == 0:
-                raise NoSuchElementException(
-                    f"NoSuchElementException: Element not found in DOM.\n"
-                    f"Locator: {locator_str}\n"
-                    f"Current URL: {pytest.page.url}\n"
-                    f"Page Title: {pytest.page.title()}\n"
-                )
-        except PlaywrightError as e:
-            if "Selector" in str(e) or "parsing" in str(e).lower():
-                raise InvalidSelectorException(
-                    f"InvalidSelectorException: Invalid locator syntax.\n"
-                    f"Locator: {locator_str}\n"
-                    f"Error: {str(e)}"
-                )
-            raise NoSuchElementException(
-                f"NoSuchElementException: Element not found in DOM.\n"
-                f"Locator: {locator_str}\n"
-                f"Current URL: {pytest.page.url}"
-            )
-        
-        # Check if element reference is still valid (not stale)
-        try:
-            element.first.wait_for(state='attached', timeout=timeout*1000)
-        except PlaywrightTimeoutError:
-            raise StaleElementReferenceException(
-                f"StaleElementReferenceException: Element is no longer attached to DOM.\n"
-                f"Locator: {locator_str}\n"
-                f"Current URL: {pytest.page.url}\n"
-                f"Possible reasons:\n"
-                f"  - Page was refreshed or navigated\n"
-                f"  - Element was removed and re-added (DOM manipulation)\n"
-                f"  - Dynamic content replaced the element"
-            )
-        except Exception as e:
-            if "detached" in str(e).lower() or "stale" in str(e).lower():
-                raise StaleElementReferenceException(
-                    f"StaleElementReferenceException: Element reference is stale.\n"
-                    f"Locator: {locator_str}\n"
-                    f"Error: {str(e)}"
-                )
-        
-        # Element exists, check if it's visible
-        try:
-            is_visible = element.first.is_visible()
-            
-            if not is_visible:
-                raise ElementNotVisibleException(
-                    f"ElementNotVisibleException: Element found in DOM but NOT visible.\n"
-                    f"Locator: {locator_str}\n"
-                    f"Current URL: {pytest.page.url}\n"
-                    f"Element count: {count}\n"
-                    f"Possible reasons:\n"
-                    f"  - Element has display:none or visibility:hidden\n"
-                    f"  - Element is off-screen or has zero dimensions\n"
-                    f"  - Element is behind another element\n"
-                    f"  - Parent element is hidden"
-                )
-        except (ElementNotVisibleException, StaleElementReferenceException):
-            raise
-        except Exception:
-            pass
-        
-        # Element is visible, check if it's enabled/interactable
-        try:
-            is_enabled = element.first.is_enabled()
-            if not is_enabled:
-                raise ElementNotInteractableException(
-                    f"ElementNotInteractableException: Element is visible but NOT interactable.\n"
-                    f"Locator: {locator_str}\n"
-                    f"Current URL: {pytest.page.url}\n"
-                    f"Possible reasons:\n"
-                    f"  - Element is disabled (disabled attribute)\n"
-                    f"  - Element has readonly attribute\n"
-                    f"  - Element is not ready for interaction\n"
-                    f"  - JavaScript hasn't initialized the element yet"
-                )
-        except (ElementNotInteractableException, StaleElementReferenceException):
-            raise
-        except Exception:
-            pass
-        
-        # Check if element is covered by another element (will cause click intercept)
-        try:
-            # Try to check if element is at the point where we'll click
-            bounding_box = element.first.bounding_box()
-            if bounding_box:
-                # Check if element at center point is the one we're looking for
-                center_x = bounding_box['x'] + bounding_box['width'] / 2
-                center_y = bounding_box['y'] + bounding_box['height'] / 2
-                
-                element_at_point = pytest.page.evaluate(
-                    f"document.elementFromPoint({center_x}, {center_y})"
-                )
-                
-                # This is a basic check - if we can't click at center, element might be covered
-                if element_at_point is None:
-                    raise ElementClickInterceptedException(
-                        f"ElementClickInterceptedException: Element is covered by another element.\n"
-                        f"Locator: {locator_str}\n"
-                        f"Current URL: {pytest.page.url}\n"
-                        f"Possible reasons:\n"
-                        f"  - Modal/overlay is covering the element\n"
-                        f"  - Loading spinner is active\n"
-                        f"  - Another element is positioned on top\n"
-                        f"  - Fixed header/footer covering the element\n"
-                        f"Suggestion: Wait for overlay to disappear or scroll element into view"
-                    )
-        except ElementClickInterceptedException:
-            raise
-        except Exception:
-            # Can't determine if covered, skip this check
-            pass
-            
-    except (NoSuchElementException, ElementNotVisibleException, 
-            ElementNotInteractableException, StaleElementReferenceException,
-            ElementClickInterceptedException, InvalidSelectorException):
-        raise
-    except Exception as e:
-        logging.error(f"Unexpected error in _check_element_state: {str(e)}")
+        state = pytest.page.locator(locator_str).evaluate_all(_ELEMENT_STATE_SCRIPT)
+    except PlaywrightError as e:
+        _raise_for_state_error(locator_str, e, pytest.page.url)
+        return
+
+    _raise_for_element_state(locator_str, state, pytest.page.url)
+
+
+def _raise_for_state_error(locator_str: str, err, current_url: str):
+    """
+    Map an error of the diagnostic evaluate to the framework exception taxonomy (shared with the async helper)
+    """
+    error_msg = str(err).lower()
+
+    if "selector" in error_msg or "parsing" in error_msg:
+        raise InvalidSelectorException(
+            f"InvalidSelectorException: Invalid locator syntax.\n"
+            f"Locator: {locator_str}\n"
+            f"Error: {str(err)}"
+        )
+    if "detached" in error_msg or "stale" in error_msg or "context was destroyed" in error_msg:
+        raise StaleElementReferenceException(
+            f"StaleElementReferenceException: Element is no longer attached to DOM.\n"
+            f"Locator: {locator_str}\n"
+            f"Current URL: {current_url}\n"
+            f"Possible reasons:\n"
+            f"  - Page was refreshed or navigated\n"
+            f"  - Element was removed and re-added (DOM manipulation)\n"
+            f"  - Dynamic content replaced the element"
+        )
+    logging.error(f"Unexpected error in _check_element_state: {str(err)}")
+
+
+def _raise_for_element_state(locator_str: str, state: dict, current_url: str):
+    """
+    Raise the specific exception for the state returned by _ELEMENT_STATE_SCRIPT (shared with the async helper)
+    """
+    if state['count'] == 0:
+        raise NoSuchElementException(
+            f"NoSuchElementException: Element not found in DOM.\n"
+            f"Locator: {locator_str}\n"
+            f"Current URL: {current_url}\n"
+            f"Page Title: {state['title']}\n"
+        )
+
+    if not state['connected']:
+        raise StaleElementReferenceException(
+            f"StaleElementReferenceException: Element is no longer attached to DOM.\n"
+            f"Locator: {locator_str}\n"
+            f"Current URL: {current_url}"
+        )
+
+    if not state['visible']:
+        raise ElementNotVisibleException(
+            f"ElementNotVisibleException: Element found in DOM but NOT visible.\n"
+            f"Locator: {locator_str}\n"
+            f"Current URL: {current_url}\n"
+            f"Element count: {state['count']}\n"
+            f"Bounding box: {state['box']}\n"
+            f"Possible reasons:\n"
+            f"  - Element has display:none or visibility:hidden\n"
+            f"  - Element is off-screen or has zero dimensions\n"
+            f"  - Parent element is hidden"
+        )
+
+    if not state['enabled']:
+        raise ElementNotInteractableException(
+            f"ElementNotInteractableException: Element is visible but NOT interactable.\n"
+            f"Locator: {locator_str}\n"
+            f"Current URL: {current_url}\n"
+            f"Readonly: {state['readonly']}\n"
+            f"Possible reasons:\n"
+            f"  - Element is disabled (disabled or aria-disabled attribute)\n"
+            f"  - Element is not ready for interaction\n"
+            f"  - JavaScript hasn't initialized the element yet"
+        )
+
+    if state.get('occluded_by'):
+        raise ElementClickInterceptedException(
+            f"ElementClickInterceptedException: Element is covered by another element.\n"
+            f"Locator: {locator_str}\n"
+            f"Current URL: {current_url}\n"
+            f"Covered by: {state['occluded_by']}\n"
+            f"Bounding box: {state['box']}\n"
+            f"Possible reasons:\n"
+            f"  - Modal/overlay is covering the element\n"
+            f"  - Loading spinner is active\n"
+            f"  - Fixed header/footer covering the element\n"
+            f"Suggestion: Wait for overlay to disappear or scroll element into view"
+        )
 
 
 def is_element_clickable(locator: str, timeout=10):
@@ -182,7 +188,7 @@ def is_element_clickable(locator: str, timeout=10):
     except PlaywrightTimeoutError as err:
         # Timeout occurred - figure out WHY
         logging.error(f"Timeout waiting for element: {locator}")
-        _check_element_state(locator, timeout=2)
+        _check_element_state(locator)
         
         # If _check_element_state didn't raise specific exception, raise generic timeout
         raise TimeoutException(
@@ -435,6 +441,111 @@ def get_all_elements(locator: str):
     return pytest.page.locator(locator).all()
 
 
+def get_all_attributes(locator: str, attribute: str):
+    """
+    Read one attribute of all elements matching the locator in a single browser round trip
+    
+    Args:
+        locator: CSS selector or XPATH locator string
+        attribute: Attribute name (e.g. 'data-testid')
+    
+    Returns:
+        list: Attribute values in DOM order (None where the attribute is missing), empty if nothing matches
+    """
+    return pytest.page.locator(locator).evaluate_all(
+        "(elements, name) => elements.map(el => el.getAttribute(name))", attribute
+    )
+
+
+def get_all_text(locator: str, strip=True):
+    """
+    Read the text content of all elements matching the locator in a single browser round trip
+    
+    Args:
+        locator: CSS selector or XPATH locator string
+        strip: Strip surrounding whitespace (default: True)
+    
+    Returns:
+        list: Text of every element in DOM order, empty if nothing matches
+    """
+    texts = pytest.page.locator(locator).evaluate_all("elements => elements.map(el => el.textContent || '')")
+    return [text.strip() for text in texts] if strip else texts
+
+
+def get_table_cells(row_locator: str, cell_selector='th, td'):
+    """
+    Read the text of all cells of all rows matching the locator in a single browser round trip
+    
+    Args:
+        row_locator: CSS selector or XPATH locator string of the table rows
+        cell_selector: CSS selector of the cells inside a row (default: 'th, td')
+    
+    Returns:
+        list: One list of stripped cell texts per row, empty if nothing matches
+    """
+    return pytest.page.locator(row_locator).evaluate_all(
+        "(rows, cellSelector) => rows.map(row => Array.from(row.querySelectorAll(cellSelector), cell => (cell.textContent || '').trim()))",
+        cell_selector
+    )
+
+
+def iter_table_cells(row_locator: str, chunk_size=2000, cell_selector='th, td'):
+    """
+    Read the cells of a large table in chunks of rows, one browser round trip per chunk, so a table
+    with tens of thousands of rows is never held in memory (or sent over the connection) at once
+
+    Args:
+        row_locator: CSS selector or XPATH locator string of the table rows
+        chunk_size: Rows per round trip (default: 2000)
+        cell_selector: CSS selector of the cells inside a row (default: 'th, td')
+
+    Yields:
+        list: Up to chunk_size rows, each a list of stripped cell texts, in DOM order
+    """
+    start = 0
+
+    while True:
+        rows = pytest.page.locator(row_locator).evaluate_all(
+            """(rows, [cellSelector, start, end]) => rows.slice(start, end).map(
+                row => Array.from(row.querySelectorAll(cellSelector), cell => (cell.textContent || '').trim())
+            )""",
+            [cell_selector, start, start + chunk_size]
+        )
+
+        if rows:
+            yield rows
+
+        if len(rows) < chunk_size:
+            return
+
+        start += chunk_size
+
+
+def get_child_attributes(locator: str, child_selectors: dict, attribute: str):
+    """
+    Read one attribute of several children of the first element matching the locator in a single round trip
+    
+    Args:
+        locator: CSS selector or XPATH locator string of the parent (e.g. a grid row)
+        child_selectors: {name: CSS selector relative to the parent}
+        attribute: Attribute name (e.g. 'data-testid')
+    
+    Returns:
+        dict: {name: attribute value}, None for a missing child or attribute.
+              Empty dict if the parent is not in the DOM
+    """
+    values = pytest.page.locator(locator).evaluate_all(
+        """(elements, [selectors, name]) => elements.slice(0, 1).map(parent => Object.fromEntries(
+            Object.entries(selectors).map(([key, selector]) => {
+                const child = parent.querySelector(selector);
+                return [key, child ? child.getAttribute(name) : null];
+            })
+        ))""",
+        [child_selectors, attribute]
+    )
+    return values[0] if values else {}
+
+
 def select_element_by_text(locator: str, text: str):
     """
     Select option from dropdown by visible text
@@ -488,3 +599,355 @@ def get_dropdown_selection(locator: str):
         Text of the selected option
     """
     return pytest.page.locator(locator).input_value()
+
+
+
+# Element states handled by Locator.wait_for, the others need the element handle
+_LOCATOR_STATES = ('attached', 'detached', 'visible', 'hidden')
+_HANDLE_STATES = ('enabled', 'disabled', 'editable', 'stable')
+_CHECKED_STATES = {'checked': 'el => el.checked === true', 'unchecked': 'el => el.checked === false'}
+
+
+def wait_for_network_idle(timeout=10):
+    """
+    Wait until the page has no network connections for at least 500 ms
+    
+    Args:
+        timeout: Maximum wait time in seconds (default: 10)
+    
+    Returns:
+        bool: True if the network settled, False if it was still busy after timeout
+              (applications with long polling never settle, so this is not an error)
+    """
+    try:
+        pytest.page.wait_for_load_state('networkidle', timeout=timeout*1000)
+        return True
+    except PlaywrightTimeoutError:
+        logging.warning(f'Network was still busy after {timeout}s, continuing')
+        return False
+
+
+def wait_for_api_response(url_pattern, trigger=None, timeout=30, status=None):
+    """
+    Wait for a specific API response, optionally caused by a trigger action
+    
+    Args:
+        url_pattern: Glob string, regex pattern or predicate(url) matching the response URL
+        trigger: Optional callable performing the action which fires the request (e.g. a click)
+        timeout: Maximum wait time in seconds (default: 30)
+        status: Optional expected HTTP status code
+    
+    Returns:
+        Response object
+    
+    Raises:
+        TimeoutException: No matching response within timeout
+    """
+    def matches(response):
+        if status is not None and response.status != status:
+            return False
+        if callable(url_pattern):
+            return url_pattern(response.url)
+        if isinstance(url_pattern, str) and not any(char in url_pattern for char in '*?['):
+            return url_pattern in response.url
+        return _url_matches(url_pattern, response.url)
+
+    try:
+        if trigger is None:
+            return pytest.page.wait_for_event('response', predicate=matches, timeout=timeout*1000)
+
+        with pytest.page.expect_response(matches, timeout=timeout*1000) as response_info:
+            trigger()
+        return response_info.value
+    except PlaywrightTimeoutError as err:
+        raise TimeoutException(
+            f"TimeoutException: No API response matched within {timeout}s.\n"
+            f"URL pattern: {url_pattern}\n"
+            f"Expected status: {status if status is not None else 'any'}\n"
+            f"Current URL: {pytest.page.url}"
+        ) from err
+
+
+def _url_matches(url_pattern, url):
+    """
+    Match a URL against a glob string or compiled regex
+    """
+    if hasattr(url_pattern, 'search'):
+        return url_pattern.search(url) is not None
+
+    return fnmatch.fnmatch(url, url_pattern)
+
+
+def wait_for_dom_mutation(locator: str, trigger=None, timeout=10):
+    """
+    Wait until the DOM subtree of an element changes (children, attributes or text)
+    
+    Args:
+        locator: CSS selector or XPATH locator string of the element to observe
+        trigger: Optional callable performing the action which changes the DOM
+        timeout: Maximum wait time in seconds (default: 10)
+    
+    Raises:
+        TimeoutException: No mutation observed within timeout
+    """
+    observer_id = uuid.uuid4().hex
+
+    is_element_present(locator, timeout).evaluate(
+        """(el, id) => {
+            window.__pwMutations = window.__pwMutations || {};
+            window.__pwMutations[id] = false;
+            const observer = new MutationObserver(() => {
+                window.__pwMutations[id] = true;
+                observer.disconnect();
+            });
+            observer.observe(el, {childList: true, subtree: true, attributes: true, characterData: true});
+        }""",
+        observer_id
+    )
+
+    if trigger is not None:
+        trigger()
+
+    try:
+        pytest.page.wait_for_function(
+            "id => window.__pwMutations && window.__pwMutations[id] === true",
+            arg=observer_id,
+            timeout=timeout*1000
+        )
+    except PlaywrightTimeoutError as err:
+        raise TimeoutException(
+            f"TimeoutException: No DOM change observed within {timeout}s.\n"
+            f"Locator: {locator}\n"
+            f"Current URL: {pytest.page.url}"
+        ) from err
+
+
+def wait_for_element_state(locator: str, state='visible', timeout=10):
+    """
+    Wait for the first element matching the locator to reach a state
+    
+    Args:
+        locator: CSS selector or XPATH locator string
+        state: attached | detached | visible | hidden | enabled | disabled | editable | stable | checked | unchecked
+        timeout: Maximum wait time in seconds (default: 10)
+    
+    Returns:
+        Locator object of the element
+    
+    Raises:
+        ValueError: Unknown state
+        TimeoutException: State not reached within timeout
+    """
+    element = pytest.page.locator(locator).first
+
+    try:
+        if state in _LOCATOR_STATES:
+            element.wait_for(state=state, timeout=timeout*1000)
+
+        elif state in _HANDLE_STATES:
+            element.wait_for(state='attached', timeout=timeout*1000)
+            element.element_handle().wait_for_element_state(state, timeout=timeout*1000)
+
+        elif state in _CHECKED_STATES:
+            element.wait_for(state='attached', timeout=timeout*1000)
+            pytest.page.wait_for_function(_CHECKED_STATES[state], arg=element.element_handle(), timeout=timeout*1000)
+
+        else:
+            raise ValueError(
+                f"Unknown element state '{state}'.\n"
+                f"Available states: {list(_LOCATOR_STATES + _HANDLE_STATES + tuple(_CHECKED_STATES))}"
+            )
+
+        return element
+    except PlaywrightTimeoutError as err:
+        raise TimeoutException(
+            f"TimeoutException: Element did not become {state} within {timeout}s.\n"
+            f"Locator: {locator}\n"
+            f"Current URL: {pytest.page.url}"
+        ) from err
+
+
+def wait_for_attribute_value(locator: str, attribute: str, value: str, timeout=10):
+    """
+    Wait until an attribute of the first element matching the locator has the expected value
+    
+    Args:
+        locator: CSS selector or XPATH locator string
+        attribute: Attribute name (e.g. 'aria-selected', 'data-testid')
+        value: Expected attribute value
+        timeout: Maximum wait time in seconds (default: 10)
+    
+    Returns:
+        Locator object of the element
+    
+    Raises:
+        TimeoutException: Attribute did not get the value within timeout
+    """
+    element = is_element_present(locator, timeout)
+
+    try:
+        pytest.page.wait_for_function(
+            "([el, name, value]) => el.getAttribute(name) !== null && el.getAttribute(name).trim() === value",
+            arg=[element.element_handle(), attribute, value],
+            timeout=timeout*1000
+        )
+        return element
+    except PlaywrightTimeoutError as err:
+        raise TimeoutException(
+            f"TimeoutException: Attribute '{attribute}' did not become '{value}' within {timeout}s.\n"
+            f"Locator: {locator}\n"
+            f"Current value: {element.get_attribute(attribute)}\n"
+            f"Current URL: {pytest.page.url}"
+        ) from err
+
+
+def wait_for_toast(locator="//div[@role='alert']", text=None, timeout=30):
+    """
+    Wait for a toast / alert message to appear and return its text
+    
+    Args:
+        locator: CSS selector or XPATH locator string of the toast (default: role='alert')
+        text: Optional text the toast must contain
+        timeout: Maximum wait time in seconds (default: 30)
+    
+    Returns:
+        str: Text content of the toast
+    
+    Raises:
+        TimeoutException: No (matching) toast within timeout
+    """
+    toast = pytest.page.locator(locator)
+
+    if text:
+        toast = toast.filter(has_text=text.strip())
+
+    try:
+        toast.first.wait_for(state='visible', timeout=timeout*1000)
+        return toast.first.text_content()
+    except PlaywrightTimeoutError as err:
+        raise TimeoutException(
+            f"TimeoutException: Toast message did not appear within {timeout}s.\n"
+            f"Locator: {locator}\n"
+            f"Expected text: {text}\n"
+            f"Current URL: {pytest.page.url}"
+        ) from err
+
+
+# Sleep audit: when enabled, every fixed sleep of the framework is recorded with its call site,
+# so remaining dead time can be found and replaced by one of the waits above.
+# time.sleep and asyncio.sleep are replaced process-wide, so only the sleeps of the test thread and of the
+# page objects / helpers are counted, not the ones of other threads (e.g. the mock app request handlers)
+_original_sleep = time.sleep
+_original_async_sleep = asyncio.sleep
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_AUDITED_DIRS = tuple(os.path.join(_PROJECT_ROOT, folder) + os.sep for folder in ('pages', 'helper'))
+_sleep_lock = threading.Lock()
+_sleep_audit = None
+_sleep_audit_enabled = False
+_sleep_audit_thread = None
+_slept_seconds = 0.0
+
+
+def fixed_sleep(seconds, reason=''):
+    """
+    Explicit fixed sleep, for the rare cases where no signal can be waited on (e.g. a poll interval)
+    
+    Args:
+        seconds: Time to sleep in seconds
+        reason: Why no event-driven wait is possible, shown in the sleep audit
+    """
+    _record_sleep(sys._getframe(1), seconds, reason)
+    _original_sleep(seconds)
+
+
+def enable_sleep_audit():
+    """
+    Start recording fixed sleeps, including raw time.sleep and asyncio.sleep calls made from the project code.
+    The calling thread is the test thread whose sleeps are recorded wherever they are made
+    """
+    global _sleep_audit, _sleep_audit_enabled, _sleep_audit_thread
+    with _sleep_lock:
+        _sleep_audit = {}
+        _sleep_audit_thread = threading.current_thread()
+        _sleep_audit_enabled = True
+    time.sleep = _audited_sleep
+    asyncio.sleep = _audited_async_sleep
+
+
+def disable_sleep_audit():
+    """
+    Stop recording fixed sleeps and restore time.sleep and asyncio.sleep, recorded sleeps stay available
+    """
+    global _sleep_audit_enabled
+    _sleep_audit_enabled = False
+    time.sleep = _original_sleep
+    asyncio.sleep = _original_async_sleep
+
+
+def get_slept_seconds():
+    """
+    Total fixed sleep time of the project code so far, raw time.sleep calls only count while the audit is enabled
+
+    Returns:
+        float: Seconds
+    """
+    return _slept_seconds
+
+
+def get_sleep_audit():
+    """
+    Recorded fixed sleeps, most expensive call site first
+    
+    Returns:
+        list: dicts with call_site, reason, count and total seconds
+    """
+    if _sleep_audit is None:
+        return []
+    with _sleep_lock:
+        records = [dict(record) for record in _sleep_audit.values()]
+    return sorted(records, key=lambda record: record['seconds'], reverse=True)
+
+
+def _audited_sleep(seconds):
+    """
+    time.sleep replacement installed by enable_sleep_audit
+    """
+    _record_sleep(sys._getframe(1), seconds, '')
+    _original_sleep(seconds)
+
+
+async def _audited_async_sleep(delay, result=None):
+    """
+    asyncio.sleep replacement installed by enable_sleep_audit, the caller is the awaiting coroutine
+    """
+    _record_sleep(sys._getframe(1), delay, '')
+    return await _original_async_sleep(delay, result)
+
+
+def _record_sleep(frame, seconds, reason):
+    """
+    Add one sleep to the total and, when enabled, to the audit, only for the test thread and the page objects / helpers
+    """
+    global _slept_seconds
+    file_name = os.path.abspath(frame.f_code.co_filename)
+    if 'site-packages' in file_name or not file_name.startswith(os.getcwd()):
+        return
+
+    test_thread = _sleep_audit_thread or threading.main_thread()
+    if threading.current_thread() is not test_thread and not _is_audited_dir(file_name):
+        return
+
+    with _sleep_lock:
+        _slept_seconds += seconds
+        if not _sleep_audit_enabled:
+            return
+
+        call_site = f'{os.path.relpath(file_name)}:{frame.f_lineno} ({frame.f_code.co_name})'
+        record = _sleep_audit.setdefault(call_site, {'call_site': call_site, 'reason': reason, 'count': 0, 'seconds': 0.0})
+        record['count'] += 1
+        record['seconds'] += seconds
+
+
+def _is_audited_dir(file_name):
+    """True for the files under pages/ and helper/ of the project"""
+    return file_name.startswith(_AUDITED_DIRS)
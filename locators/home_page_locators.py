@@ -17,6 +17,7 @@ class HomePageLocators:
     LEFT_SIDE_EXCEL_OUTPUT_FILE_XPATH = "//div[@class='excel_viewer']//table//tbody//tr[@row]"
     ERROR_OUTPUT_CSS = "[class='ErrorBoundaryBody']"
     SIDE_BAR_BTN_CSS = "[class='topbar-fabars']>button>svg"
+    SIDE_BAR_CONTAINER_CSS = "[class='topbar-fabars']"
     OUTPUT_EXCEL_DOWNLOAD_XPATH = "//img[@alt='XlsxFile']"
     OUTPUT_PDF_DOWNLOAD_XPATH = "//img[@alt='PdfFile']"
     OUTPUT_CSV_DOWNLOAD_XPATH = "//img[@alt='CsvFile']"
@@ -0,0 +1,16 @@
+"""
+Local stand-in for the document-processing web app
+
+Serves the same DOM contracts the locators in locators/ expect (login, section tiles, Upload File / History
+tabs, the row-data history grid with status transitions, support portal table, output screen, zip downloads)
+with configurable processing delays, so the suite can run offline, deterministically and fast.
+
+Run standalone:
+    python -m mock_app --port 8765 --processing_seconds 3
+
+or from the suite with `pytest test_demo --env local`.
+"""
+
+from mock_app.server import DEFAULT_MOCK_CONFIG, MockAppServer
+
+__all__ = ['DEFAULT_MOCK_CONFIG', 'MockAppServer']
@@ -0,0 +1,28 @@
+import argparse
+import logging
+from mock_app.server import DEFAULT_MOCK_CONFIG, MockAppServer
+
+
+def main():
+    """Start the mock app in the foreground, Ctrl+C to stop"""
+    parser = argparse.ArgumentParser(description='Local stand-in for the document-processing web app')
+    for key, value in DEFAULT_MOCK_CONFIG.items():
+        if isinstance(value, bool):
+            parser.add_argument(f'--{key}', type=lambda text: text.lower() in ('1', 'true', 'yes'), default=value)
+        else:
+            parser.add_argument(f'--{key}', type=type(value), default=value)
+
+    logging.basicConfig(level=logging.INFO)
+    server = MockAppServer(vars(parser.parse_args()))
+    print(f'Mock app running on {server.start()}', flush=True)
+
+    try:
+        server.wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
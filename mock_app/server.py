@@ -0,0 +1,444 @@
+import io
+import os
+import json
+import time
+import uuid
+import random
+import fnmatch
+import logging
+import zipfile
+import threading
+from datetime import datetime, timedelta
+from urllib.parse import urlparse, parse_qs, unquote
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from openpyxl import Workbook
+
+
+'''
+Mock server: a stdlib HTTP server holding the uploaded files in memory. The status of a file is derived
+from the time since its upload, so transitions are deterministic for a given configuration:
+
+    in-queue (queue_seconds) -> processing (processing_seconds + per page) -> partially-done -> completed
+
+A file waits in partially-done until it is submitted from the output screen (review_required),
+files matching fail_pattern end up failed.
+'''
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+SESSION_COOKIE = 'mock_session'
+DATE_TIME_FORMAT = '%m-%d-%Y %H:%M:%S'
+OUTPUT_HEADERS = ['Date', 'Description', 'Check Number', 'Debit', 'Credit', 'Balance']
+# Sheet and header row of a real output workbook, a superset of the grid columns with the statement level and internal ones
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'output_format.json')) as output_format_file:
+    OUTPUT_FORMAT = json.load(output_format_file)
+WORKBOOK_HEADERS = OUTPUT_FORMAT['headers']
+
+DEFAULT_MOCK_CONFIG = {
+    'host': '127.0.0.1',
+    'port': 0,
+    'queue_seconds': 0.0,
+    'processing_seconds': 3.0,
+    'processing_seconds_per_page': 0.0,
+    'latency_ms': 0,
+    'history_poll_seconds': 2.0,
+    'history_page_size': 30,
+    'seed_files': 35,
+    'review_required': True,
+    'fail_pattern': '*fail*'
+}
+
+
+class MockAppServer:
+
+    def __init__(self, config=None):
+        """
+        Args:
+            config: Overrides of DEFAULT_MOCK_CONFIG (e.g. 'mock_app' from config.json)
+        """
+        self.config = dict(DEFAULT_MOCK_CONFIG)
+        self.config.update(config or {})
+        self.files = list()
+        self.sessions = dict()
+        self.lock = threading.Lock()
+        self.url = None
+        self._httpd = None
+        self._thread = None
+        self._seed_history()
+
+    def start(self):
+        """
+        Start serving in a background thread
+
+        Returns:
+            str: Base URL of the app, e.g. 'http://127.0.0.1:8765/'
+        """
+        handler = type('BoundMockAppHandler', (MockAppHandler,), {'app': self})
+        self._httpd = ThreadingHTTPServer((self.config['host'], int(self.config['port'])), handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='mock-app', daemon=True)
+        self._thread.start()
+
+        host, port = self._httpd.server_address[:2]
+        self.url = f'http://{host}:{port}/'
+        logging.info(f'Mock app started on {self.url}')
+        return self.url
+
+    def wait(self):
+        """Block until the server thread ends"""
+        while self._thread is not None and self._thread.is_alive():
+            self._thread.join(0.5)
+
+    def stop(self):
+        """Stop serving"""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+            logging.info('Mock app stopped')
+
+    def add_file(self, file_name: str, no_of_page: int, service='bank_statement', statement_type='bank_statement', uploaded_at=None):
+        """
+        Register an uploaded file, its status starts moving from now on
+
+        Returns:
+            dict: Internal file record
+        """
+        record = {
+            'id': uuid.uuid4().hex[:12],
+            'file_name': file_name,
+            'no_of_page': max(1, int(no_of_page)),
+            'service': service,
+            'statement_type': statement_type,
+            'uploaded_at': uploaded_at or datetime.now().replace(microsecond=0),
+            'submitted': False
+        }
+
+        with self.lock:
+            self.files.insert(0, record)
+
+        return record
+
+    def get_file(self, file_id: str):
+        """Internal file record by id, None when unknown"""
+        with self.lock:
+            return next((record for record in self.files if record['id'] == file_id), None)
+
+    def find_file(self, file_name: str):
+        """Latest internal record uploaded under a file name, None when unknown"""
+        with self.lock:
+            return next((record for record in self.files if record['file_name'].lower() == file_name.strip().lower()), None)
+
+    def pending_seconds(self, record, now=None):
+        """
+        Time left until the file leaves in-queue / processing, the part of a status wait owed to the app
+
+        Returns:
+            float: Seconds, 0 when the extraction is already done
+        """
+        elapsed = ((now or datetime.now()) - record['uploaded_at']).total_seconds()
+        processing = self.config['processing_seconds'] + self.config['processing_seconds_per_page'] * record['no_of_page']
+        return max(0.0, self.config['queue_seconds'] + processing - elapsed)
+
+    def file_status(self, record, now=None):
+        """
+        Status of a file at a point in time, as shown in the module history grid
+
+        Returns:
+            str: in-queue | processing | partially-done | completed | failed
+        """
+        elapsed = ((now or datetime.now()) - record['uploaded_at']).total_seconds()
+        queue = self.config['queue_seconds']
+        processing = self.config['processing_seconds'] + self.config['processing_seconds_per_page'] * record['no_of_page']
+
+        if elapsed < queue:
+            return 'in-queue'
+        if elapsed < queue + processing:
+            return 'processing'
+        if fnmatch.fnmatch(record['file_name'].lower(), self.config['fail_pattern']):
+            return 'failed'
+        if self.config['review_required'] and not record['submitted']:
+            return 'partially-done'
+        return 'completed'
+
+    def to_json(self, record):
+        """
+        File record as returned by the API, field names follow 'file_status_api' of config.json
+        """
+        status = self.file_status(record)
+        done = status == 'completed'
+        extracted = status in ('partially-done', 'completed')
+
+        return {
+            'id': record['id'],
+            'file_name': record['file_name'],
+            'status': status,
+            'portal_status': 'completed' if extracted else status,
+            'date_time': record['uploaded_at'].strftime(DATE_TIME_FORMAT),
+            'no_of_page': record['no_of_page'],
+            'service': record['service'],
+            'statement_type': record['statement_type'],
+            'download': 'download-enabled' if done else 'download-disabled',
+            'preview': 'preview-enabled' if done else 'preview-disabled'
+        }
+
+    def output_rows(self, record):
+        """
+        Deterministic extraction output of a file (same rows for the UI table and the downloaded workbook)
+        """
+        rng = random.Random(record['id'])
+        balance = round(rng.uniform(1000, 5000), 2)
+        rows = list()
+
+        for index in range(5 * record['no_of_page']):
+            debit = round(rng.uniform(5, 300), 2) if rng.random() < 0.6 else ''
+            credit = '' if debit else round(rng.uniform(50, 900), 2)
+            balance = round(balance - (debit or 0) + (credit or 0), 2)
+            day = (record['uploaded_at'] - timedelta(days=30 - index % 30)).strftime('%m/%d/%Y')
+            rows.append([day, f'Transaction {index + 1}', '', debit, credit, balance])
+
+        return rows
+
+    def output_workbook_rows(self, record):
+        """
+        Rows of the output workbook, in the real column layout (WORKBOOK_HEADERS): dates as dates,
+        empty debit / credit as 0, and the statement level and internal columns the grid does not show
+        """
+        grid_rows = self.output_rows(record)
+        rng = random.Random(f"{record['id']}|workbook")
+        beginning_balance = round(grid_rows[0][5] + (grid_rows[0][3] or 0) - (grid_rows[0][4] or 0), 2) if grid_rows else 0
+        ending_balance = grid_rows[-1][5] if grid_rows else 0
+        dates = [datetime.strptime(row[0], '%m/%d/%Y') for row in grid_rows]
+        rows = list()
+
+        for index, (day, description, check_number, debit, credit, balance) in enumerate(grid_rows):
+            values = {
+                'PAGE_NUMBER': index // 5 + 1, 'TRANSACTION_DATE': dates[index], 'DESCRIPTION': description,
+                'CHECK_NUMBER': check_number or None, 'CREDIT': credit or 0, 'DEBIT': debit or 0, 'BALANCE': balance,
+                'BEGINNING_DATE': min(dates), 'ENDING_DATE': max(dates),
+                'BEGINNING_BALANCE': f'{beginning_balance:.2f}', 'ENDING_BALANCE': f'{ending_balance:.2f}',
+                'BANK_NAME': 'MOCK BANK', 'ACCOUNT_NUMBER': '1000191677185', 'ACCOUNT_TYPE': 'checking',
+                'STATEMENT_TYPE': record['statement_type'], 'CUSTOMER_1': 'MOCK CUSTOMER LLC',
+                'ACCOUNT_ADDRESS': '1 MOCK STREET', 'TRANSACTION_COORDINATES': str([round(rng.random(), 4) for _ in range(4)]),
+                'TRANSACTION_COLOUR': '[255, 103, 31]', 'OVERALL_BALANCE_RECONCILLIATION': True,
+                'CALCULATED_BALANCE': ending_balance, 'EXTRACTED_BALANCE': ending_balance,
+                'RECONCILLIATION_STATUS': 'done', 'TABLE_TYPE': 'Transactions', 'CONFIDENCE': round(rng.uniform(0.8, 1), 4),
+                'TRANSACTION_ID': str(uuid.UUID(int=rng.getrandbits(128))), 'TRANSACTION_TIME': '..:..:.. ..'
+            }
+            # Columns of the real layout the mock has no value for stay empty
+            rows.append([values.get(header) for header in WORKBOOK_HEADERS])
+
+        return rows
+
+    def output_zip(self, record):
+        """
+        Zip archive with the extraction output workbook, as downloaded from the module history
+
+        Returns:
+            tuple: (file name, zip bytes)
+        """
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = OUTPUT_FORMAT['sheet']
+        sheet.append(WORKBOOK_HEADERS)
+        for row in self.output_workbook_rows(record):
+            sheet.append(row)
+
+        stem = os.path.splitext(record['file_name'])[0]
+        workbook_bytes = io.BytesIO()
+        workbook.save(workbook_bytes)
+
+        zip_bytes = io.BytesIO()
+        with zipfile.ZipFile(zip_bytes, 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr(f'{stem}.xlsx', workbook_bytes.getvalue())
+            archive.writestr(f'{stem}.json', json.dumps({'headers': OUTPUT_HEADERS, 'rows': self.output_rows(record)}))
+
+        return f'{stem}_output.zip', zip_bytes.getvalue()
+
+    def _seed_history(self):
+        """
+        Already processed files, so history, search, preview and support portal tests have data
+        """
+        now = datetime.now().replace(microsecond=0)
+
+        for index in range(self.config['seed_files'], 0, -1):
+            record = self.add_file(f'statement_{index:03d}.pdf', index % 3 + 1, uploaded_at=now - timedelta(hours=index))
+            record['submitted'] = True
+
+
+class MockAppHandler(BaseHTTPRequestHandler):
+
+    app = None
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        logging.debug(f'Mock app: {format % args}')
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+
+        if not path.startswith('/api/'):
+            return self._serve_static(path)
+
+        self._simulate_latency()
+
+        if path == '/api/session':
+            email = self._session_email()
+            return self._send_json({'logged_in': email is not None, 'email': email})
+
+        if path == '/api/config':
+            return self._send_json({'history_poll_seconds': self.app.config['history_poll_seconds']})
+
+        if self._session_email() is None:
+            return self._send_json({'message': 'Unauthorized'}, 401)
+
+        if path == '/api/history':
+            return self._send_history()
+
+        if path == '/api/support/files':
+            return self._send_support_files()
+
+        parts = path.strip('/').split('/')
+        if len(parts) == 4 and parts[:2] == ['api', 'files']:
+            record = self.app.get_file(parts[2])
+            if record is None:
+                return self._send_json({'message': 'File not found'}, 404)
+            if parts[3] == 'output':
+                return self._send_json({
+                    'file': self.app.to_json(record), 'headers': OUTPUT_HEADERS, 'rows': self.app.output_rows(record)
+                })
+            if parts[3] == 'download':
+                return self._send_download(record)
+
+        self._send_json({'message': 'Not found'}, 404)
+
+    def do_POST(self):
+        path = urlparse(self.path).path
+        body = self._read_body()
+        self._simulate_latency()
+
+        if path == '/api/login':
+            return self._login(body)
+
+        if path == '/api/logout':
+            return self._logout()
+
+        if self._session_email() is None:
+            return self._send_json({'message': 'Unauthorized'}, 401)
+
+        if path == '/api/upload':
+            return self._upload(body)
+
+        parts = path.strip('/').split('/')
+        if len(parts) == 4 and parts[:2] == ['api', 'files'] and parts[3] == 'submit':
+            record = self.app.get_file(parts[2])
+            if record is None:
+                return self._send_json({'message': 'File not found'}, 404)
+            record['submitted'] = True
+            return self._send_json({'message': 'Data updated successfully', 'file': self.app.to_json(record)})
+
+        self._send_json({'message': 'Not found'}, 404)
+
+    def _login(self, body):
+        try:
+            credentials = json.loads(body or b'{}')
+        except ValueError:
+            credentials = {}
+
+        email = str(credentials.get('email', '')).strip()
+        if not email or not credentials.get('password'):
+            return self._send_json({'message': 'Email and password are required'}, 401)
+
+        token = uuid.uuid4().hex
+        self.app.sessions[token] = email
+        self._send_json({'email': email}, headers={'Set-Cookie': f'{SESSION_COOKIE}={token}; Path=/; HttpOnly; SameSite=Lax'})
+
+    def _logout(self):
+        token = self._cookies().get(SESSION_COOKIE)
+        self.app.sessions.pop(token, None)
+        self._send_json({'message': 'Logged out'}, headers={'Set-Cookie': f'{SESSION_COOKIE}=; Path=/; Max-Age=0'})
+
+    def _upload(self, body):
+        query = parse_qs(urlparse(self.path).query)
+        file_name = unquote(self.headers.get('X-File-Name', '')).strip()
+
+        if not file_name or not body:
+            return self._send_json({'message': 'No file received'}, 400)
+
+        record = self.app.add_file(
+            file_name,
+            int(query.get('pages', ['1'])[0]),
+            query.get('service', ['bank_statement'])[0],
+            query.get('statement_type', ['bank_statement'])[0]
+        )
+        self._send_json({'message': 'File uploaded successfully.', 'file': self.app.to_json(record)})
+
+    def _send_history(self):
+        query = parse_qs(urlparse(self.path).query)
+        service = query.get('service', ['bank_statement'])[0]
+        limit = int(query.get('limit', [self.app.config['history_page_size']])[0])
+
+        with self.app.lock:
+            records = [record for record in self.app.files if record['service'] == service][:limit]
+
+        self._send_json({'files': [self.app.to_json(record) for record in records]})
+
+    def _send_support_files(self):
+        query = parse_qs(urlparse(self.path).query)
+        page_size = int(query.get('page_size', ['10'])[0])
+        search = query.get('search', [''])[0].strip().lower()
+
+        with self.app.lock:
+            records = [record for record in self.app.files if search in record['file_name'].lower()][:page_size]
+
+        self._send_json({'files': [self.app.to_json(record) for record in records]})
+
+    def _send_download(self, record):
+        if self.app.file_status(record) != 'completed':
+            return self._send_json({'message': 'Output not available yet'}, 409)
+
+        file_name, content = self.app.output_zip(record)
+        self._send_bytes(content, 'application/zip', {'Content-Disposition': f'attachment; filename="{file_name}"'})
+
+    def _serve_static(self, path):
+        # Client side routing: every page path gets the single page app
+        file_name = path.lstrip('/') if path.startswith('/static/') else 'static/index.html'
+        file_path = os.path.normpath(os.path.join(os.path.dirname(STATIC_DIR), file_name))
+
+        if not file_path.startswith(STATIC_DIR) or not os.path.isfile(file_path):
+            return self._send_json({'message': 'Not found'}, 404)
+
+        content_type = {'.js': 'application/javascript', '.css': 'text/css'}.get(os.path.splitext(file_path)[1], 'text/html')
+        with open(file_path, 'rb') as f:
+            self._send_bytes(f.read(), f'{content_type}; charset=utf-8')
+
+    def _simulate_latency(self):
+        if self.app.config['latency_ms']:
+            time.sleep(self.app.config['latency_ms'] / 1000)
+
+    def _read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+    def _cookies(self):
+        cookies = dict()
+        for item in (self.headers.get('Cookie') or '').split(';'):
+            if '=' in item:
+                name, value = item.strip().split('=', 1)
+                cookies[name] = value
+        return cookies
+
+    def _session_email(self):
+        return self.app.sessions.get(self._cookies().get(SESSION_COOKIE))
+
+    def _send_json(self, payload, status=200, headers=None):
+        self._send_bytes(json.dumps(payload).encode('utf-8'), 'application/json', headers, status)
+
+    def _send_bytes(self, content, content_type, headers=None, status=200):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(content)))
+        self.send_header('Cache-Control', 'no-store')
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
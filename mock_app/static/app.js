@@ -0,0 +1,482 @@
+/*
+ * Single page client of the mock app. The markup mirrors the DOM contracts of locators/*.py,
+ * keep both in sync when a locator changes.
+ */
+
+const state = {
+    email: null,
+    sidebarCollapsed: false,
+    tab: 'upload',
+    historyFiles: [],
+    historyKey: '',
+    historySearch: '',
+    historyTimer: null,
+    pollSeconds: 2,
+    supportPageSize: '10',
+    supportSearch: ''
+};
+
+const SERVICES = {'bank-statement': {key: 'bank_statement', title: 'Bank Statement'}};
+const root = document.getElementById('root');
+
+function esc(value) {
+    return String(value).replace(/[&<>"']/g, ch => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[ch]));
+}
+
+async function api(method, path, body, headers) {
+    const response = await fetch(path, {method: method, body: body, headers: headers || {}, credentials: 'same-origin'});
+    const isJson = (response.headers.get('Content-Type') || '').includes('application/json');
+    const payload = isJson ? await response.json() : null;
+    if (response.status === 401 && path !== '/api/login') {
+        state.email = null;
+        navigate('/');
+    }
+    if (!response.ok) {
+        throw new Error((payload && payload.message) || response.statusText);
+    }
+    return payload;
+}
+
+function navigate(path) {
+    if (path !== location.pathname + location.search) {
+        history.pushState({}, '', path);
+    }
+    render();
+}
+
+window.addEventListener('popstate', render);
+
+function toast(message, isError) {
+    const element = document.createElement('div');
+    element.setAttribute('role', 'alert');
+    element.className = isError ? 'toast error' : 'toast';
+    element.innerHTML = `<span class="para">${esc(message)}</span>`;
+    document.body.appendChild(element);
+    setTimeout(() => element.remove(), 4000);
+}
+
+function modal(message, buttonText, onConfirm) {
+    const element = document.createElement('div');
+    element.className = 'modal';
+    element.innerHTML = `<div class="modal-body"><p>${esc(message)}</p><button type="button">${esc(buttonText)}</button></div>`;
+    element.querySelector('button').addEventListener('click', () => {
+        element.remove();
+        onConfirm();
+    });
+    document.body.appendChild(element);
+}
+
+function stopHistoryPolling() {
+    if (state.historyTimer) {
+        clearInterval(state.historyTimer);
+        state.historyTimer = null;
+    }
+}
+
+/* ---------- layout ---------- */
+
+function topbar(withSidebarToggle) {
+    const icon = state.sidebarCollapsed ? 'angle-right' : 'angle-left';
+    const toggle = withSidebarToggle
+        ? `<div class="topbar-fabars"><button type="button"><svg data-icon="${icon}" viewBox="0 0 16 16"><path d="M4 8h8"/></svg></button></div>`
+        : '<div></div>';
+    return `<div class="topbar">${toggle}
+        <div class="profile">
+            <button type="button" id="dropdown-basic"><svg data-icon="user" viewBox="0 0 16 16"><circle cx="8" cy="8" r="6"/></svg></button>
+            <div class="dropdown-menu" hidden><span>Logout</span></div>
+        </div>
+    </div>`;
+}
+
+function bindTopbar() {
+    const toggle = root.querySelector('.topbar-fabars button');
+    if (toggle) {
+        toggle.addEventListener('click', () => {
+            state.sidebarCollapsed = !state.sidebarCollapsed;
+            const icon = state.sidebarCollapsed ? 'angle-right' : 'angle-left';
+            toggle.innerHTML = `<svg data-icon="${icon}" viewBox="0 0 16 16"><path d="M4 8h8"/></svg>`;
+            root.querySelector('.sidebar').classList.toggle('collapsed', state.sidebarCollapsed);
+        });
+    }
+
+    const menu = root.querySelector('.dropdown-menu');
+    root.querySelector('#dropdown-basic').addEventListener('click', () => { menu.hidden = !menu.hidden; });
+    menu.querySelector('span').addEventListener('click', async () => {
+        await api('POST', '/api/logout');
+        state.email = null;
+        stopHistoryPolling();
+        navigate('/');
+    });
+}
+
+function page(content) {
+    root.innerHTML = `${topbar(true)}
+        <div class="layout">
+            <div class="sidebar${state.sidebarCollapsed ? ' collapsed' : ''}"><div class="menu-item">Home</div></div>
+            <div class="content">${content}</div>
+        </div>`;
+    bindTopbar();
+    root.querySelector('.menu-item').addEventListener('click', () => navigate('/extraction'));
+}
+
+/* ---------- login ---------- */
+
+function renderLanding() {
+    root.innerHTML = `<div class="card"><h2>example website</h2><button type="button" class="sign-in">Sign In</button></div>`;
+    root.querySelector('.sign-in').addEventListener('click', renderEmailStep);
+}
+
+function renderEmailStep() {
+    root.innerHTML = `<form class="card" autocomplete="off">
+        <label>Email</label><input type="email" name="email">
+        <button type="submit">Next</button>
+    </form>`;
+    root.querySelector('form').addEventListener('submit', event => {
+        event.preventDefault();
+        const email = root.querySelector('input[type=email]').value.trim();
+        if (email) {
+            renderPasswordStep(email);
+        }
+    });
+}
+
+function renderPasswordStep(email) {
+    root.innerHTML = `<form class="card" autocomplete="off">
+        <label>${esc(email)}</label><input type="password" name="password">
+        <button type="submit">Sign in</button>
+    </form>`;
+    root.querySelector('form').addEventListener('submit', async event => {
+        event.preventDefault();
+        try {
+            await api('POST', '/api/login', JSON.stringify({email: email, password: root.querySelector('input[name=password]').value}),
+                {'Content-Type': 'application/json'});
+            state.email = email;
+            navigate('/');
+        } catch (error) {
+            toast(error.message, true);
+        }
+    });
+}
+
+/* ---------- home ---------- */
+
+function renderTiles(tiles) {
+    page(`<div class="tiles">${tiles.map(([title, path]) => `<div class="tile" data-path="${path}"><span>${title}</span></div>`).join('')}</div>`);
+    root.querySelectorAll('.tile').forEach(tile => tile.addEventListener('click', () => navigate(tile.dataset.path)));
+}
+
+function renderHome() {
+    renderTiles([
+        ['Extraction', '/extraction/services'],
+        ['Bank Statement', '/extraction/bank-statement'],
+        ['Cash Flow Analysis', '/extraction/cash-flow-analysis'],
+        ['Classification', '/extraction/classification']
+    ]);
+}
+
+/* ---------- section: upload file / history tabs ---------- */
+
+function renderSection(slug) {
+    const service = SERVICES[slug];
+    if (!service) {
+        page(`<p>${esc(slug)} is not available in the local app</p>`);
+        return;
+    }
+
+    const params = new URLSearchParams(location.search);
+    state.tab = params.get('tab') === 'history' ? 'history' : 'upload';
+
+    page(`<h3>${service.title}</h3>
+        <ul role="tablist" class="nav nav-tabs">
+            <li><button type="button" role="tab" id="justify-tab-example-tab-Upload file"><span>Upload File</span></button></li>
+            <li><button type="button" role="tab" id="justify-tab-example-tab-History"><span>History</span></button></li>
+        </ul>
+        <div id="tab-content"></div>`);
+
+    root.querySelectorAll('[role=tab]').forEach(tab => tab.addEventListener('click', () => {
+        selectTab(service, tab.id.endsWith('History') ? 'history' : 'upload');
+    }));
+    selectTab(service, state.tab);
+}
+
+function selectTab(service, tab) {
+    state.tab = tab;
+    stopHistoryPolling();
+
+    root.querySelectorAll('[role=tab]').forEach(element => {
+        const active = element.id.endsWith('History') === (tab === 'history');
+        element.className = active ? 'nav-link active' : 'nav-link';
+        element.setAttribute('aria-selected', active ? 'true' : 'false');
+    });
+
+    if (tab === 'history') {
+        renderHistoryTab(service);
+    } else {
+        renderUploadTab(service);
+    }
+}
+
+function renderUploadTab(service) {
+    const content = root.querySelector('#tab-content');
+    content.innerHTML = `<div class="upload">
+        <div class="radio-group">
+            <input type="radio" name="statement_type" id="Bank Statement" value="bank_statement" checked><label for="Bank Statement">Bank Statement</label>
+            <input type="radio" name="statement_type" id="Credit Statement" value="credit_card"><label for="Credit Statement">Credit Card</label>
+        </div>
+        <p><input type="file" id="file" accept=".pdf,.jpg,.jpeg,.png"></p>
+        <button type="submit" disabled>Next</button>
+    </div>`;
+
+    const input = content.querySelector('#file');
+    const next = content.querySelector('button[type=submit]');
+    input.addEventListener('change', () => { next.disabled = input.files.length === 0; });
+    next.addEventListener('click', async () => {
+        const file = input.files[0];
+        const statementType = content.querySelector('input[name=statement_type]:checked').value;
+        const buffer = await file.arrayBuffer();
+
+        if (file.name.toLowerCase().endsWith('.pdf')) {
+            renderPageSelection(service, file, buffer, statementType);
+        } else {
+            confirmUpload(service, file, buffer, statementType, 1);
+        }
+    });
+}
+
+function countPdfPages(buffer) {
+    const text = new TextDecoder('latin1').decode(buffer);
+    const pages = text.match(/\/Type\s*\/Page(?!s)/g);
+    return pages ? pages.length : 1;
+}
+
+function renderPageSelection(service, file, buffer, statementType) {
+    const pages = countPdfPages(buffer);
+    const content = root.querySelector('#tab-content');
+    const thumbnails = Array.from({length: pages}, (_, index) =>
+        `<button type="button" class="select_pdf_page_container" data-page="${index + 1}">
+            <div class="react-pdf__Page"><canvas class="react-pdf__Page__canvas canvas" width="90" height="120"></canvas></div>
+        </button>`).join('');
+
+    content.innerHTML = `<p>${esc(file.name)}: select the pages to extract</p>
+        <div class="page_selection_body_select_pdf_page ">${thumbnails}</div>
+        <button type="button" class="submit-pages">Submit</button>`;
+
+    // Selection is kept in a data attribute, the locators match the exact class value
+    content.querySelectorAll('.select_pdf_page_container').forEach(button => button.addEventListener('click', () => {
+        button.dataset.selected = button.dataset.selected === 'true' ? 'false' : 'true';
+    }));
+    content.querySelector('.submit-pages').addEventListener('click', () => confirmUpload(service, file, buffer, statementType, pages));
+}
+
+function confirmUpload(service, file, buffer, statementType, pages) {
+    modal('Processing can take a few minutes, the output will be available under the History tab.', 'Okay', async () => {
+        try {
+            const query = `service=${service.key}&statement_type=${statementType}&pages=${pages}`;
+            const payload = await api('POST', `/api/upload?${query}`, buffer,
+                {'X-File-Name': encodeURIComponent(file.name), 'Content-Type': 'application/octet-stream'});
+            toast(payload.message);
+        } catch (error) {
+            toast(error.message, true);
+        }
+        renderUploadTab(service);
+    });
+}
+
+function renderHistoryTab(service) {
+    const content = root.querySelector('#tab-content');
+    content.innerHTML = `<input type="text" placeholder="Search By FileName">
+        <div class="services-history-table-header fw-semibold">
+            <div>File Name</div><div>Date &amp; Time</div><div>Status</div><div>Download</div><div>Preview</div>
+        </div>
+        <div class="services-history-table-body-container"></div>`;
+
+    const search = content.querySelector('input');
+    search.value = state.historySearch;
+    search.addEventListener('input', () => {
+        state.historySearch = search.value;
+        renderHistoryRows(true);
+    });
+
+    state.historyKey = '';
+    loadHistory(service);
+    // The history grid refreshes itself, like the real app
+    state.historyTimer = setInterval(() => loadHistory(service), state.pollSeconds * 1000);
+}
+
+async function loadHistory(service) {
+    try {
+        const payload = await api('GET', `/api/history?service=${service.key}`);
+        state.historyFiles = payload.files;
+        renderHistoryRows(false);
+    } catch (error) {
+        stopHistoryPolling();
+    }
+}
+
+function renderHistoryRows(force) {
+    const body = root.querySelector('.services-history-table-body-container');
+    if (!body) {
+        stopHistoryPolling();
+        return;
+    }
+
+    const term = state.historySearch.trim().toLowerCase();
+    const files = state.historyFiles.filter(file => file.file_name.toLowerCase().includes(term));
+    const key = JSON.stringify(files);
+
+    // Only touch the DOM when something changed, element handles of the tests stay valid
+    if (!force && key === state.historyKey) {
+        return;
+    }
+    state.historyKey = key;
+
+    body.innerHTML = files.map(file => `<div class="row-data" data-id="${esc(file.id)}">
+        <div class="services-history-table-header-filename" data-testid="${esc(file.file_name)}">${esc(file.file_name)}</div>
+        <div class="services-history-table-header-dateAndTime">${esc(file.date_time)}</div>
+        <div aria-label="status" data-testid="${file.status}">${file.status}</div>
+        <div aria-label="download" data-testid="${file.download}"><span>&#x2913;</span></div>
+        <div aria-label="preview" data-testid="${file.preview}"><span>&#x1F441;</span></div>
+    </div>`).join('');
+
+    body.querySelectorAll('.row-data').forEach(row => {
+        const id = row.dataset.id;
+        row.querySelector('[aria-label=download]').addEventListener('click', event => {
+            if (event.currentTarget.dataset.testid === 'download-enabled') {
+                const link = document.createElement('a');
+                link.href = `/api/files/${id}/download`;
+                link.download = '';
+                document.body.appendChild(link);
+                link.click();
+                link.remove();
+            }
+        });
+        row.querySelector('[aria-label=preview]').addEventListener('click', event => {
+            if (event.currentTarget.dataset.testid === 'preview-enabled') {
+                navigate(`/output/${id}?from=module`);
+            }
+        });
+    });
+}
+
+/* ---------- support portal ---------- */
+
+function renderSupportPortal() {
+    page(`<h3>Support Portal</h3>
+        <div class="support-toolbar">
+            <select class="form-select range-date-picker">
+                ${['10', '25', '50', '100'].map(size => `<option value="${size}"${size === state.supportPageSize ? ' selected' : ''}>${size}</option>`).join('')}
+            </select>
+            <input type="text" placeholder="Search File Name">
+        </div>
+        <table data-testid="support-portal-table" id="support-table">
+            <thead><tr><th>File Name</th><th>Service Type</th><th>Date &amp; Time</th><th>Status</th></tr></thead>
+            <tbody></tbody>
+        </table>`);
+
+    const select = root.querySelector('select');
+    const search = root.querySelector('input[placeholder="Search File Name"]');
+    search.value = state.supportSearch;
+    select.addEventListener('change', () => { state.supportPageSize = select.value; loadSupportFiles(); });
+    search.addEventListener('input', () => { state.supportSearch = search.value; loadSupportFiles(); });
+    loadSupportFiles();
+}
+
+async function loadSupportFiles() {
+    const query = `page_size=${state.supportPageSize}&search=${encodeURIComponent(state.supportSearch)}`;
+    const payload = await api('GET', `/api/support/files?${query}`);
+    const body = root.querySelector('#support-table tbody');
+    if (!body) {
+        return;
+    }
+
+    body.innerHTML = payload.files.map(file => `<tr data-testid="enabled" data-id="${esc(file.id)}">
+        <td data-testid="${esc(file.file_name)}">${esc(file.file_name)}</td>
+        <td data-testid="${esc(file.service)}">Bank Statement</td>
+        <td data-testid="${esc(file.date_time)}">${esc(file.date_time)}</td>
+        <td data-testid="${file.portal_status}">${file.portal_status}</td>
+    </tr>`).join('');
+    body.querySelectorAll('tr').forEach(row => row.addEventListener('click', () => navigate(`/output/${row.dataset.id}?from=support`)));
+}
+
+/* ---------- output screen ---------- */
+
+async function renderOutput(fileId) {
+    const from = new URLSearchParams(location.search).get('from');
+    const backPath = from === 'support' ? '/history/bank-statement' : '/extraction/bank-statement';
+    const historyPath = '/extraction/bank-statement?tab=history';
+
+    root.innerHTML = `${topbar(false)}
+        <div class="output-header">
+            <button type="button" class="back"><svg data-icon="angle-left" viewBox="0 0 16 16"><path d="M10 4L6 8l4 4"/></svg></button>
+            <button type="button" class="history"><svg data-icon="clock-rotate-left" viewBox="0 0 16 16"><circle cx="8" cy="8" r="6"/></svg></button>
+        </div>
+        <div id="output-body"></div>`;
+    bindTopbar();
+    root.querySelector('.back').addEventListener('click', () => navigate(backPath));
+    root.querySelector('.history').addEventListener('click', () => navigate(historyPath));
+
+    const body = root.querySelector('#output-body');
+    const payload = await api('GET', `/api/files/${fileId}/output`);
+
+    if (payload.file.status === 'failed') {
+        body.innerHTML = '<div class="layout-card"><div><p><span>File processing unsuccessful. Please try again.</span></p></div></div>';
+        return;
+    }
+
+    body.innerHTML = `<div class="output">
+            <div class="output-left"><canvas class="react-pdf__Page__canvas canvas" width="400" height="520"></canvas></div>
+            <div class="Extraction-tables position-relative">
+                <table id="bsTable">
+                    <thead><tr>${payload.headers.map(header => `<th>${esc(header)}</th>`).join('')}</tr></thead>
+                    <tbody>${payload.rows.map(row => `<tr>${row.map(cell => `<td>${esc(cell)}</td>`).join('')}</tr>`).join('')}</tbody>
+                </table>
+            </div>
+        </div>
+        <button type="button" class="submit-output">Submit</button>`;
+
+    body.querySelector('.submit-output').addEventListener('click', () => {
+        modal('Submit the reviewed output?', 'Proceed', async () => {
+            const result = await api('POST', `/api/files/${fileId}/submit`);
+            toast(result.message);
+            navigate(backPath);
+        });
+    });
+}
+
+/* ---------- router ---------- */
+
+async function render() {
+    stopHistoryPolling();
+    document.querySelectorAll('.modal').forEach(element => element.remove());
+
+    if (state.email === null) {
+        const session = await api('GET', '/api/session');
+        state.email = session.logged_in ? session.email : null;
+    }
+    if (state.email === null) {
+        renderLanding();
+        return;
+    }
+
+    const parts = location.pathname.split('/').filter(Boolean);
+
+    // Like the real app, the home page lives under /extraction and the support portal under /history
+    if (parts.length === 0) {
+        history.replaceState({}, '', '/extraction');
+        renderHome();
+    } else if (parts[0] === 'extraction' && parts.length === 1) {
+        renderHome();
+    } else if (parts[0] === 'extraction' && parts[1] === 'services') {
+        renderTiles([['Bank Statement', '/extraction/bank-statement']]);
+    } else if (parts[0] === 'extraction') {
+        renderSection(parts[1]);
+    } else if (parts[0] === 'history') {
+        renderSupportPortal();
+    } else if (parts[0] === 'output' && parts[1]) {
+        renderOutput(parts[1]);
+    } else {
+        navigate('/');
+    }
+}
+
+api('GET', '/api/config').then(config => { state.pollSeconds = config.history_poll_seconds; }).finally(render);
@@ -0,0 +1,224 @@
+import os
+import time
+import asyncio
+import logging
+from datetime import datetime, date
+from helper import async_playwright_helper
+from pages.async_home_page import exampleHomePageAsync
+from utility.download_manager import DOWNLOAD_DIR, get_download_path
+from locators.home_page_locators import HomePageLocators
+from locators.bank_statemenet_page_locators import BankStatementPageLocators
+
+
+class BankStatementPageAsync:
+
+    def __init__(self, page):
+        self.page = page
+        self.bank_stmnt_loc = BankStatementPageLocators
+        self.home_loc = HomePageLocators
+        self.pg_home = exampleHomePageAsync(page)
+
+    '''
+    Async version of pages/bank_statement_page.py, covers the upload and status polling flow
+    so that many bank statements can be uploaded and polled concurrently from one process
+    '''
+
+    async def select_bank_statement_extraction_option(self, option: str):
+        """
+        Select bank statement or credit card radio button
+
+        Args:
+            option: 'bank_statement' or 'credit_card'
+        """
+        match option.lower():
+
+            case 'bank_statement':
+                radio_locator = self.bank_stmnt_loc.BANK_STATEMENT_RADIO_CSS
+
+            case 'credit_card':
+                radio_locator = self.bank_stmnt_loc.CREDIT_CARD_RADIO_CSS
+
+            case _:
+                logging.error('Invalid Option type found')
+                return
+
+        element = await async_playwright_helper.is_element_present(self.page, radio_locator)
+        res = await element.is_checked()
+        logging.info(f'{option} radio button value is {res}')
+
+        if res:
+            logging.info(f'{option} Radio Button is already selected')
+        else:
+            logging.error(f'{option} Radio Button is not selected Automatically')
+            await (await async_playwright_helper.is_element_clickable(self.page, radio_locator, 20)).click()
+            await async_playwright_helper.wait_for_element_state(self.page, radio_locator, 'checked')
+            logging.info(f'Clicked on the {option} button')
+
+    async def bank_statement_extraction_section_upload(self, option: str, filepath: str):
+        """
+        Upload file for bank statement extraction
+
+        Args:
+            option: 'bank_statement' or 'credit_card'
+            filepath: Path to file to upload
+
+        Returns:
+            dict: File details including name, extension, number of pages
+        """
+        await self.select_bank_statement_extraction_option(option)
+
+        await self.pg_home.upload_file(filepath)
+
+        required_details = dict()
+
+        await self.pg_home.click_on_next_btn()
+        fileName = os.path.basename(filepath)
+        file_extn = fileName.split('.')[-1]
+
+        if file_extn.lower() == 'pdf':
+            required_details['no_of_page'] = await self.pg_home.select_page()
+
+        elif file_extn.lower() in ['jpg', 'jpeg', 'png']:
+            await (await async_playwright_helper.is_element_clickable(self.page, self.home_loc.DISCLAIMER_OKAY_XPATH)).click()
+            required_details['no_of_page'] = 1
+
+        required_details['file_name'] = fileName
+        required_details['file_extn'] = file_extn
+
+        return required_details
+
+    async def verify_file_upload_message(self, msg: str):
+        """
+        Verify success message after file upload
+
+        Args:
+            msg: Expected success message
+        """
+        success_msg = await (await async_playwright_helper.is_element_clickable(self.page, self.home_loc.SUCCESS_MSG_XPATH, 60)).text_content()
+        assert msg.strip() in success_msg
+        logging.info(f'After uploaded file success message is {success_msg}')
+
+    async def verify_uploaded_file_on_history_tab(self, testdata, filename: str, max_refresh=5):
+        """
+        Verify uploaded file appears in history tab with correct details.
+        The newest row of this file is looked up instead of the first row of the grid, other contexts
+        of the same process upload at the same time and their files may be listed above it
+
+        Args:
+            testdata: Test data dictionary
+            filename: Name of uploaded file
+            max_refresh: Number of tab switches to refresh the history grid (default: 5)
+
+        Returns:
+            dict: File details from module history
+        """
+        row_locator = f'''(//div[@class='services-history-table-body-container']//div[@class='row-data'][.//div[@data-testid='{filename}']])[1]'''
+        datetime_locator = f'''{row_locator}//div[@class='services-history-table-header-dateAndTime']'''
+
+        await (await async_playwright_helper.is_element_clickable(self.page, self.home_loc.LAST_TAB_NAME_XPATH, 15)).click()
+        logging.info('Clicked on the History Tab')
+        await async_playwright_helper.is_element_present(self.page, self.bank_stmnt_loc.MODULE_HISTORY_ALL_FILENAME_XPATH, 30)
+
+        for refresh in range(max_refresh + 1):
+            if await self.page.locator(row_locator).count():
+                break
+
+            logging.warning(f'Uploaded file {filename} is not showing under History Tab, refresh {refresh + 1}')
+            await self.pg_home.click_on_tab(testdata['tab_name1'])
+            await self.pg_home.click_on_tab(testdata['tab_name2'])
+        else:
+            raise AssertionError(f'After refreshed {max_refresh} times, still uploaded file {filename} is not showing under History Tab')
+
+        ui_dateTime = await (await async_playwright_helper.is_element_present(self.page, datetime_locator)).text_content()
+        ui_date = ui_dateTime.strip().split()[0]
+        ui_time = ui_dateTime.strip().split()[-1]
+        date_obj = datetime.strptime(ui_date, "%m-%d-%Y").date()
+        time_obj = datetime.strptime(ui_time, "%H:%M:%S").time()
+
+        assert date_obj == date.today()
+        logging.info(f'Uploaded File {filename} is showing under History Tab and Date is also matched')
+
+        return {
+            'filename': filename,
+            'ui_dateTime': ui_dateTime.strip(),
+            'file_uploading_date_str': ui_date,
+            'file_uploading_date_dateObj': date_obj,
+            'file_uploading_time_str': ui_time,
+            'file_uploading_time_timeObj': time_obj
+        }
+
+    async def verify_file_status_from_module_history(self, testdata, filename: str, date_time: str, no_of_page: int, poll_interval=5):
+        """
+        Poll the file status and download output when complete. Waiting uses asyncio.sleep,
+        so other pages of the same process keep running meanwhile
+
+        Args:
+            testdata: Test data dictionary
+            filename: Name of the file
+            date_time: DateTime string for file
+            no_of_page: Number of pages in document
+            poll_interval: Seconds between two status reads (default: 5)
+
+        Returns:
+            str: Final file status
+        """
+        row_locator = f'''//div[@class='row-data'][.//div[@data-testid='{filename}'] and .//div[contains(text(), '{date_time}')]]'''
+        dynamic_locator_status = f'''({row_locator}//div[@aria-label='status'])'''
+        dynamic_locator_download = f'''({row_locator}//div[@aria-label='download'])'''
+        dynamic_locator_preview = f'''({row_locator}//div[@aria-label='preview'])'''
+
+        await async_playwright_helper.is_element_present(self.page, dynamic_locator_status, 50)
+
+        total_wait_time = no_of_page * 55
+        deadline = time.monotonic() + total_wait_time
+        poll = 0
+
+        while True:
+
+            if poll > 1:
+                await self.pg_home.click_on_tab(testdata['tab_name1'])
+                await self.pg_home.click_on_tab(testdata['tab_name2'])
+
+            file_status = (await self.page.locator(dynamic_locator_status).get_attribute('data-testid')).strip().lower()
+            download_status = (await self.page.locator(dynamic_locator_download).get_attribute('data-testid')).strip().lower()
+            preview_status = (await self.page.locator(dynamic_locator_preview).get_attribute('data-testid')).strip().lower()
+            logging.info(f'{filename} File Status is {file_status}, Download {download_status}, Preview {preview_status}')
+
+            match file_status:
+
+                case 'failed':
+                    logging.error(f'{filename} File Processing Failed')
+                    break
+
+                case 'partially-done':
+                    assert download_status == 'download-disabled'
+                    assert preview_status == 'preview-disabled'
+                    logging.info(f'{filename} File Processing Completed, Download and Preview buttons Disabled')
+                    break
+
+                case 'completed':
+                    assert download_status == 'download-enabled'
+                    assert preview_status == 'preview-enabled'
+                    logging.info(f'{filename} File Processing Completed, Download and Preview buttons Enabled')
+
+                    async with self.page.expect_download() as download_info:
+                        await self.page.locator(dynamic_locator_download).click()
+                    download = await download_info.value
+
+                    final_download_path = get_download_path(
+                        DOWNLOAD_DIR, download.suggested_filename, testdata['section'], testdata['option']
+                    )
+                    await download.save_as(final_download_path)
+                    logging.info(f'Output Downloaded Successfully to: {final_download_path}')
+                    break
+
+                case _:
+                    # 'processing' / 'in-queue'
+                    if time.monotonic() >= deadline:
+                        logging.error(f'Waited for {total_wait_time} Seconds, {filename} is not yet processed, So Loop Breaked')
+                        break
+
+                    poll += 1
+                    await asyncio.sleep(poll_interval)
+
+        return file_status
@@ -0,0 +1,163 @@
+import logging
+from helper import async_playwright_helper
+from locators.home_page_locators import HomePageLocators
+
+
+class exampleHomePageAsync:
+
+    def __init__(self, page):
+        self.page = page
+        self.home_loc = HomePageLocators
+
+    '''
+    Async version of pages/home_page.py, used with the async Playwright engine
+    '''
+
+    async def select_section(self, section: str):
+        """
+        Navigate to specific section from home page
+
+        Args:
+            section: Name of the section to navigate to
+        """
+        logging.warning(f'The current section to be found {section}')
+
+        match section.lower():
+
+            case 'extraction':
+                await (await async_playwright_helper.is_element_clickable(self.page, self.home_loc.EXTRACTION_BTN_XPATH, 20)).click()
+                logging.info('Extraction Section Selected')
+
+            case 'bank_statement':
+                await (await async_playwright_helper.is_element_clickable(self.page, self.home_loc.BANK_STMNT_XPATH, 20)).click()
+                logging.info('Bank Statement Section Selected')
+
+            case 'cash_flow_analysis':
+                await (await async_playwright_helper.is_element_clickable(self.page, self.home_loc.CASH_FLOW_XPATH, 60)).click()
+                logging.info('Cash Flow Analysis Section Selected')
+
+            case 'classification':
+                await async_playwright_helper.scroll_to_element(self.page, self.home_loc.CLASSIFICATION_BTN_XPATH)
+                await (await async_playwright_helper.is_element_clickable(self.page, self.home_loc.CLASSIFICATION_BTN_XPATH)).click()
+                logging.info('Classification Section Selected')
+
+            case _:
+                logging.error('No Section has been selected from Home Page')
+
+    async def upload_file(self, filepath: str):
+        """
+        Upload file using file input element
+
+        Args:
+            filepath: Absolute path to the file to upload
+
+        Returns:
+            filepath: The uploaded file path
+        """
+        await self.page.locator(self.home_loc.UPLOAD_FILE_XPATH).set_input_files(filepath)
+        # Next button gets enabled once the file is accepted by the page
+        await async_playwright_helper.wait_for_element_state(self.page, self.home_loc.NEXT_BTN_XPATH, 'enabled', 20)
+
+        logging.info(f'{filepath} file uploaded successfully')
+
+        return filepath
+
+    async def click_on_next_btn(self):
+        """Click on Next button"""
+        await async_playwright_helper.scroll_to_element(self.page, self.home_loc.NEXT_BTN_XPATH)
+        await (await async_playwright_helper.is_element_clickable(self.page, self.home_loc.NEXT_BTN_XPATH)).click()
+        logging.info('Clicked on the Next Button')
+
+    async def select_page(self):
+        """
+        Select pages from PDF preview
+
+        Returns:
+            int: Number of pages selected
+        """
+        # PDF preview renders page by page, wait for the first page and the rendering requests to settle
+        await async_playwright_helper.wait_for_element_state(self.page, self.home_loc.SELECT_PAGE_XPATH, 'visible', 30)
+        await async_playwright_helper.wait_for_network_idle(self.page, 10)
+        all_pages = await async_playwright_helper.get_all_elements(self.page, self.home_loc.SELECT_PAGE_XPATH)
+        length = len(all_pages)
+        logging.info(f'Total number of pages to be selected {length}')
+
+        for index in range(1, length+1):
+            dynamic_locator = f'''(//button[@class='select_pdf_page_container']//canvas[contains(@class,'canvas')])[{index}]'''
+            logging.info(f'Clicked over dynamic locator {dynamic_locator}')
+            await self.page.locator(dynamic_locator).click()
+            if index >= 4:
+                logging.warning(f'Number of pages selected {index}, so loop breaked')
+                break
+
+        await async_playwright_helper.scroll_to_element(self.page, self.home_loc.SUBMIT_BTN_XPATH)
+        await (await async_playwright_helper.is_element_clickable(self.page, self.home_loc.SUBMIT_BTN_XPATH)).click()
+        await (await async_playwright_helper.is_element_clickable(self.page, self.home_loc.DISCLAIMER_OKAY_XPATH)).click()
+        return length
+
+    async def check_tab_attribute_value(self, tab_name: str):
+        """
+        Check tab attribute values for validation
+
+        Args:
+            tab_name: Name of the tab to check ('upload_file' or 'history')
+        """
+        match tab_name.lower():
+
+            case 'upload_file':
+                tab_locator = self.home_loc.UPLOAD_FILE_TAB_CSS
+
+            case 'history':
+                tab_locator = self.home_loc.HISTORY_TAB_CSS
+
+            case _:
+                logging.error(f'Invalid Tab name found {tab_name}')
+                return
+
+        tab = await async_playwright_helper.is_element_clickable(self.page, tab_locator)
+        attr_value = await tab.get_attribute('aria-selected')
+        attr_value2 = await tab.get_attribute('class')
+        logging.info(f'{tab_name} Tablist values are {attr_value, attr_value2}')
+
+        if 'true' != attr_value.strip() or 'nav-link active' != attr_value2.strip():
+            raise AssertionError(
+                f"{tab_name} tab is not selected.\n"
+                f"Expected: aria-selected='true' and class='nav-link active'\n"
+                f"Found: aria-selected='{attr_value.strip()}' and class='{attr_value2.strip()}'\n"
+                f"Tab selector: {tab_locator}"
+            )
+
+    async def click_on_tab(self, tab_name: str):
+        """
+        Click on specific tab
+
+        Args:
+            tab_name: Name of the tab to click ('upload_file' or 'history')
+        """
+        match tab_name.lower():
+
+            case 'upload_file':
+                await (await async_playwright_helper.is_element_clickable(self.page, self.home_loc.UPLOAD_FILE_TAB_CSS)).click()
+                await async_playwright_helper.wait_for_attribute_value(self.page, self.home_loc.UPLOAD_FILE_TAB_CSS, 'aria-selected', 'true')
+                await self.check_tab_attribute_value(tab_name)
+
+            case 'history':
+                await (await async_playwright_helper.is_element_clickable(self.page, self.home_loc.HISTORY_TAB_CSS)).click()
+                await async_playwright_helper.wait_for_attribute_value(self.page, self.home_loc.HISTORY_TAB_CSS, 'aria-selected', 'true')
+                await self.check_tab_attribute_value(tab_name)
+
+    async def verify_home_page_history_tab(self):
+        """Verify and click history tab"""
+        await async_playwright_helper.is_element_clickable(self.page, self.home_loc.LAST_TAB_NAME_XPATH, 15)
+        await async_playwright_helper.scroll_to_element(self.page, self.home_loc.LAST_TAB_NAME_XPATH)
+        await (await async_playwright_helper.is_element_clickable(self.page, self.home_loc.LAST_TAB_NAME_XPATH)).click()
+        await async_playwright_helper.wait_for_attribute_value(self.page, self.home_loc.HISTORY_TAB_CSS, 'aria-selected', 'true')
+        logging.info('Clicked on the Last Tab')
+        tab_name = await (await async_playwright_helper.is_element_clickable(self.page, self.home_loc.LAST_TAB_NAME_XPATH, 30)).text_content()
+        logging.info(f'Current Tab name is {tab_name}')
+
+        assert 'history' == tab_name.strip().lower()
+        logging.info('History Tab Verified')
+
+        await self.check_tab_attribute_value('History')
+        logging.info('History Tab Selected')
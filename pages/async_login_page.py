@@ -0,0 +1,51 @@
+import logging
+from helper import async_playwright_helper
+from locators.login_page_locators import LoginPageLocators
+from locators.home_page_locators import HomePageLocators
+
+
+'''
+Async version of pages/login_page.py, used with the async Playwright engine
+'''
+
+
+class exampleLoginPageAsync:
+
+    def __init__(self, page):
+        self.page = page
+        self.login_loc = LoginPageLocators
+        self.home_loc = HomePageLocators
+
+    async def example_login(self, url, email, password):
+        """
+        Login to example application
+
+        Args:
+            url: Application URL
+            email: User email
+            password: User password
+        """
+        await self.page.goto(url)
+
+        try:
+            await (await async_playwright_helper.is_element_clickable(self.page, self.login_loc.SIGN_IN_XPATH)).click()
+            await (await async_playwright_helper.wait_for_element_state(self.page, self.login_loc.IP_EMAIL_XPATH, 'editable', 30)).fill(email)
+            await (await async_playwright_helper.is_element_clickable(self.page, self.login_loc.SUBMIT_BTN)).click()
+            await (await async_playwright_helper.wait_for_element_state(self.page, self.login_loc.IP_PASSWORD_XPATH, 'editable', 30)).fill(password)
+            await (await async_playwright_helper.wait_for_element_state(self.page, self.login_loc.SUBMIT_BTN, 'enabled')).click()
+            await async_playwright_helper.is_element_clickable(self.page, self.home_loc.EXTRACTION_BTN_XPATH, 70)
+            logging.info('Home Page Present')
+        except Exception:
+            logging.info('User already logged in')
+
+    async def example_logout(self):
+        """
+        Logout from example application
+        """
+        try:
+            await (await async_playwright_helper.is_element_clickable(self.page, self.login_loc.PROFILE_ICON_CSS)).click()
+            await (await async_playwright_helper.is_element_clickable(self.page, self.login_loc.LOGOUT_BTN_XPATH)).click()
+            await async_playwright_helper.wait_for_element_state(self.page, self.login_loc.PROFILE_ICON_CSS, 'hidden', 20)
+            logging.info('User Logged out Successfully')
+        except Exception:
+            logging.info('User Already Logged out')
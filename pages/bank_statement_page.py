@@ -2,11 +2,13 @@ import os
 import pytest
 import logging
 import time
-import zipfile
 from PyPDF2 import PdfReader
 from helper import playwright_helper
+from helper.playwright_exceptions import TimeoutException
 from datetime import datetime, date
 from pages.home_page import exampleHomePage
+from utility import zip_verifier, table_diff
+from utility.file_status_tracker import FileStatusTracker
 from locators.home_page_locators import HomePageLocators
 from locators.bank_statemenet_page_locators import BankStatementPageLocators
 
@@ -18,6 +20,9 @@ class BankStatementPage:
         self.bank_stmnt_loc = BankStatementPageLocators
         self.home_loc = HomePageLocators
         self.pg_home = exampleHomePage(pytest.page)
+        # Listens from the start, status responses received before the status check are not lost
+        self.status_tracker = FileStatusTracker(pytest.page)
+        self.status_tracker.start()
 
     '''
     Define All the common functionalities related to Bank Statement
@@ -30,7 +35,6 @@ class BankStatementPage:
         Args:
             option: 'bank_statement' or 'credit_card'
         """
-        time.sleep(1)
         match option.lower():
 
             case 'bank_statement':
@@ -43,8 +47,8 @@ class BankStatementPage:
                 else:
                     logging.error('Bank Statement Radio Button is not selected Automatically')
                     playwright_helper.is_element_clickable(self.bank_stmnt_loc.BANK_STATEMENT_RADIO_CSS, 20).click()
+                    playwright_helper.wait_for_element_state(self.bank_stmnt_loc.BANK_STATEMENT_RADIO_CSS, 'checked')
                     logging.info('Clicked on the Bank Statement button')
-                    time.sleep(1)
 
             case 'credit_card':
                 element = playwright_helper.is_element_present(self.bank_stmnt_loc.CREDIT_CARD_RADIO_CSS)
@@ -56,15 +60,16 @@ class BankStatementPage:
                 else:
                     logging.error('Credit Card Radio Button is not selected Automatically')
                     playwright_helper.is_element_clickable(self.bank_stmnt_loc.CREDIT_CARD_RADIO_CSS, 20).click()
+                    playwright_helper.wait_for_element_state(self.bank_stmnt_loc.CREDIT_CARD_RADIO_CSS, 'checked')
                     logging.info('Clicked on the Financial Statement button')
-                    time.sleep(1)
 
             case _:
                 logging.error('Invalid Option type found')
 
     def bank_statement_extraction_section_upload(self, option: str, filepath: str):
         """
-        Upload file for bank statement extraction
+        Upload file for bank statement extraction, the status known for an earlier upload of the same
+        file name is dropped first
         
         Args:
             option: 'bank_statement' or 'credit_card'
@@ -75,12 +80,13 @@ class BankStatementPage:
         """
         self.select_bank_statement_extraction_option(option)
 
+        self.status_tracker.forget(os.path.basename(filepath))
         self.pg_home.upload_file(filepath)
 
         required_details = dict()
 
         self.pg_home.click_on_next_btn()
-        fileName = filepath.split('\\')[-1]
+        fileName = os.path.basename(filepath)
         file_extn = fileName.split('.')[-1]
 
         if file_extn.lower() == 'pdf':
@@ -88,7 +94,6 @@ class BankStatementPage:
             required_details['no_of_page'] = page_length
 
         elif file_extn.lower() in ['jpg', 'jpeg', 'png']:
-            time.sleep(2)
             playwright_helper.is_element_clickable(self.home_loc.DISCLAIMER_OKAY_XPATH).click()
             required_details['no_of_page'] = 1
 
@@ -108,11 +113,10 @@ class BankStatementPage:
             Exception: If no files found in history
         """
         playwright_helper.is_element_present(self.bank_stmnt_loc.MODULE_HISTORY_HEADER_XPATH, 20)
-        time.sleep(1)
         playwright_helper.is_element_present(self.bank_stmnt_loc.MODULE_HISTORY_ALL_FILENAME_XPATH, 20)
-        time.sleep(2)
-        all_fileNames_ele = playwright_helper.get_all_elements(self.bank_stmnt_loc.MODULE_HISTORY_ALL_FILENAME_XPATH)
-        org_fileName_list = [element.get_attribute('data-testid') for element in all_fileNames_ele]
+        # Rows are appended while the history request is still streaming in
+        playwright_helper.wait_for_network_idle()
+        org_fileName_list = playwright_helper.get_all_attributes(self.bank_stmnt_loc.MODULE_HISTORY_ALL_FILENAME_XPATH, 'data-testid')
         logging.info(f'All the file names are {org_fileName_list} and Number of files are {len(org_fileName_list)}')
         
         if len(org_fileName_list) < 1:
@@ -130,12 +134,10 @@ class BankStatementPage:
     def verify_back_btn_from_OP_screen(self):
         """Verify back button functionality from output screen"""
         playwright_helper.is_element_clickable(self.bank_stmnt_loc.PREVIEW_ENABLED_1ST_BTN_XPATH, 80)
-        # time.sleep(2)
         playwright_helper.is_element_clickable(self.bank_stmnt_loc.PREVIEW_ENABLED_1ST_BTN_XPATH).click()
         logging.info('Clicked on the Enabled Preview Button from output Screen')
         self.verify_bank_statement_extraction_output()
         assert playwright_helper.is_element_clickable(self.bank_stmnt_loc.OP_SCREEN_BACK_BTN_XPATH, 30)
-        time.sleep(1)
         playwright_helper.is_element_clickable(self.bank_stmnt_loc.OP_SCREEN_BACK_BTN_XPATH).click()
         assert playwright_helper.is_element_present(self.home_loc.UPLOAD_FILE_XPATH, 100)
         logging.info('Back Button is working and redirected to Home Page')
@@ -143,16 +145,15 @@ class BankStatementPage:
     def verify_history_btn_from_OP_screen(self):
         """Verify history button functionality from output screen"""
         playwright_helper.is_element_clickable(self.bank_stmnt_loc.PREVIEW_ENABLED_1ST_BTN_XPATH, 80)
-        time.sleep(2)
         playwright_helper.is_element_clickable(self.bank_stmnt_loc.PREVIEW_ENABLED_1ST_BTN_XPATH).click()
         logging.info('Clicked on the Enabled Preview Button from output Screen')
         self.verify_bank_statement_extraction_output()
         assert playwright_helper.is_element_clickable(self.bank_stmnt_loc.OP_SCREEN_HISTORY_BTN_XPATH, 30)
-        time.sleep(1)
         playwright_helper.is_element_clickable(self.bank_stmnt_loc.OP_SCREEN_HISTORY_BTN_XPATH).click()
         assert playwright_helper.is_element_present(self.bank_stmnt_loc.MODULE_HISTORY_ALL_FILENAME_XPATH, 100)
-        no_of_files = playwright_helper.get_all_elements(self.bank_stmnt_loc.MODULE_HISTORY_ALL_FILENAME_XPATH)
-        assert len(no_of_files) == 30
+        playwright_helper.wait_for_network_idle()
+        no_of_files = self.page.locator(self.bank_stmnt_loc.MODULE_HISTORY_ALL_FILENAME_XPATH).count()
+        assert no_of_files == 30
         logging.info('History Button is working and redirected to History Tab. 30 Files are showing under History Tab')
         
     def verify_search_bar_module_history_section(self, ip_file_name: str):
@@ -162,63 +163,48 @@ class BankStatementPage:
         Args:
             ip_file_name: File name to search for
         """
-        # time.sleep(2)
         playwright_helper.is_element_clickable(self.bank_stmnt_loc.MODULE_HISTORY_SEARCH_BAR_CSS, 20).fill(ip_file_name)
-        # time.sleep(2)
         playwright_helper.is_element_present(self.bank_stmnt_loc.MODULE_HISTORY_ALL_FILENAME_XPATH, 10)
-        ui_fileNames = playwright_helper.get_all_elements(self.bank_stmnt_loc.MODULE_HISTORY_ALL_FILENAME_XPATH)
-        for temp in range(len(ui_fileNames)):
-            ui_file_name = ui_fileNames[temp].get_attribute('data-testid')
+        ui_fileNames = playwright_helper.get_all_attributes(self.bank_stmnt_loc.MODULE_HISTORY_ALL_FILENAME_XPATH, 'data-testid')
+        for ui_file_name in ui_fileNames:
             logging.info(f'After Searched File Name is showing in UI {ui_file_name}')
             if ip_file_name.strip().lower() == ui_file_name.strip().lower():
                 logging.info('Correct File Name is showing')
             else:
                 logging.error('Exact File Name are not showing in UI')
 
-    def verify_uploaded_file_on_history_tab(self, testdata, filename: str):
+    def verify_uploaded_file_on_history_tab(self, testdata, filename: str, max_refresh=5):
         """
         Verify uploaded file appears in history tab with correct details
         
         Args:
             testdata: Test data dictionary
             filename: Name of uploaded file
+            max_refresh: Number of tab switches to refresh the history grid (default: 5)
             
         Returns:
             dict: File details from module history
         """
-        time.sleep(6)
         playwright_helper.is_element_clickable(self.home_loc.LAST_TAB_NAME_XPATH, 15).click()
-        time.sleep(1)
         logging.info('Clicked on the History Tab')
         playwright_helper.is_element_present(self.bank_stmnt_loc.MODULE_HISTORY_ALL_FILENAME_XPATH, 30)
-        time.sleep(1)
-        ui_1st_filename = playwright_helper.is_element_present(self.bank_stmnt_loc.MODULE_HISTORY_1ST_FILENAME_XPATH).get_attribute('data-testid')
-        logging.info(f'First file name is showing in UI {ui_1st_filename} and coming file name to this function {filename}')
-        
-        while True:
-            temp = 0
-            if ui_1st_filename.strip().lower() != filename.lower():
+        playwright_helper.wait_for_network_idle()
 
-                logging.warning('1st time uploaded file is not showing under History Tab')
-                self.pg_home.click_on_tab(testdata['tab_name1'])
-                self.pg_home.click_on_tab(testdata['tab_name2'])
-                time.sleep(2)
+        for refresh in range(max_refresh + 1):
+            ui_1st_filename = playwright_helper.is_element_present(self.bank_stmnt_loc.MODULE_HISTORY_1ST_FILENAME_XPATH).get_attribute('data-testid')
+            logging.info(f'First file name is showing in UI {ui_1st_filename} and coming file name to this function {filename}')
 
-                if ui_1st_filename.strip().lower() == filename.lower():
-                    assert ui_1st_filename.strip().lower() == filename.lower()
-                    logging.info('Uploaded File is showing under History Tab after refreshed')
-                    break
-                else:
-                    temp += 1
-                    if temp < 6:
-                        continue
-                    else:
-                        logging.error('After refreshed 5 times, still uploaded files is not showing under History Tab')
-                        break
-            else:
-                assert ui_1st_filename.strip().lower() == filename.lower()
-                logging.info('1st time Uploaded File is showing under History Tab')
+            if ui_1st_filename.strip().lower() == filename.lower():
+                logging.info(f'Uploaded File is showing under History Tab after {refresh} refresh')
                 break
+
+            logging.warning(f'Uploaded file is not showing under History Tab, refresh {refresh + 1}')
+            self.pg_home.click_on_tab(testdata['tab_name1'])
+            self.pg_home.click_on_tab(testdata['tab_name2'])
+            playwright_helper.wait_for_network_idle()
+
+        assert ui_1st_filename.strip().lower() == filename.lower(), \
+            f'After refreshed {max_refresh} times, still uploaded file {filename} is not showing under History Tab'
         
         ui_1st_dateTime = playwright_helper.is_element_present(self.bank_stmnt_loc.MODULE_HISTORY_DATETIME_XPATH).text_content()
         logging.info(f'1st Row Date Time is showing {ui_1st_dateTime}')
@@ -248,10 +234,8 @@ class BankStatementPage:
     
     def submit_file_from_output(self):
         """Submit file from output screen"""
-        playwright_helper.is_element_clickable(self.home_loc.SUBMIT_BTN_XPATH, 50)
-        time.sleep(2)
+        playwright_helper.wait_for_element_state(self.home_loc.SUBMIT_BTN_XPATH, 'enabled', 50)
         playwright_helper.is_element_clickable(self.home_loc.SUBMIT_BTN_XPATH, 15).click()
-        time.sleep(1)
         playwright_helper.is_element_clickable(self.bank_stmnt_loc.PROCEED_BTN_XPATH).click()
 
     def verify_file_upload_message(self, msg: str):
@@ -261,16 +245,14 @@ class BankStatementPage:
         Args:
             msg: Expected success message
         """
-        time.sleep(3)
-        playwright_helper.is_element_clickable(self.home_loc.SUCCESS_MSG_XPATH, 60)
-        success_msg = playwright_helper.is_element_clickable(self.home_loc.SUCCESS_MSG_XPATH).text_content()
+        success_msg = playwright_helper.wait_for_toast(self.home_loc.SUCCESS_MSG_XPATH, timeout=60)
         assert msg.strip() in success_msg
         logging.info(f'After uploaded file success message is {success_msg}')
-        time.sleep(2)
 
     def verify_file_status_from_module_history(self, testdata, filename: str, date_time: str, no_of_page: int):
         """
-        Verify file processing status and download output when complete
+        Verify file processing status and download output when complete.
+        Waits on the status API responses first, the history grid is only polled when the API does not report the file
         
         Args:
             testdata: Test data dictionary
@@ -281,9 +263,10 @@ class BankStatementPage:
         Returns:
             str: Final file status
         """
-        dynamic_locator_status = f'''(//div[@class='row-data'][.//div[@data-testid='{filename}'] and .//div[contains(text(), '{date_time}')]]//div[@aria-label='status'])'''
-        dynamic_locator_download = f'''(//div[@class='row-data'][.//div[@data-testid='{filename}'] and .//div[contains(text(), '{date_time}')]]//div[@aria-label='download'])'''
-        dynamic_locator_preview = f'''(//div[@class='row-data'][.//div[@data-testid='{filename}'] and .//div[contains(text(), '{date_time}')]]//div[@aria-label='preview'])'''
+        dynamic_locator_row = f'''//div[@class='row-data'][.//div[@data-testid='{filename}'] and .//div[contains(text(), '{date_time}')]]'''
+        dynamic_locator_status = f'''({dynamic_locator_row}//div[@aria-label='status'])'''
+        dynamic_locator_download = f'''({dynamic_locator_row}//div[@aria-label='download'])'''
+        dynamic_locator_preview = f'''({dynamic_locator_row}//div[@aria-label='preview'])'''
 
         logging.info(f'Dynamic Locator Status {dynamic_locator_status}')
         logging.info(f'Dynamic Locator Download {dynamic_locator_download}')
@@ -295,21 +278,62 @@ class BankStatementPage:
         playwright_helper.is_element_present(dynamic_locator_preview, 50)
 
         total_wait_time = no_of_page * 55
-        count_time = total_wait_time / 5
+        started = time.monotonic()
+
+        api_status = self.status_tracker.wait_for_final_status(
+            filename, total_wait_time, refresh=lambda: self._refresh_module_history(testdata)
+        )
+
+        if api_status is not None:
+            self._wait_for_history_row_status(testdata, dynamic_locator_status, api_status)
+        elif self.status_tracker.get_status(filename) is None:
+            logging.warning('File Status not reported by the status API, polling the History Tab')
+
+        # Only the budget left over by the API wait is spent on polling the grid
+        return self._poll_history_row_status(
+            testdata, filename, date_time, max(0, total_wait_time - (time.monotonic() - started))
+        )
+
+    def _poll_history_row_status(self, testdata, filename: str, date_time: str, wait_time: float):
+        """
+        Poll the history grid row of a file until it shows a final status, download the output when completed.
+        The status API is not waited on again, callers have already spent its budget
+        
+        Args:
+            testdata: Test data dictionary
+            filename: Name of the file
+            date_time: DateTime string for file
+            wait_time: Maximum polling time in seconds
+            
+        Returns:
+            str: Final file status
+        """
+        dynamic_locator_row = f'''//div[@class='row-data'][.//div[@data-testid='{filename}'] and .//div[contains(text(), '{date_time}')]]'''
+        dynamic_locator_status = f'''({dynamic_locator_row}//div[@aria-label='status'])'''
+        dynamic_locator_download = f'''({dynamic_locator_row}//div[@aria-label='download'])'''
+        row_cells = {
+            'status': "div[aria-label='status']",
+            'download': "div[aria-label='download']",
+            'preview': "div[aria-label='preview']"
+        }
+
+        playwright_helper.is_element_present(dynamic_locator_status, 50)
+        count_time = wait_time / 5
         temp = 0
 
         while True:
 
             if temp > 1:
-                self.pg_home.click_on_tab(testdata['tab_name1'])
-                self.pg_home.click_on_tab(testdata['tab_name2'])
+                self._refresh_module_history(testdata)
+                playwright_helper.is_element_present(dynamic_locator_status, 30)
 
-            time.sleep(2)
-            file_status = self.page.locator(dynamic_locator_status).get_attribute('data-testid')
+            # One round trip for the three status cells of the row
+            row_status = playwright_helper.get_child_attributes(dynamic_locator_row, row_cells, 'data-testid')
+            file_status = row_status.get('status') or ''
             logging.info(f'File Status is {file_status}')
-            download_status = self.page.locator(dynamic_locator_download).get_attribute('data-testid')
+            download_status = row_status.get('download') or ''
             logging.info(f'File Download Status is {download_status}')
-            preview_status = self.page.locator(dynamic_locator_preview).get_attribute('data-testid')
+            preview_status = row_status.get('preview') or ''
             logging.info(f'File Preview Status is {preview_status}')
 
             match file_status.strip().lower():
@@ -319,14 +343,14 @@ class BankStatementPage:
                     break
 
                 case 'processing':
-                    time.sleep(5)
+                    playwright_helper.fixed_sleep(5, 'file status poll interval')
                     temp += 1
                     logging.info(f'Count Value Increased to {temp}')
 
                     if temp <= count_time:
                         continue
                     else:
-                        logging.error(f'Waited for {total_wait_time} Seconds, File is not yet processed, So Loop Breaked')
+                        logging.error(f'Waited for {wait_time:.0f} Seconds, File is not yet processed, So Loop Breaked')
                         break
 
                 case 'partially-done':
@@ -343,30 +367,13 @@ class BankStatementPage:
                     logging.info('File Processing Completed, Download button is now Enabled')
                     assert preview_status.strip().lower() == 'preview-enabled'
                     logging.info('File Processing Completed, Preview button is now Enabled')
-                    
-                    working_dir = os.getcwd()
-                    download_folder = os.path.join(working_dir, 'download_output_file', testdata['section'])
-                    
-                    # Handle download using Playwright's download API
-                    with self.page.expect_download() as download_info:
-                        self.page.locator(dynamic_locator_download).click()
-                    download = download_info.value
-                    
-                    # Get the suggested filename from the download
-                    suggested_filename = download.suggested_filename
-                    logging.info(f'Download initiated successfully, URL: {download.url}')
-                    logging.info(f'Suggested filename: {suggested_filename}')
-                    
-                    # Save the file with the correct filename
-                    final_download_path = os.path.join(download_folder, suggested_filename)
-                    download.save_as(final_download_path)
-                    logging.info(f'Output Downloaded Successfully to: {final_download_path}')
+                    self._download_history_row_output(testdata, dynamic_locator_download)
                     break
                     
                 case 'in-queue':
                     logging.error('Invalid File Status Found or Files are in Queue')
                     start_time = time.time()
-                    time.sleep(5)
+                    playwright_helper.fixed_sleep(5, 'file status poll interval')
                     temp += 1
                     logging.info(f'Count Value Increased to {temp}')
 
@@ -378,8 +385,172 @@ class BankStatementPage:
                         logging.error(f'Waited for {elapsed_time:.2f} Seconds, File is not yet processed, So Loop Breaked')
                         break
 
+                case _:
+                    logging.error(f'Unknown File Status {file_status!r} found, So Loop Breaked')
+                    break
+
         return file_status
 
+    def upload_files_in_batch(self, testdata, file_paths):
+        """
+        Upload many files one after another without waiting for their processing,
+        every upload is checked in the History tab and the next one starts from the Upload File tab.
+        Each upload goes through bank_statement_extraction_section_upload, which forgets the earlier status of its file name
+        
+        Args:
+            testdata: Test data dictionary with 'option', 'success_msg', 'tab_name1' and 'tab_name2'
+            file_paths: Paths of the files to upload
+            
+        Returns:
+            list: Per file, the upload details merged with the module history details (filename, ui_dateTime, no_of_page, ...)
+        """
+        uploads = list()
+
+        for index, file_path in enumerate(file_paths):
+            if index:
+                self.pg_home.click_on_tab(testdata['tab_name1'])
+
+            data_dict = self.bank_statement_extraction_section_upload(testdata['option'], file_path)
+            self.verify_file_upload_message(testdata['success_msg'])
+            file_details = self.verify_uploaded_file_on_history_tab(testdata, data_dict['file_name'])
+            uploads.append(dict(file_details, **data_dict))
+            logging.info(f'Uploaded {index + 1} of {len(file_paths)} files, {data_dict["file_name"]} is processing')
+
+        return uploads
+
+    def verify_batch_file_statuses(self, testdata, uploads, timeout=None):
+        """
+        Track the statuses of all the uploaded files together in the History tab (where upload_files_in_batch ends).
+        Every file is verified in the
+        history grid and its output downloaded as soon as it is completed, so the total wait is about the
+        slowest file instead of the sum of all the files
+        
+        Args:
+            testdata: Test data dictionary
+            uploads: Result of upload_files_in_batch
+            timeout: Maximum wait time in seconds for all the files (default: 55 seconds per page of all the files),
+                     the History Tab fallback of the files the API did not report stays within it too
+            
+        Returns:
+            dict: filename -> final file status
+        """
+        pending = {upload['filename']: upload for upload in uploads}
+        timeout = timeout or sum(upload['no_of_page'] for upload in uploads) * 55
+        deadline = time.monotonic() + timeout
+        statuses = dict()
+
+        for filename, api_status in self.status_tracker.iter_final_statuses(
+                list(pending), timeout, refresh=lambda: self._refresh_module_history(testdata)):
+            upload = pending.pop(filename)
+
+            if api_status is None:
+                # Not reported by the API in time, only the history grid is polled for this file,
+                # the status API is not waited on a second time. The batch deadline bounds the polling,
+                # so a wrong file_status_api does not add a full budget per file
+                wait_time = max(0, min(upload['no_of_page'] * 55, deadline - time.monotonic()))
+                logging.warning(f'{filename} Status not reported by the status API, polling the History Tab for {wait_time:.0f}s')
+                statuses[filename] = self._poll_history_row_status(testdata, filename, upload['ui_dateTime'], wait_time)
+            else:
+                statuses[filename] = self._verify_history_row_final_status(testdata, filename, upload['ui_dateTime'], api_status)
+
+            logging.info(f'{filename} finished with {statuses[filename]}, {len(pending)} file(s) still processing')
+
+        return statuses
+
+    def _verify_history_row_final_status(self, testdata, filename: str, date_time: str, status: str):
+        """
+        Check the history grid row of a file that reached a final status, download the output when completed
+        
+        Args:
+            testdata: Test data dictionary
+            filename: Name of the file
+            date_time: DateTime string for file
+            status: Final status reported by the status API
+            
+        Returns:
+            str: Final file status
+        """
+        dynamic_locator_row = f'''//div[@class='row-data'][.//div[@data-testid='{filename}'] and .//div[contains(text(), '{date_time}')]]'''
+        dynamic_locator_status = f'''({dynamic_locator_row}//div[@aria-label='status'])'''
+        dynamic_locator_download = f'''({dynamic_locator_row}//div[@aria-label='download'])'''
+        row_cells = {
+            'download': "div[aria-label='download']",
+            'preview': "div[aria-label='preview']"
+        }
+
+        playwright_helper.is_element_present(dynamic_locator_status, 50)
+        self._wait_for_history_row_status(testdata, dynamic_locator_status, status)
+        row_status = playwright_helper.get_child_attributes(dynamic_locator_row, row_cells, 'data-testid')
+        download_status = (row_status.get('download') or '').strip().lower()
+        preview_status = (row_status.get('preview') or '').strip().lower()
+
+        match status:
+
+            case 'failed':
+                logging.error(f'File Processing Failed for {filename}')
+
+            case 'partially-done':
+                assert download_status == 'download-disabled'
+                assert preview_status == 'preview-disabled'
+                logging.info(f'{filename} Processing Completed, Download and Preview buttons are Disabled')
+
+            case 'completed':
+                assert download_status == 'download-enabled'
+                assert preview_status == 'preview-enabled'
+                logging.info(f'{filename} Processing Completed, Download and Preview buttons are Enabled')
+                self._download_history_row_output(testdata, dynamic_locator_download)
+
+        return status
+
+    def _download_history_row_output(self, testdata, download_locator: str):
+        """
+        Click the download button of a history row and save the output zip
+        
+        Args:
+            testdata: Test data dictionary, the zip is saved to download_output_file/<section>/<option>
+            download_locator: Locator of the enabled download button
+            
+        Returns:
+            str: Path of the saved file
+        """
+        # Handle download using Playwright's download API
+        with self.page.expect_download() as download_info:
+            self.page.locator(download_locator).click()
+        download = download_info.value
+        logging.info(f'Download initiated successfully, URL: {download.url}')
+        logging.info(f'Suggested filename: {download.suggested_filename}')
+
+        # Saved under a unique name, parallel workers never overwrite each other's output
+        final_download_path = pytest.downloads.save(download, testdata['section'], testdata['option'])['path']
+        logging.info(f'Output Downloaded Successfully to: {final_download_path}')
+        return final_download_path
+
+    def _refresh_module_history(self, testdata):
+        """
+        Switch the tabs back and forth so the history grid requests the file statuses again
+        
+        Args:
+            testdata: Test data dictionary with 'tab_name1' and 'tab_name2'
+        """
+        self.pg_home.click_on_tab(testdata['tab_name1'])
+        self.pg_home.click_on_tab(testdata['tab_name2'])
+        playwright_helper.wait_for_network_idle()
+
+    def _wait_for_history_row_status(self, testdata, status_locator: str, status: str):
+        """
+        Wait for the history grid to show the status already reported by the API, the grid may lag behind
+        
+        Args:
+            testdata: Test data dictionary
+            status_locator: Locator of the file status cell
+            status: Status reported by the API
+        """
+        try:
+            playwright_helper.wait_for_attribute_value(status_locator, 'data-testid', status, 5)
+        except TimeoutException:
+            self._refresh_module_history(testdata)
+            playwright_helper.wait_for_attribute_value(status_locator, 'data-testid', status, 30)
+
     def verify_bank_statement_extraction_output(self):
         """Verify bank statement extraction output is displayed"""
         try:
@@ -407,7 +578,7 @@ class BankStatementPage:
                 playwright_helper.is_element_present(self.bank_stmnt_loc.OP_TABLE_HEADER_XPATH)
                 logging.info('Right side Table Column Header is present')
 
-                col_headers_list = [col_header.text_content() for col_header in playwright_helper.get_all_elements(self.bank_stmnt_loc.OP_TABLE_HEADER_XPATH)]
+                col_headers_list = playwright_helper.get_all_text(self.bank_stmnt_loc.OP_TABLE_HEADER_XPATH, strip=False)
                 logging.info(f'Total {len(col_headers_list)} Column Header are showing, those are: - {col_headers_list}')
                 
                 playwright_helper.is_element_present(self.bank_stmnt_loc.OP_TABLE_BODY_XPATH)
@@ -432,7 +603,9 @@ class BankStatementPage:
 
     def unzip_output_and_verify_excel(self, section, option, file_name):
         """
-        Unzip downloaded output file and verify Excel file exists
+        Verify the downloaded output zip in memory: central directory, CRC and member types, then open the
+        Excel files with openpyxl (read-only) and log their sheet names, row counts and headers.
+        Nothing is extracted to disk
         
         Args:
             section: Section name (e.g., 'bank_statement')
@@ -442,26 +615,92 @@ class BankStatementPage:
         Returns:
             Tuple (success: bool, excel_files: list)
         """
-        excel_extensions = ('.xlsx', '.xls', '.xlsm', '.xlsb')
-        working_dir = os.getcwd()
-        zip_file_path = os.path.join(working_dir, 'download_output_file', section, option)
-        zip_file_name = os.listdir(zip_file_path)
-        extract_to = os.path.join(working_dir, 'download_output_file', section, option, 'extracted_output', file_name.split('.')[0])
+        # The zip this test downloaded, not whatever another worker saved into the same folder
+        download = pytest.downloads.get_latest(section, option)
+        assert download, f'No output zip was downloaded for {section}/{option}'
+
+        report = zip_verifier.verify_output_zip(download['path'])
+        logging.info(f"Output zip of {file_name} holds {[member['name'] for member in report['members']]}")
+
+        assert not report['errors'], (
+            f"Output zip of {file_name} is not valid.\n"
+            f"Zip file: {download['path']}\n"
+            f"Errors: {report['errors']}"
+        )
+
+        for excel_file, sheets in report['workbooks'].items():
+            for sheet_name, sheet in sheets.items():
+                logging.info(f"{excel_file} [{sheet_name}]: {sheet['rows']} rows, headers {sheet['headers']}")
+
+        if report['excel_files']:
+            logging.info(f"Output zip verified!!! Found Excel files: {report['excel_files']}")
+            return True, report['excel_files']
+        else:
+            logging.error("No Excel files found in the output zip")
+            return False, []
+
+    def compare_output_table_with_excel(self, section, option, filename: str, date_time: str, max_diffs=20):
+        """
+        Open the Preview of a completed file from module history and diff its output table (bsTable) with the
+        workbook of the downloaded output zip, cell by cell. The grid is read in chunks of rows and the workbook is
+        streamed, every difference is written to report/table_diff/, then the module history is opened again.
+        The workbook has more columns than the grid (statement level and internal ones), the columns of either side
+        without a match are logged, only the aligned cells and the row counts are asserted.
+        Headers named differently on both sides are paired by 'output_column_aliases' of config.json
 
-        os.makedirs(extract_to, exist_ok=True)
+        Args:
+            section: Section name (e.g., 'bank_statement')
+            option: Option name (e.g., 'bank_statement')
+            filename: Name of the file
+            date_time: DateTime string for file
+            max_diffs: Number of differences shown in the failure message
 
-        with zipfile.ZipFile(os.path.join(zip_file_path, zip_file_name[0]), 'r') as zip_ref:
-            zip_ref.extractall(extract_to)
-            
-            excel_files = [file_obj for file_obj in zip_ref.namelist() 
-                        if file_obj.lower().endswith(excel_extensions)]
-            
-            if excel_files:
-                logging.info(f"Unzipped successful!!! Found Excel files: {excel_files}")
-                return True, excel_files
-            else:
-                logging.error("No Excel files found after Unzipped")
-                return False, []
+        Returns:
+            dict: Comparison result, see table_diff.compare_tables
+        """
+        download = pytest.downloads.get_latest(section, option)
+        assert download, f'No output zip was downloaded for {section}/{option}'
+
+        dynamic_locator_preview = f'''(//div[@class='row-data'][.//div[@data-testid='{filename}'] and .//div[contains(text(), '{date_time}')]]//div[@aria-label='preview'])'''
+        playwright_helper.is_element_clickable(dynamic_locator_preview, 50).click()
+        logging.info(f'Clicked on the Preview Button of {filename}')
+        # The extraction output of this file was verified after its upload, only wait for the grid to render
+        playwright_helper.is_element_present(self.bank_stmnt_loc.OP_TABLE_BODY_XPATH, 60)
+
+        ui_headers = playwright_helper.get_all_text(self.bank_stmnt_loc.OP_TABLE_HEADER_XPATH)
+        report_path = os.path.join(
+            os.getcwd(), 'report', 'table_diff',
+            f"{os.path.splitext(os.path.basename(download['path']))[0]}.csv"
+        )
+
+        result = table_diff.compare_tables(
+            ui_headers,
+            playwright_helper.iter_table_cells(self.bank_stmnt_loc.OP_TABLE_BODY_XPATH, cell_selector='td'),
+            table_diff.iter_excel_rows(download['path']),
+            max_diffs=max_diffs,
+            report_path=report_path,
+            column_aliases=pytest.config.get('output_column_aliases')
+        )
+        logging.info(
+            f"Output table of {filename}: {result['ui_rows']} UI rows, {result['excel_rows']} Excel rows, "
+            f"{result['compared_cells']} cells compared, {result['diff_count']} differences"
+        )
+        if result['excel_only_columns']:
+            logging.info(f"Excel only columns (not shown in the grid): {result['excel_only_columns']}")
+
+        assert result['match'], (
+            f"Output table of {filename} does not match the downloaded Excel file.\n"
+            f"Zip file: {download['path']}\n"
+            f"Compared columns (UI, Excel): {result['columns'] or 'none, no grid header matches an Excel header'}\n"
+            f"UI columns without an Excel column: {result['ui_only_columns']}\n"
+            f"Rows: UI {result['ui_rows']}, Excel {result['excel_rows']}\n"
+            f"Differences: {result['diff_count']} (all of them in {report_path})\n"
+            f"First differences: {result['diffs']}"
+        )
+
+        playwright_helper.is_element_clickable(self.bank_stmnt_loc.OP_SCREEN_HISTORY_BTN_XPATH, 30).click()
+        assert playwright_helper.is_element_present(self.bank_stmnt_loc.MODULE_HISTORY_ALL_FILENAME_XPATH, 100)
+        return result
 
     def go_to_support_portal(self):
         """Navigate to support portal by changing URL"""
@@ -471,7 +710,6 @@ class BankStatementPage:
         new_url = current_url.replace('extraction', 'history')
         logging.info(f'After replaced New URL is {new_url}')
         self.page.goto(new_url)
-        time.sleep(1)
 
     def search_filename_in_support_portal(self, filename: str, date_time: str):
         """
@@ -482,13 +720,12 @@ class BankStatementPage:
             date_time: DateTime when file was uploaded
         """
         playwright_helper.is_element_present(self.bank_stmnt_loc.PAGE_SIZE_XPATH, 40)
-        time.sleep(1)
         playwright_helper.select_element_by_value(self.bank_stmnt_loc.PAGE_SIZE_XPATH, '100')
-        time.sleep(2)
+        playwright_helper.wait_for_network_idle()
         
         search_bar = playwright_helper.is_element_clickable(self.bank_stmnt_loc.SP_SEARCH_BAR_CSS, 20)
         search_bar.fill(filename)
-        time.sleep(2)
+        playwright_helper.wait_for_network_idle()
         
         dynamic_locator = f'''//tr[.//td[@data-testid='{filename}'] and .//td[@data-testid='{date_time}'] and .//td[@data-testid='completed']]'''
         logging.info(f'Dynamic Locator created for Support Portal {dynamic_locator}')
@@ -1,7 +1,7 @@
 import os
-import time
 import logging
 from helper import playwright_helper
+from helper.playwright_exceptions import TimeoutException
 from locators.home_page_locators import HomePageLocators
 
 
@@ -23,7 +23,6 @@ class exampleHomePage:
             section: Name of the section to navigate to
         """
         logging.warning(f'The current section to be found {section}')
-        time.sleep(1)
         
         match section.lower():
             
@@ -61,7 +60,6 @@ class exampleHomePage:
                 
             case 'classification':
                 playwright_helper.scroll_to_element(self.home_loc.CLASSIFICATION_BTN_XPATH)
-                time.sleep(1)
                 playwright_helper.is_element_clickable(self.home_loc.CLASSIFICATION_BTN_XPATH).click()
                 logging.info('Classification Section Selected')
                 
@@ -83,8 +81,11 @@ class exampleHomePage:
             case _:
                 logging.error('Side Bar not present')
             
-        playwright_helper.is_element_clickable(self.home_loc.SIDE_BAR_BTN_CSS, 10).click()
-        time.sleep(2)
+        # The icon is re-rendered on toggle, wait for the change instead of a fixed delay
+        playwright_helper.wait_for_dom_mutation(
+            self.home_loc.SIDE_BAR_CONTAINER_CSS,
+            trigger=lambda: playwright_helper.is_element_clickable(self.home_loc.SIDE_BAR_BTN_CSS, 10).click()
+        )
         attr_value2 = playwright_helper.is_element_clickable(self.home_loc.SIDE_BAR_BTN_CSS).get_attribute('data-icon')
         logging.info(f'After clicked, side bar value is {attr_value2}')
         
@@ -103,10 +104,10 @@ class exampleHomePage:
         Returns:
             filepath: The uploaded file path
         """
-        time.sleep(1)
         # Playwright handles file uploads using set_input_files
         self.page.locator(self.home_loc.UPLOAD_FILE_XPATH).set_input_files(filepath)
-        time.sleep(2)
+        # Next button gets enabled once the file is accepted by the page
+        playwright_helper.wait_for_element_state(self.home_loc.NEXT_BTN_XPATH, 'enabled', 20)
         
         logging.info(f'{filepath} file uploaded successfully')
         
@@ -115,14 +116,12 @@ class exampleHomePage:
     def click_on_next_btn(self):
         """Click on Next button"""
         playwright_helper.scroll_to_element(self.home_loc.NEXT_BTN_XPATH)
-        time.sleep(1)
         playwright_helper.is_element_clickable(self.home_loc.NEXT_BTN_XPATH).click()
         logging.info('Clicked on the Next Button')
 
     def click_on_submit_btn(self):
         """Click on Submit button"""
         playwright_helper.scroll_to_element(self.home_loc.SUBMIT_BTN_XPATH)
-        time.sleep(1)
         playwright_helper.is_element_clickable(self.home_loc.SUBMIT_BTN_XPATH).click()
         logging.info('Clicked on the Submit Button')
         
@@ -146,7 +145,9 @@ class exampleHomePage:
         Returns:
             int: Number of pages selected
         """
-        time.sleep(4)
+        # PDF preview renders page by page, wait for the first page and the rendering requests to settle
+        playwright_helper.wait_for_element_state(self.home_loc.SELECT_PAGE_XPATH, 'visible', 30)
+        playwright_helper.wait_for_network_idle(10)
         all_pages = playwright_helper.get_all_elements(self.home_loc.SELECT_PAGE_XPATH)
         length = len(all_pages)
         logging.info(f'Total number of pages to be selected {length}')
@@ -155,15 +156,12 @@ class exampleHomePage:
             dynamic_locator = f'''(//button[@class='select_pdf_page_container']//canvas[contains(@class,'canvas')])[{index}]'''
             logging.info(f'Clicked over dynamic locator {dynamic_locator}')
             self.page.locator(dynamic_locator).click()
-            time.sleep(1)
             if index >= 4:
                 logging.warning(f'Number of pages selected {index}, so loop breaked')
                 break
         
         playwright_helper.scroll_to_element(self.home_loc.SUBMIT_BTN_XPATH)
-        time.sleep(1)
         playwright_helper.is_element_clickable(self.home_loc.SUBMIT_BTN_XPATH).click()
-        time.sleep(2)
         playwright_helper.is_element_clickable(self.home_loc.DISCLAIMER_OKAY_XPATH).click()
         return length
 
@@ -222,10 +220,10 @@ class exampleHomePage:
         Args:
             section_name: Name of the section to verify tabs for
         """
-        time.sleep(3)
+        self._wait_for_tablist()
         # Don't use is_element_clickable for locators that match multiple elements
         # Just get all elements directly
-        all_tabs = playwright_helper.get_all_elements(self.home_loc.OUTPUT_TABLIST_NAME_XPATH)
+        all_tabs = playwright_helper.get_all_text(self.home_loc.OUTPUT_TABLIST_NAME_XPATH, strip=False)
         
         if not all_tabs:
             raise Exception(
@@ -234,7 +232,7 @@ class exampleHomePage:
                 f"Expected to find 'Upload File' and 'History' tabs."
             )
 
-        all_tabs_name = [element.text_content().lower() for element in all_tabs]
+        all_tabs_name = [tab_name.lower() for tab_name in all_tabs]
         logging.info(f'All Tab Names are: {all_tabs_name}')
 
         if 'history' not in all_tabs_name or 'upload file' not in all_tabs_name:
@@ -246,10 +244,22 @@ class exampleHomePage:
         
         logging.info(f'''Both the Tabs are present in {section_name.replace('_', ' ')} home page''')
 
+    def _wait_for_tablist(self, timeout=10):
+        """
+        Wait for the tab list to be rendered, a missing tab list is reported by the caller
+        
+        Args:
+            timeout: Maximum wait time in seconds (default: 10)
+        """
+        try:
+            playwright_helper.wait_for_element_state(self.home_loc.OUTPUT_TABLIST_NAME_XPATH, 'visible', timeout)
+        except TimeoutException:
+            logging.warning('Tab list is not visible yet')
+
     def verify_default_tablist(self):
         """Verify default tab selection"""
-        time.sleep(3)
-        all_tabs = playwright_helper.get_all_elements(self.home_loc.OUTPUT_TABLIST_NAME_XPATH)
+        self._wait_for_tablist()
+        all_tabs = playwright_helper.get_all_text(self.home_loc.OUTPUT_TABLIST_NAME_XPATH)
         
         if not all_tabs:
             raise Exception(
@@ -258,7 +268,7 @@ class exampleHomePage:
                 f"Expected to find at least 'Upload File' tab as default."
             )
         
-        all_tabs_name = [element.text_content().strip().lower() for element in all_tabs]
+        all_tabs_name = [tab_name.lower() for tab_name in all_tabs]
 
         if len(all_tabs_name) == 0:
             raise Exception("No tab names could be extracted from the page.")
@@ -280,9 +290,8 @@ class exampleHomePage:
         """Verify and click history tab"""
         playwright_helper.is_element_clickable(self.home_loc.LAST_TAB_NAME_XPATH, 15)
         playwright_helper.scroll_to_element(self.home_loc.LAST_TAB_NAME_XPATH)
-        time.sleep(1)
         playwright_helper.is_element_clickable(self.home_loc.LAST_TAB_NAME_XPATH).click()
-        time.sleep(2)
+        playwright_helper.wait_for_attribute_value(self.home_loc.HISTORY_TAB_CSS, 'aria-selected', 'true')
         logging.info('Clicked on the Last Tab')
         tab_name = playwright_helper.is_element_clickable(self.home_loc.LAST_TAB_NAME_XPATH, 30).text_content()
         logging.info(f'Current Tab name is {tab_name}')
@@ -304,10 +313,10 @@ class exampleHomePage:
 
             case 'upload_file':
                 playwright_helper.is_element_clickable(self.home_loc.UPLOAD_FILE_TAB_CSS).click()
-                time.sleep(2)
+                playwright_helper.wait_for_attribute_value(self.home_loc.UPLOAD_FILE_TAB_CSS, 'aria-selected', 'true')
                 self.check_tab_attribute_value(tab_name)
 
             case 'history':
                 playwright_helper.is_element_clickable(self.home_loc.HISTORY_TAB_CSS).click()
-                time.sleep(2)
+                playwright_helper.wait_for_attribute_value(self.home_loc.HISTORY_TAB_CSS, 'aria-selected', 'true')
                 self.check_tab_attribute_value(tab_name)
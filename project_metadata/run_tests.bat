@@ -21,7 +21,7 @@ cd ..
 REM Generate dashboard
 echo.
 echo Generating dashboard report...
-python dashboard_generator.py
+python dashboard_generator.py --store report/results.db
 
 echo.
 echo ================================================
@@ -2,12 +2,17 @@ import json
 import logging
 import os
 import sys
+import random
 import pytest
 from datetime import datetime
 
 sys.path[0] = os.getcwd()
 
 from core import playwright_manager
+from mock_app import MockAppServer
+from helper import playwright_helper
+from utility import benchmark, capture_manager, download_manager, login_state_cache, screenshot_store, step_timing, test_artifacts, test_scheduler, utils
+from utility.results_store import ResultsStore
 
 
 def pytest_html_report_title(report):
@@ -23,6 +28,132 @@ def pytest_addoption(parser):
         default='chrome',
         help="options: chrome | firefox | edge | webkit",
     )
+    parser.addoption(
+        "--launch_profile",
+        action="store",
+        default=None,
+        help="options: headless | headed (default: 'launch_profile' from config.json, else headless)",
+    )
+    parser.addoption(
+        "--browser_pool_size",
+        action="store",
+        type=int,
+        default=None,
+        help="number of warm browser processes, each test leases a fresh context (default: 'browser_pool_size' from config.json, else 1)",
+    )
+    parser.addoption(
+        "--env",
+        action="store",
+        default='dev',
+        help="options: dev | test | sandbox | local, environment the tests run against ('local' starts the bundled mock app)",
+    )
+    parser.addoption(
+        "--no_login_cache",
+        action="store_true",
+        default=False,
+        help="always log in through the UI, do not cache or inject the authenticated storage state",
+    )
+    parser.addoption(
+        "--browser_server",
+        action="store_true",
+        default=False,
+        help="start one shared browser server and connect to it (always on when running with pytest-xdist '-n')",
+    )
+    parser.addoption(
+        "--sleep_audit",
+        action="store_true",
+        default=False,
+        help="record every fixed sleep with its call site, summary is written to report/sleep_audit.json",
+    )
+    parser.addoption(
+        "--no_step_timing",
+        action="store_true",
+        default=False,
+        help="do not time the page-object methods and helpers (step timings in the JUnit XML and dashboard)",
+    )
+    parser.addoption(
+        "--no_results_store",
+        action="store_true",
+        default=False,
+        help="do not add this run to the historical results store ('results_store' in config.json)",
+    )
+    parser.addoption(
+        "--testdata_seed",
+        action="store",
+        default=None,
+        help="seed of the test document sampling, the same seed picks the same documents per test (default: random, shown in the header)",
+    )
+    parser.addoption(
+        "--shard",
+        action="store",
+        default=None,
+        help="run one of n shards of about equal historical duration, e.g. '2/4' (upload chains stay in one shard)",
+    )
+    parser.addoption(
+        "--durations_from",
+        action="store",
+        default="report/report*.xml",
+        help="glob of previous JUnit XML reports used, with the results store, for the duration schedule and --shard",
+    )
+    parser.addoption(
+        "--capture_mode",
+        action="store",
+        default=None,
+        choices=capture_manager.CAPTURE_MODES,
+        help="Playwright trace and video of the tests: off | always | on-failure | on-first-retry, kept in report/captures (default: 'capture_mode' from config.json, else off)",
+    )
+    parser.addoption(
+        "--capture_budget_mb",
+        action="store",
+        type=float,
+        default=None,
+        help="disk budget of report/captures, the oldest captures are evicted beyond it (default: 'capture_budget_mb' from config.json, else 500)",
+    )
+    parser.addoption(
+        "--screenshot_format",
+        action="store",
+        default=None,
+        choices=screenshot_store.SCREENSHOT_FORMATS,
+        help="format of the failure screenshots: png | jpeg (default: 'screenshot_format' from config.json, else jpeg)",
+    )
+    parser.addoption(
+        "--screenshot_quality",
+        action="store",
+        type=int,
+        default=None,
+        help="JPEG quality 0-100 of the failure screenshots (default: 'screenshot_quality' from config.json, else 70)",
+    )
+    parser.addoption(
+        "--batch",
+        action="store_true",
+        default=False,
+        help="run the batch extraction test, which uploads and tracks every document of the testdata folder",
+    )
+    parser.addoption(
+        "--async_engine",
+        action="store_true",
+        default=False,
+        help="run the async engine test, which uploads several documents concurrently",
+    )
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="run the framework overhead benchmarks (needs --env local), results are written to report/benchmark.json",
+    )
+    parser.addoption(
+        "--benchmark_rounds",
+        action="store",
+        type=int,
+        default=3,
+        help="number of times every benchmark flow is run, the median of the rounds is compared (default: 3)",
+    )
+    parser.addoption(
+        "--benchmark_update",
+        action="store_true",
+        default=False,
+        help="store the benchmark results as the new baseline instead of comparing against it",
+    )
 
 
 @pytest.fixture(scope='session', autouse=True)
@@ -34,46 +165,210 @@ def setup(request):
     Since autouse is set to 'true' the setup will be run automatically.
     - config (updated in pytest namespace)
     - logger (default session level scope once initiated)
-    - page (updated in pytest namespace)
+    - app_url, app_login (updated in pytest namespace), URL and user of the selected --env
+    - mock_app (updated in pytest namespace), when --env local is given
+    - browser_pool (updated in pytest namespace), warm browsers shared by all the tests
+    - sleep audit, when --sleep_audit or --benchmark is given
+    - step timing of the page-object methods and helpers, unless --no_step_timing is given
+    - benchmark (updated in pytest namespace), step recorder when --benchmark is given
 
     Session level - Teardown:
 
-    - close context, browser, and stop playwright
+    - close pool browsers, and stop playwright
+    - stop the mock app
+    - write the sleep audit report
+    - write the benchmark results, compare them with (or store them as) the baseline
     '''
 
     pytest.config = load_config()
+    pytest.login_cache_enabled = not request.config.getoption("no_login_cache")
+    pytest.step_timing_enabled = not request.config.getoption("no_step_timing")
+
+    if pytest.step_timing_enabled:
+        step_timing.instrument()
 
     setup_custom_logger()
 
-    # Initialize Playwright
-    page, context, browser, playwright = initialize_playwright(
-        request.config.getoption("browser_name")
+    env = request.config.getoption("env")
+    run_benchmark = request.config.getoption("benchmark")
+    benchmark_config = benchmark.get_benchmark_config(pytest.config)
+    pytest.benchmark = benchmark.BenchmarkRecorder() if run_benchmark else None
+
+    # Benchmarks run against the mock app without artificial latency, only the framework time is left
+    mock_app = None
+    if env == 'local':
+        mock_app = start_mock_app(benchmark_config.get('mock_app') if run_benchmark else None)
+    pytest.mock_app = mock_app
+    pytest.app_url = pytest.config[f'{env}_url']
+    pytest.app_login = pytest.config[f'{env}_login']
+
+    sleep_audit = request.config.getoption("sleep_audit")
+    if sleep_audit or run_benchmark:
+        playwright_helper.enable_sleep_audit()
+
+    # Initialize Playwright browser pool
+    pool = initialize_browser_pool(
+        request.config.getoption("browser_name"),
+        request.config.getoption("launch_profile"),
+        request.config.getoption("browser_pool_size")
     )
-    
-    pytest.page = page
-    pytest.context = context
-    pytest.browser = browser
-    pytest.playwright_instance = playwright
+
+    pytest.browser_pool = pool
+    pytest.browser = pool.browsers[0]
+    pytest.playwright_instance = pool.playwright
 
     yield
     
     # Cleanup Playwright resources
-    context.close()
-    browser.close()
-    playwright.stop()
+    pool.close()
+
+    if mock_app:
+        mock_app.stop()
+
+    if sleep_audit:
+        write_sleep_audit()
+
+    if sleep_audit or run_benchmark:
+        playwright_helper.disable_sleep_audit()
+
+    if run_benchmark:
+        request.config._benchmark_regressions = write_benchmark_results(request.config, benchmark_config)
+
+
+@pytest.fixture(autouse=True)
+def browser_context(request, setup):
+    '''
+    Test level - Setup:
+
+    Lease a fresh BrowserContext from the session browser pool, so no cookies,
+    storage or open pages leak from one test into the next.
+    The cached login state of the selected environment is injected when available,
+    so the test starts already authenticated, tests marked uncached_login start without it.
+    - login_cache_used (updated in pytest namespace), False for the uncached_login tests
+    - context (updated in pytest namespace)
+    - page (updated in pytest namespace)
+    - login_state_injected (updated in pytest namespace)
+    - downloads (updated in pytest namespace), saves the downloads of this context to download_output_file
+    - trace and video recording of the context, when --capture_mode records this run
+
+    Test level - Teardown:
+
+    - stop the recording, the trace and videos are kept in report/captures when the capture mode keeps this run
+    - close the leased context, the browser process stays warm for the next test
+    '''
 
+    # A test of the UI login / logout gets its own server session, the shared one is neither used nor ended
+    pytest.login_cache_used = pytest.login_cache_enabled and not request.node.get_closest_marker('uncached_login')
+    storage_state = get_cached_login_state(request.config.getoption("env")) if pytest.login_cache_used else None
+    pytest.login_state_injected = storage_state is not None
 
-def initialize_playwright(browser_name):
+    capture = capture_manager.ContextCapture(
+        request.config._capture_mode,
+        # Set by pytest-rerunfailures, 2 is the first retry
+        getattr(request.node, 'execution_count', 1),
+        budget_mb=request.config._capture_budget_mb
+    )
+
+    context = pytest.browser_pool.lease_context(storage_state=storage_state, **capture.context_options())
+    capture.start(context)
+    pytest.context = context
+    pytest.downloads = download_manager.DownloadManager(context)
+    pytest.page = context.new_page()
+
+    yield pytest.page
+
+    failed = any(getattr(request.node, f'rep_{when}', None) and getattr(request.node, f'rep_{when}').failed for when in ('setup', 'call'))
+    request.node.capture_folder = capture.stop(
+        request.node.name, failed, lambda: pytest.browser_pool.release_context(context)
+    )
+
+
+def initialize_browser_pool(browser_name, profile_name=None, pool_size=None):
     '''
-    Invoking playwright browser for provided browser
+    Invoking playwright browser pool for provided browser
     
     Args:
         browser_name: Browser type ('chrome', 'firefox', 'edge', 'webkit')
+        profile_name: Launch profile ('headless', 'headed'), command line wins over config.json
+        pool_size: Number of warm browsers, command line wins over config.json (default: 1)
+    
+    Returns:
+        BrowserPool: Started browser pool
+    '''
+    launch_profile = load_launch_profile(profile_name)
+    pool_size = pool_size or pytest.config.get('browser_pool_size', 1)
+    manager = playwright_manager.playwright_manager_factory(browser_name, launch_profile)
+
+    # Set by pytest_configure when a shared browser server is running (pytest-xdist workers)
+    ws_endpoint = os.environ.get(playwright_manager.BROWSER_SERVER_ENV)
+
+    if ws_endpoint:
+        logging.info(f"Connecting {pool_size} time(s) to shared {browser_name} browser server {ws_endpoint}")
+    else:
+        logging.info(f"Launching {pool_size} {browser_name} browser(s) with '{launch_profile['name']}' launch profile")
+
+    return playwright_manager.BrowserPool(manager, pool_size, ws_endpoint).start()
+
+
+def start_mock_app(overrides=None):
+    '''
+    Start the bundled mock app with the 'mock_app' settings of config.json and point 'local_url' to it.
+    Every pytest-xdist worker gets its own app (and port), dependent tests share a worker
+
+    Args:
+        overrides: Settings applied over the config.json ones (e.g. the zero latency benchmark settings)
     
     Returns:
-        tuple: (page, context, browser, playwright) objects
+        MockAppServer: Started mock app
+    '''
+    settings = dict(pytest.config.get('mock_app', {}))
+    settings.update(overrides or {})
+    worker = os.environ.get('PYTEST_XDIST_WORKER')
+
+    if worker and settings.get('port'):
+        settings['port'] = int(settings['port']) + int(worker.lstrip('gw')) + 1
+
+    mock_app = MockAppServer(settings)
+    pytest.config['local_url'] = mock_app.start()
+    logging.info(f"Running against the local mock app {pytest.config['local_url']}")
+    return mock_app
+
+
+def get_cached_login_state(env):
+    '''
+    Cached storage state of the environment user, None when missing, expired or disabled
+
+    Args:
+        env: Environment name ('dev', 'test', 'sandbox', 'local'), selects '<env>_url' and '<env>_login' from config.json
+
+    Returns:
+        str: Path of the storage state file or None
+    '''
+    if not pytest.login_cache_enabled or f'{env}_url' not in pytest.config:
+        return None
+
+    return login_state_cache.get_cached_state(
+        pytest.config[f'{env}_url'],
+        pytest.config[f'{env}_login']['email'],
+        pytest.config.get('login_state_ttl_minutes', login_state_cache.DEFAULT_TTL_MINUTES)
+    )
+
+
+def load_launch_profile(profile_name=None, config=None):
+    '''
+    Resolve the launch profile from command line / config.json
+
+    Args:
+        profile_name: Profile name given on command line, None to use config.json
+        config: Configuration dictionary (default: pytest.config)
+
+    Returns:
+        dict: Launch profile with the config.json overrides applied
     '''
-    return playwright_manager.playwright_manager_factory(browser_name).create_browser()
+    config = config or pytest.config
+    name = profile_name or config.get('launch_profile', playwright_manager.DEFAULT_LAUNCH_PROFILE)
+    overrides = config.get('launch_profiles', {}).get(name.lower(), {})
+    return playwright_manager.get_launch_profile(name, overrides)
 
 
 def load_config():
@@ -87,13 +382,76 @@ def load_config():
         return json.load(f)
 
 
+def write_sleep_audit():
+    '''
+    Write the recorded fixed sleeps to report/sleep_audit.json (one file per pytest-xdist worker)
+    
+    Returns:
+        str: Path of the written report
+    '''
+    records = playwright_helper.get_sleep_audit()
+    worker = os.environ.get('PYTEST_XDIST_WORKER')
+    file_name = f'sleep_audit_{worker}.json' if worker else 'sleep_audit.json'
+    report_path = os.path.join(os.getcwd(), 'report', file_name)
+    os.makedirs(os.path.dirname(report_path), exist_ok=True)
+
+    with open(report_path, 'w') as f:
+        json.dump({
+            'total_seconds': round(sum(record['seconds'] for record in records), 2),
+            'sleeps': records
+        }, f, indent=4)
+
+    for record in records:
+        logging.warning(
+            f"Fixed sleep {record['seconds']:.1f}s in {record['count']} call(s) at {record['call_site']} {record['reason']}"
+        )
+
+    return report_path
+
+
+def write_benchmark_results(config, benchmark_config):
+    '''
+    Write the benchmark step timings to report/benchmark.json and compare them with the baseline,
+    with --benchmark_update the results are stored as the new baseline instead
+
+    Args:
+        config: pytest config object
+        benchmark_config: Benchmark settings (benchmark.get_benchmark_config)
+
+    Returns:
+        list: Steps whose overhead regressed beyond the threshold
+    '''
+    results = pytest.benchmark.results()
+    environment = {
+        'browser': config.getoption('browser_name'),
+        'launch_profile': config.getoption('launch_profile') or pytest.config.get('launch_profile'),
+        'login_cache': pytest.login_cache_enabled,
+        'rounds': config.getoption('benchmark_rounds')
+    }
+    baseline_path = os.path.join(os.getcwd(), benchmark_config['baseline'])
+    benchmark.write_results(os.path.join(os.getcwd(), 'report', 'benchmark.json'), results, environment)
+
+    if config.getoption('benchmark_update'):
+        benchmark.update_baseline(baseline_path, results, environment)
+        logging.info(f'Benchmark baseline updated {baseline_path}')
+        return []
+
+    return benchmark.find_regressions(
+        results, benchmark.load_baseline(baseline_path), benchmark_config['threshold_percent'], benchmark_config['min_regression_seconds']
+    )
+
+
 def setup_custom_logger():
     '''
     Generates custom log report file of each testcase
     '''
     logger = logging.getLogger()
+
+    # Every pytest-xdist worker writes its own log, otherwise they truncate each other's file
+    worker_id = os.environ.get('PYTEST_XDIST_WORKER')
+    log_file = f'custom_logfile_{worker_id}.log' if worker_id else 'custom_logfile.log'
     
-    file_handler = logging.FileHandler('custom_logfile.log', mode="w")
+    file_handler = logging.FileHandler(log_file, mode="w")
     formatter = logging.Formatter("%(asctime)s :%(levelname)s : %(name)s : %(message)s")
     file_handler.setFormatter(formatter)
     logger.addHandler(file_handler)
@@ -123,41 +481,354 @@ def testdata(shared_datadir, request):
     return json.loads((shared_datadir / file_name).read_text())[function_name]
 
 
+@pytest.fixture
+def artifacts(request):
+    """
+    artifacts passes what a producer test created to its consumer tests, instead of module level globals
+
+    @pytest.mark.produces('bs_pdf_upload')      -> artifacts.publish('bs_pdf_upload', filename=..., ui_dateTime=...)
+    @pytest.mark.consumes('bs_pdf_upload')      -> artifacts['bs_pdf_upload']['filename']
+
+    A consumer whose producer did not pass is skipped before its setup (see pytest_runtest_setup)
+    """
+    return test_artifacts.ArtifactView(
+        request.config._artifact_registry,
+        request.node.nodeid,
+        test_artifacts.get_marker_names(request.node, test_artifacts.PRODUCES_MARKER),
+        test_artifacts.get_marker_names(request.node, test_artifacts.CONSUMES_MARKER)
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Skip a consumer test whose artifacts are missing, before a browser context is leased for it"""
+    for name in test_artifacts.get_marker_names(item, test_artifacts.CONSUMES_MARKER):
+        reason = item.config._artifact_registry.get_missing_reason(name)
+        if reason:
+            pytest.skip(reason)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """
+    Time the page-object methods and helpers called by the test body, the spans summed per call path
+    are attached to the JUnit XML testcase as the 'step_timings' property (read by the dashboard)
+    """
+    if not getattr(pytest, 'step_timing_enabled', False):
+        yield
+        return
+
+    timer = step_timing.StepTimer()
+    timer.start()
+    yield
+    timer.stop()
+    item.user_properties.append((step_timing.PROPERTY_NAME, timer.to_json()))
+
+
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item):
     """
     Extends the PyTest Plugin to take and embed screenshot in html report, whenever test fails.
+    The report of every phase is kept on the item (rep_setup, rep_call), the browser_context teardown reads the outcome
+    from it, and the trace and video kept by --capture_mode are linked from the teardown report.
     """
     pytest_html = item.config.pluginmanager.getplugin('html')
     outcome = yield
     report = outcome.get_result()
     extra = getattr(report, 'extra', [])
+    setattr(item, f'rep_{report.when}', report)
+
+    if report.when in ('setup', 'call') and not report.passed:
+        # Consumers of a producer that failed or was skipped are skipped, not left waiting for its file
+        for name in test_artifacts.get_marker_names(item, test_artifacts.PRODUCES_MARKER):
+            item.config._artifact_registry.mark_failed(name, item.nodeid, report.outcome)
 
     if report.when == 'call':
         xfail = hasattr(report, 'wasxfail')
         if (report.skipped and xfail) or (report.failed and not xfail):
-            # Capture screenshot on failure
-            screenshot_name = f"{item.name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-            
-            # Create screenshots directory in report folder
-            screenshot_dir = os.path.join('report', 'screenshots')
-            os.makedirs(screenshot_dir, exist_ok=True)
-            
-            screenshot_path = os.path.join(screenshot_dir, screenshot_name)
-            
-            # Take screenshot
-            pytest.page.screenshot(path=screenshot_path)
+            # Capture screenshot on failure, written to the content-addressed store by its background thread
+            screenshot_name = item.config._screenshot_store.capture(pytest.page, item.nodeid)
             
             if pytest_html:
-                # Add screenshot to HTML report
-                html = '<div><img src="screenshots/%s" alt="screenshot" style="width:304px;height:228px;" ' \
+                # Add screenshot to HTML report, identical frames of several tests share one file
+                html = '<div><img src="screenshots/%s" alt="screenshot" loading="lazy" style="width:304px;height:228px;" ' \
                        'onclick="window.open(this.src)" align="right"/></div>' % screenshot_name
                 extra.append(pytest_html.extras.html(html))
         
         report.extra = extra
 
+    capture_folder = getattr(item, 'capture_folder', None)
+    if report.when == 'teardown' and capture_folder and pytest_html:
+        # Captures live in report/captures, links are relative to the HTML report in report/
+        links = ' '.join(
+            f'<a href="captures/{os.path.basename(capture_folder)}/{file_name}">{file_name}</a>'
+            for file_name in sorted(os.listdir(capture_folder))
+        )
+        extra.append(pytest_html.extras.html(f'<div>Capture: {links} (open the trace with: playwright show-trace)</div>'))
+        report.extra = extra
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Print the most expensive fixed sleeps recorded by --sleep_audit and the benchmark step timings"""
+    records = playwright_helper.get_sleep_audit()
+
+    if records:
+        terminalreporter.section('sleep audit')
+        for record in records[:10]:
+            terminalreporter.write_line(
+                f"{record['seconds']:7.1f}s  x{record['count']:<4} {record['call_site']}  {record['reason']}"
+            )
+
+    if getattr(pytest, 'benchmark', None):
+        terminalreporter.section('framework overhead benchmark')
+        for name, step in pytest.benchmark.results().items():
+            terminalreporter.write_line(
+                f"{step['overhead_seconds']:7.3f}s  (sleep {step['sleep_seconds']:.3f}s, app {step['app_seconds']:.3f}s, x{step['runs']})  {name}"
+            )
+
+        for regression in getattr(config, '_benchmark_regressions', []):
+            terminalreporter.write_line(
+                f"REGRESSION {regression['step']}: {regression['baseline_seconds']:.3f}s -> "
+                f"{regression['current_seconds']:.3f}s ({regression['growth_percent']}%)", red=True
+            )
+
+
+def pytest_sessionfinish(session):
+    """
+    Fail the run when the benchmark overhead regressed beyond the threshold,
+    keep the outcome of the session for the results store (see ingest_results)
+    """
+    if getattr(session.config, '_benchmark_regressions', None) and session.exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    session.config._session_exitstatus = session.exitstatus
+    session.config._tests_collected = session.testscollected
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """
+    Consumer tests run after their producers, every producer / consumer chain gets its own xdist_group
+    (before pytest-xdist reads the groups), independent chains can run on different workers.
+    Benchmarks only run with --benchmark, the batch extraction only with --batch and the async engine test
+    only with --async_engine, the functional tests are not slowed down by them.
+    With --shard only the tests of the selected shard are kept
+    """
+    items[:] = test_artifacts.order_by_dependencies(items)
+
+    dependency_groups = test_artifacts.get_dependency_groups(items)
+    for item in items:
+        if item.nodeid in dependency_groups and not item.get_closest_marker('xdist_group'):
+            item.add_marker(pytest.mark.xdist_group(dependency_groups[item.nodeid]))
+
+    if not config.getoption('benchmark'):
+        skip_benchmark = pytest.mark.skip(reason='framework overhead benchmark, run with --env local --benchmark')
+        for item in items:
+            if item.get_closest_marker('benchmark'):
+                item.add_marker(skip_benchmark)
+
+    if not config.getoption('batch'):
+        skip_batch = pytest.mark.skip(reason='batch extraction of the whole testdata folder, run with --batch')
+        for item in items:
+            if item.get_closest_marker('batch'):
+                item.add_marker(skip_batch)
+
+    if not config.getoption('async_engine'):
+        skip_async_engine = pytest.mark.skip(reason='concurrent uploads of the async engine, run with --async_engine')
+        for item in items:
+            if item.get_closest_marker('async_engine'):
+                item.add_marker(skip_async_engine)
+
+    shard = config.getoption('shard')
+    if shard:
+        try:
+            shard_index, shard_count = (int(part) for part in shard.split('/'))
+            assert 1 <= shard_index <= shard_count
+        except (ValueError, AssertionError):
+            raise pytest.UsageError(f"--shard expects 'index/count' with 1 <= index <= count, got '{shard}'")
+
+        selected, deselected, seconds = test_scheduler.select_shard(
+            items, load_duration_index(config), shard_index, shard_count
+        )
+        logging.info(f'Shard {shard}: {len(selected)} test(s), about {seconds:.0f}s by the historical durations')
+
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """Hand the xdist_group work units to the workers longest first, by their historical durations"""
+    if config.option.dist == 'loadgroup':
+        return test_scheduler.make_duration_scheduler(config, log, load_duration_index(config))
+
+
+def load_duration_index(config):
+    '''
+    Historical test durations from the results store and the previous JUnit XML reports (--durations_from)
+
+    Args:
+        config: pytest config object
+
+    Returns:
+        DurationIndex: Durations by test
+    '''
+    store_path = load_config().get('results_store')
+    durations = test_scheduler.load_durations(
+        store_path if store_path and os.path.exists(store_path) else None,
+        [config.getoption('durations_from')]
+    )
+    return test_scheduler.DurationIndex(durations)
+
+
+def pytest_generate_tests(metafunc):
+    """Repeat the benchmark flows --benchmark_rounds times"""
+    if 'benchmark_round' in metafunc.fixturenames:
+        rounds = metafunc.config.getoption('benchmark_rounds')
+        metafunc.parametrize('benchmark_round', range(1, rounds + 1), ids=lambda round_no: f'round{round_no}')
+
+
+def pytest_report_header(config):
+    """Show the seed of the test document sampling, re-run with --testdata_seed to pick the same documents"""
+    return f'testdata seed: {os.environ.get(utils.TESTDATA_SEED_ENV)}'
+
 
 def pytest_configure(config):
-    """Configure pytest-html to handle assets properly"""
+    """Configure pytest-html to handle assets properly and start the shared browser server"""
     # This ensures pytest-html can find the screenshots
-    config._metadata = None
\ No newline at end of file
+    config._metadata = None
+
+    # A producer / consumer chain always runs in one process, every process keeps its own artifacts
+    config._artifact_registry = test_artifacts.ArtifactRegistry()
+
+    project_config = load_config()
+    config._capture_mode = config.getoption('capture_mode') or project_config.get('capture_mode', 'off')
+    config._capture_budget_mb = config.getoption('capture_budget_mb') or project_config.get(
+        'capture_budget_mb', capture_manager.DEFAULT_BUDGET_MB
+    )
+    if config._capture_mode not in capture_manager.CAPTURE_MODES:
+        raise pytest.UsageError(f"'capture_mode' in config.json must be one of {capture_manager.CAPTURE_MODES}, got '{config._capture_mode}'")
+    # The retry number comes from pytest-rerunfailures, without retries this mode would silently record nothing
+    if config._capture_mode == 'on-first-retry' and (
+            not config.pluginmanager.hasplugin('rerunfailures') or not getattr(config.option, 'reruns', 0)):
+        raise pytest.UsageError("capture mode 'on-first-retry' needs pytest-rerunfailures and --reruns 1 or more")
+
+    screenshot_format = config.getoption('screenshot_format') or project_config.get('screenshot_format', screenshot_store.DEFAULT_FORMAT)
+    screenshot_quality = config.getoption('screenshot_quality')
+    if screenshot_quality is None:
+        screenshot_quality = project_config.get('screenshot_quality', screenshot_store.DEFAULT_QUALITY)
+    if screenshot_format not in screenshot_store.SCREENSHOT_FORMATS or not 0 <= screenshot_quality <= 100:
+        raise pytest.UsageError(
+            f"screenshots must be one of {screenshot_store.SCREENSHOT_FORMATS} with a quality of 0-100, "
+            f"got '{screenshot_format}' / {screenshot_quality}"
+        )
+    # pytest-xdist workers inherit the run id of the controller, all the frames of a run share it in the index
+    os.environ.setdefault(screenshot_store.RUN_ID_ENV, datetime.now().strftime('%Y%m%d_%H%M%S'))
+    config._screenshot_store = screenshot_store.ScreenshotStore(image_format=screenshot_format, quality=screenshot_quality)
+
+    # pytest-xdist workers inherit the seed of the controller through the environment
+    testdata_seed = config.getoption('testdata_seed') or os.environ.get(utils.TESTDATA_SEED_ENV) or str(random.randrange(10**6))
+    os.environ[utils.TESTDATA_SEED_ENV] = testdata_seed
+    utils.set_testdata_seed(testdata_seed)
+
+    # pytest-xdist workers only connect to the server started by the controller process
+    if hasattr(config, 'workerinput'):
+        return
+
+    numprocesses = getattr(config.option, 'numprocesses', None)
+
+    if config.getoption('benchmark'):
+        if config.getoption('env') != 'local':
+            raise pytest.UsageError('--benchmark measures the framework overhead against the mock app, run it with --env local')
+        if numprocesses:
+            # Timings of parallel workers compete for the CPU, they are not comparable with the baseline
+            raise pytest.UsageError('--benchmark can not be combined with pytest-xdist -n')
+        # Without a baseline nothing is compared, the run would pass whatever the overhead
+        baseline_path = os.path.join(os.getcwd(), benchmark.get_benchmark_config(project_config)['baseline'])
+        if not config.getoption('benchmark_update') and not benchmark.load_baseline(baseline_path):
+            raise pytest.UsageError(
+                f'No benchmark baseline at {baseline_path}, record one against the mock app with --benchmark_update'
+            )
+
+    if numprocesses and getattr(config.option, 'dist', 'no') == 'load':
+        # Dependent tests (upload -> support portal -> module history) share an xdist_group,
+        # plain 'load' distribution would split them across workers
+        config.option.dist = 'loadgroup'
+
+    if numprocesses or config.getoption('browser_server'):
+        start_browser_server(config)
+
+
+def pytest_unconfigure(config):
+    """
+    Write the queued screenshots, stop the shared browser server, if this process started one,
+    and store the run in the results store
+    """
+    screenshots = getattr(config, '_screenshot_store', None)
+    if screenshots:
+        screenshots.close()
+
+    browser_server = getattr(config, '_browser_server', None)
+
+    if browser_server:
+        browser_server.stop()
+        os.environ.pop(playwright_manager.BROWSER_SERVER_ENV, None)
+
+    # The JUnit XML is complete once the session finished, pytest-xdist workers do not write one
+    if not hasattr(config, 'workerinput'):
+        ingest_results(config)
+
+
+def ingest_results(config):
+    '''
+    Add the JUnit XML of this run to the historical results store ('results_store' in config.json),
+    the dashboard renders duration trends and flakiness from it
+
+    Args:
+        config: pytest config object
+
+    Returns:
+        int: Run id, None when nothing was stored
+    '''
+    store_path = load_config().get('results_store')
+    xml_path = getattr(config.option, 'xmlpath', None)
+
+    if config.getoption('no_results_store') or not store_path or not xml_path or not os.path.exists(xml_path):
+        return None
+
+    # Collect-only, nothing selected, interrupted or broken sessions are not runs, they would distort the trends
+    exitstatus = getattr(config, '_session_exitstatus', None)
+    if config.option.collectonly or not getattr(config, '_tests_collected', 0) or exitstatus not in (
+            pytest.ExitCode.OK, pytest.ExitCode.TESTS_FAILED):
+        return None
+
+    environment = {
+        'env': config.getoption('env'),
+        'browser': config.getoption('browser_name'),
+        'launch_profile': config.getoption('launch_profile'),
+        'workers': getattr(config.option, 'numprocesses', None)
+    }
+
+    try:
+        with ResultsStore(store_path) as store:
+            return store.ingest_junit(xml_path, environment)
+    except Exception as err:
+        logging.warning(f'Run not added to the results store {store_path}: {err}')
+        return None
+
+
+def start_browser_server(config):
+    '''
+    Start one Playwright browser server for the whole run and publish its endpoint
+    to the workers (and this process) through the environment
+
+    Args:
+        config: pytest config object
+    '''
+    launch_profile = load_launch_profile(config.getoption('launch_profile'), load_config())
+    manager = playwright_manager.playwright_manager_factory(config.getoption('browser_name'), launch_profile)
+
+    browser_server = playwright_manager.BrowserServer(manager)
+    os.environ[playwright_manager.BROWSER_SERVER_ENV] = browser_server.start()
+    config._browser_server = browser_server
\ No newline at end of file
@@ -0,0 +1,71 @@
+import asyncio
+import pytest
+from utility import utils
+from core.async_playwright_manager import AsyncBrowserPool, async_playwright_manager_factory, run_async
+from pages.async_login_page import exampleLoginPageAsync
+from pages.async_home_page import exampleHomePageAsync
+from pages.async_bank_statement_page import BankStatementPageAsync
+
+
+'''
+Async engine: N bank statements uploaded and polled at the same time from one process, each in its own
+BrowserContext leased from an AsyncBrowserPool. run_async drives the coroutines from the sync pytest test.
+'''
+
+
+class TestAsyncEngine:
+
+    @pytest.mark.slow
+    @pytest.mark.async_engine
+    def test_concurrent_uploads_with_async_browser_pool(self, request, testdata):
+
+        '''
+        Steps: -
+        1. Start an AsyncBrowserPool with the browser and launch profile of the run
+        2. In N concurrent contexts: Login, Navigate to Bank Statement section and upload a different file
+        3. Verify the success message and the file under History Tab, poll the status until it is final
+        '''
+
+        uploads = testdata['uploads']
+        documents = utils.find_testdata(testdata['option'], 'pdf')[:uploads]
+        assert len(documents) == uploads, f"{uploads} PDF files required in testdata/{testdata['option']}, found {len(documents)}"
+
+        manager = async_playwright_manager_factory(
+            request.config.getoption('browser_name'), pytest.browser_pool.manager.launch_profile)
+
+        statuses = run_async(self._upload_all(manager, [document['path'] for document in documents], testdata))
+
+        for document, status in zip(documents, statuses):
+            assert status != 'failed', f"{document['path']} processing failed"
+            assert status in ('completed', 'partially-done'), f"{document['path']} ended with status {status}"
+
+    async def _upload_all(self, manager, file_paths, testdata):
+
+        pool = await AsyncBrowserPool(manager, max_contexts=len(file_paths)).start()
+        try:
+            return await asyncio.gather(*[self._upload_and_track(pool, path, testdata) for path in file_paths])
+        finally:
+            await pool.close()
+
+    async def _upload_and_track(self, pool, file_path, testdata):
+
+        context = await pool.lease_context()
+        try:
+            page = await context.new_page()
+
+            await exampleLoginPageAsync(page).example_login(
+                pytest.app_url, pytest.app_login['email'], pytest.app_login['password'])
+
+            await exampleHomePageAsync(page).select_section(testdata['section'])
+
+            pg_bank_stmnt = BankStatementPageAsync(page)
+            details = await pg_bank_stmnt.bank_statement_extraction_section_upload(testdata['option'], file_path)
+
+            await pg_bank_stmnt.verify_file_upload_message(testdata['success_msg'])
+
+            history = await pg_bank_stmnt.verify_uploaded_file_on_history_tab(testdata, details['file_name'])
+
+            return await pg_bank_stmnt.verify_file_status_from_module_history(
+                testdata, history['filename'], history['ui_dateTime'], details['no_of_page'])
+        finally:
+            await pool.release_context(context)
@@ -0,0 +1,144 @@
+import os
+import pytest
+from pages.login_page import exampleLoginPage
+from pages.home_page import exampleHomePage
+from pages.bank_statement_page import BankStatementPage
+
+
+'''
+Framework overhead benchmarks, run with: pytest --env local --benchmark -m benchmark
+The flows run against the mock app without artificial latency, every page-object call is one timed step.
+Store a baseline with --benchmark_update, later runs fail when a step got slower than the threshold.
+'''
+
+
+@pytest.mark.benchmark
+class TestFrameworkOverhead:
+
+    @pytest.fixture
+    def initialize_pages(self):
+
+        self.pg_login = exampleLoginPage(pytest.page)
+        self.pg_home = exampleHomePage(pytest.page)
+        self.pg_bank_stmnt = BankStatementPage(pytest.page)
+
+    def _login(self):
+        with pytest.benchmark.step('login_page.example_login'):
+            self.pg_login.example_login(
+                pytest.app_url, pytest.app_login['email'], pytest.app_login['password'])
+
+    def _logout(self):
+        with pytest.benchmark.step('login_page.example_logout'):
+            self.pg_login.example_logout()
+
+    @pytest.mark.uncached_login
+    def test_benchmark_login_logout(self, initialize_pages, testdata, benchmark_round):
+        '''
+        Steps: -
+        1. Login into the Application through the Sign In page
+        2. Logout from the Application through the Profile menu
+        '''
+
+        # Own step names, the cached login of the other flows is timed as login_page.example_login
+        with pytest.benchmark.step('login_page.example_login[ui]'):
+            self.pg_login.example_login(
+                pytest.app_url, pytest.app_login['email'], pytest.app_login['password'])
+
+        with pytest.benchmark.step('login_page.example_logout[ui]'):
+            self.pg_login.example_logout()
+
+    def test_benchmark_section_navigation(self, initialize_pages, testdata, benchmark_round):
+        '''
+        Steps: -
+        1. Login into the Application and Navigate to Bank Statement section
+        2. Verify the side bar, the tablist, the default tab and the History tab
+        '''
+
+        self._login()
+
+        with pytest.benchmark.step('home_page.select_section'):
+            self.pg_home.select_section(testdata['section'])
+
+        with pytest.benchmark.step('home_page.verify_side_bar'):
+            self.pg_home.verify_side_bar()
+
+        with pytest.benchmark.step('home_page.verify_tablist'):
+            self.pg_home.verify_tablist(testdata['section'])
+
+        with pytest.benchmark.step('home_page.verify_default_tablist'):
+            self.pg_home.verify_default_tablist()
+
+        with pytest.benchmark.step('home_page.verify_home_page_history_tab'):
+            self.pg_home.verify_home_page_history_tab()
+
+        self._logout()
+
+    def test_benchmark_module_history(self, initialize_pages, testdata, benchmark_round):
+        '''
+        Steps: -
+        1. Login into the Application and Navigate to Bank Statement section
+        2. Read the History Tab file names and search the first one
+        3. Open the output screen of a file and go back with the Back button
+        '''
+
+        self._login()
+
+        self.pg_home.select_section(testdata['section'])
+
+        self.pg_home.verify_home_page_history_tab()
+
+        with pytest.benchmark.step('bank_statement_page.verify_history_sections'):
+            lst_of_file_name = self.pg_bank_stmnt.verify_history_sections()
+
+        with pytest.benchmark.step('bank_statement_page.verify_search_bar_module_history_section'):
+            self.pg_bank_stmnt.verify_search_bar_module_history_section(lst_of_file_name[0])
+
+        with pytest.benchmark.step('bank_statement_page.verify_back_btn_from_OP_screen'):
+            self.pg_bank_stmnt.verify_back_btn_from_OP_screen()
+
+        self._logout()
+
+    def test_benchmark_upload_and_support_portal(self, initialize_pages, testdata, benchmark_round):
+        '''
+        Steps: -
+        1. Login into the Application and Navigate to Bank Statement section
+        2. Upload a File, Select the pages and check the success message
+        3. Check the uploaded file in the History Tab and wait until it is processed
+        4. Open the file from the Support portal and Submit it
+        '''
+
+        self._login()
+
+        self.pg_home.select_section(testdata['section'])
+
+        file_path = os.path.join(os.getcwd(), 'testdata', testdata['option'], testdata['file_name'])
+
+        with pytest.benchmark.step('bank_statement_page.bank_statement_extraction_section_upload'):
+            data_dict = self.pg_bank_stmnt.bank_statement_extraction_section_upload(testdata['option'], file_path)
+
+        with pytest.benchmark.step('bank_statement_page.verify_file_upload_message'):
+            self.pg_bank_stmnt.verify_file_upload_message(testdata['success_msg'])
+
+        with pytest.benchmark.step('bank_statement_page.verify_uploaded_file_on_history_tab'):
+            file_details = self.pg_bank_stmnt.verify_uploaded_file_on_history_tab(testdata, data_dict['file_name'])
+
+        with pytest.benchmark.step('bank_statement_page.verify_file_status_from_module_history') as step:
+            # The processing window still left is the app's time, plus one refresh of the history grid
+            uploaded = pytest.mock_app.find_file(data_dict['file_name'])
+            step['app_seconds'] = pytest.mock_app.pending_seconds(uploaded) + pytest.mock_app.config['history_poll_seconds']
+            self.pg_bank_stmnt.verify_file_status_from_module_history(
+                testdata, file_details['filename'], file_details['ui_dateTime'], data_dict['no_of_page'])
+
+        with pytest.benchmark.step('bank_statement_page.go_to_support_portal'):
+            self.pg_bank_stmnt.go_to_support_portal()
+
+        with pytest.benchmark.step('bank_statement_page.search_filename_in_support_portal'):
+            self.pg_bank_stmnt.search_filename_in_support_portal(file_details['filename'], file_details['ui_dateTime'])
+
+        with pytest.benchmark.step('bank_statement_page.verify_bank_statement_extraction_output'):
+            self.pg_bank_stmnt.verify_bank_statement_extraction_output()
+
+        with pytest.benchmark.step('bank_statement_page.submit_file_from_output'):
+            self.pg_bank_stmnt.submit_file_from_output()
+
+        self._logout()
@@ -4,9 +4,6 @@ from pages.login_page import exampleLoginPage
 from pages.home_page import exampleHomePage
 from pages.bank_statement_page import BankStatementPage
 
-required_lst = list()
-file_history = dict()
-
 
 class TestBankStatement:
 
@@ -27,7 +24,7 @@ class TestBankStatement:
         '''
 
         self.pg_login.example_login(
-            pytest.config['dev_url'], pytest.config['dev_login']['email'], pytest.config['dev_login']['password'])
+            pytest.app_url, pytest.app_login['email'], pytest.app_login['password'])
 
         self.pg_home.select_section(testdata['section'])
 
@@ -42,7 +39,7 @@ class TestBankStatement:
         '''
         
         self.pg_login.example_login(
-            pytest.config['dev_url'], pytest.config['dev_login']['email'], pytest.config['dev_login']['password'])
+            pytest.app_url, pytest.app_login['email'], pytest.app_login['password'])
 
         self.pg_home.select_section(testdata['section'])
         
@@ -57,7 +54,7 @@ class TestBankStatement:
         '''
 
         self.pg_login.example_login(
-            pytest.config['dev_url'], pytest.config['dev_login']['email'], pytest.config['dev_login']['password'])
+            pytest.app_url, pytest.app_login['email'], pytest.app_login['password'])
 
         self.pg_home.select_section(testdata['section'])
 
@@ -73,7 +70,7 @@ class TestBankStatement:
         '''
 
         self.pg_login.example_login(
-            pytest.config['dev_url'], pytest.config['dev_login']['email'], pytest.config['dev_login']['password'])
+            pytest.app_url, pytest.app_login['email'], pytest.app_login['password'])
 
         self.pg_home.select_section(testdata['section'])
 
@@ -81,7 +78,24 @@ class TestBankStatement:
 
         self.pg_home.verify_home_page_history_tab()
 
-    def test_verify_fileName_shown_under_bank_statement_history_tab(self, initialize_pages, testdata):
+    @pytest.mark.uncached_login
+    def test_verify_logout_ends_the_session(self, initialize_pages):
+        '''
+        Steps: - 
+        1. Login into the Application through the Sign In page
+        2. Logout through the Profile menu, the Sign In page should be shown again
+        '''
+
+        self.pg_login.example_login(
+            pytest.app_url, pytest.app_login['email'], pytest.app_login['password'])
+
+        # Own session without the cached login state, the UI logout does not end the session of the other tests
+        self.pg_login.example_logout()
+
+        self.pg_login.verify_logged_out()
+
+    @pytest.mark.produces("bs_history_file_name")
+    def test_verify_fileName_shown_under_bank_statement_history_tab(self, initialize_pages, testdata, artifacts):
         '''
         Steps: - 
         1. Login into the Application and Navigate to Bank Statement section
@@ -89,14 +103,14 @@ class TestBankStatement:
         '''
 
         self.pg_login.example_login(
-            pytest.config['dev_url'], pytest.config['dev_login']['email'], pytest.config['dev_login']['password'])
+            pytest.app_url, pytest.app_login['email'], pytest.app_login['password'])
 
         self.pg_home.select_section(testdata['section'])
 
         self.pg_home.verify_home_page_history_tab()
 
         lst_of_file_name = self.pg_bank_stmnt.verify_history_sections()
-        required_lst.append(lst_of_file_name[0])
+        artifacts.publish("bs_history_file_name", filename=lst_of_file_name[0])
 
         self.pg_login.example_logout()
 
@@ -108,13 +122,14 @@ class TestBankStatement:
         '''
 
         self.pg_login.example_login(
-            pytest.config['dev_url'], pytest.config['dev_login']['email'], pytest.config['dev_login']['password'])
+            pytest.app_url, pytest.app_login['email'], pytest.app_login['password'])
 
         self.pg_home.select_section(testdata['section'])
 
         self.pg_bank_stmnt.select_bank_statement_extraction_option(testdata['option'])
 
-    def test_verify_bank_statement_search_optn_under_module_history_tab(self, initialize_pages, testdata):
+    @pytest.mark.consumes("bs_history_file_name")
+    def test_verify_bank_statement_search_optn_under_module_history_tab(self, initialize_pages, testdata, artifacts):
         '''
         Steps: - 
         1. Login into the Application and Navigate to Bank Statement section
@@ -122,26 +137,13 @@ class TestBankStatement:
         '''
 
         self.pg_login.example_login(
-            pytest.config['dev_url'], pytest.config['dev_login']['email'], pytest.config['dev_login']['password'])
+            pytest.app_url, pytest.app_login['email'], pytest.app_login['password'])
 
         self.pg_home.select_section(testdata['section'])
 
         self.pg_home.verify_home_page_history_tab()
 
-        if not required_lst:
-            pytest.fail(
-                "Cannot test search functionality: No file name available.\n"
-                "Reason: Previous test 'test_verify_fileName_shown_under_bank_statement_history_tab' "
-                "did not populate required_lst.\n"
-                "This could happen if:\n"
-                "  1. The previous test was skipped or failed\n"
-                "  2. No files exist in history\n"
-                "  3. Tests are not running in the correct order\n"
-                "Tip: Run tests in order or upload a file first."
-            )
-        
-        self.pg_bank_stmnt.verify_search_bar_module_history_section(required_lst[0])
-        required_lst.clear()
+        self.pg_bank_stmnt.verify_search_bar_module_history_section(artifacts["bs_history_file_name"]['filename'])
 
         self.pg_login.example_logout()
 
@@ -155,7 +157,7 @@ class TestBankStatement:
         '''
 
         self.pg_login.example_login(
-            pytest.config['dev_url'], pytest.config['dev_login']['email'], pytest.config['dev_login']['password'])
+            pytest.app_url, pytest.app_login['email'], pytest.app_login['password'])
         
         self.pg_home.select_section(testdata['section'])
 
@@ -175,7 +177,7 @@ class TestBankStatement:
         '''
 
         self.pg_login.example_login(
-            pytest.config['dev_url'], pytest.config['dev_login']['email'], pytest.config['dev_login']['password'])
+            pytest.app_url, pytest.app_login['email'], pytest.app_login['password'])
         
         self.pg_home.select_section(testdata['section'])
 
@@ -185,7 +187,8 @@ class TestBankStatement:
 
         self.pg_login.example_logout()
 
-    def test_verify_disclaimer_popup_should_come_and_uploaded_file_should_show_under_BS_history_tab(self, initialize_pages, testdata):
+    @pytest.mark.produces("bs_pdf_upload")
+    def test_verify_disclaimer_popup_should_come_and_uploaded_file_should_show_under_BS_history_tab(self, initialize_pages, testdata, artifacts):
         '''
         Steps: - 
         1. Login into the Application and Navigate to Bank Statement section
@@ -197,7 +200,7 @@ class TestBankStatement:
         '''
 
         self.pg_login.example_login(
-            pytest.config['dev_url'], pytest.config['dev_login']['email'], pytest.config['dev_login']['password'])
+            pytest.app_url, pytest.app_login['email'], pytest.app_login['password'])
         
         self.pg_home.select_section(testdata['section'])
 
@@ -209,12 +212,12 @@ class TestBankStatement:
         
         self.pg_bank_stmnt.verify_file_status_from_module_history(testdata, file_details['filename'], file_details['ui_dateTime'], data_dict['no_of_page'])
 
-        file_history.update(file_details)
-        file_history.update(data_dict)
+        artifacts.publish("bs_pdf_upload", **file_details, **data_dict)
 
         self.pg_login.example_logout()
 
-    def test_verify_uploaded_file_should_show_under_support_portal(self, initialize_pages, testdata):
+    @pytest.mark.consumes("bs_pdf_upload")
+    def test_verify_uploaded_file_should_show_under_support_portal(self, initialize_pages, testdata, artifacts):
         '''
         Steps: - 
         1. Login into the Application and Navigate to Bank Statement section
@@ -225,12 +228,14 @@ class TestBankStatement:
         6. Submit that file, it should be Submitted and the output screen should be closed
         '''
 
+        upload = artifacts["bs_pdf_upload"]
+
         self.pg_login.example_login(
-            pytest.config['dev_url'], pytest.config['dev_login']['email'], pytest.config['dev_login']['password'])
+            pytest.app_url, pytest.app_login['email'], pytest.app_login['password'])
         
         self.pg_bank_stmnt.go_to_support_portal()
 
-        self.pg_bank_stmnt.search_filename_in_support_portal(file_history['filename'], file_history['ui_dateTime'])
+        self.pg_bank_stmnt.search_filename_in_support_portal(upload['filename'], upload['ui_dateTime'])
 
         self.pg_bank_stmnt.verify_bank_statement_extraction_output()
 
@@ -240,7 +245,8 @@ class TestBankStatement:
 
         self.pg_login.example_logout()
 
-    def test_verify_uploaded_file_should_enabled_from_module_history(self, initialize_pages, testdata):
+    @pytest.mark.consumes("bs_pdf_upload")
+    def test_verify_uploaded_file_should_enabled_from_module_history(self, initialize_pages, testdata, artifacts):
         '''
         Steps: - 
         1. Login into the Application and Navigate to Bank Statement section
@@ -248,28 +254,33 @@ class TestBankStatement:
         3. Status should show Completed Successfully
         4. Click on the Preview Button, Output file should be opened, then close it. Download the output file
         5. Zip Output file should be downloaded, Unzip it and verify Output excel file should be present
+        6. Output table shown by the Preview should match the Output excel file cell by cell
         '''
 
+        upload = artifacts["bs_pdf_upload"]
+
         self.pg_login.example_login(
-            pytest.config['dev_url'], pytest.config['dev_login']['email'], pytest.config['dev_login']['password'])
+            pytest.app_url, pytest.app_login['email'], pytest.app_login['password'])
         
         self.pg_home.select_section(testdata['section'])
 
         self.pg_home.verify_home_page_history_tab()
 
-        self.pg_bank_stmnt.verify_file_status_from_module_history(testdata, file_history['filename'], file_history['ui_dateTime'], file_history['no_of_page'])
+        self.pg_bank_stmnt.verify_file_status_from_module_history(testdata, upload['filename'], upload['ui_dateTime'], upload['no_of_page'])
 
         utils.move_all_download_file_to_current_directory(testdata['section'], testdata['option'])
 
-        self.pg_bank_stmnt.unzip_output_and_verify_excel(testdata['section'], testdata['option'], file_history['filename'])
+        self.pg_bank_stmnt.unzip_output_and_verify_excel(testdata['section'], testdata['option'], upload['filename'])
+
+        self.pg_bank_stmnt.compare_output_table_with_excel(testdata['section'], testdata['option'], upload['filename'], upload['ui_dateTime'])
 
-        utils.remove_files(testdata['section'], testdata['option'])
-        file_history.clear()
+        pytest.downloads.remove_saved()
 
         self.pg_login.example_logout()
 
 
-    def test_verify_disclaimer_popup_should_come_and_uploaded_image_should_show_under_history_tab(self, initialize_pages, testdata):
+    @pytest.mark.produces("bs_image_upload")
+    def test_verify_disclaimer_popup_should_come_and_uploaded_image_should_show_under_history_tab(self, initialize_pages, testdata, artifacts):
         '''
         Steps: - 
         1. Login into the Application and Navigate to Bank Statement section
@@ -280,7 +291,7 @@ class TestBankStatement:
         '''
 
         self.pg_login.example_login(
-            pytest.config['dev_url'], pytest.config['dev_login']['email'], pytest.config['dev_login']['password'])
+            pytest.app_url, pytest.app_login['email'], pytest.app_login['password'])
         
         self.pg_home.select_section(testdata['section'])
 
@@ -292,13 +303,13 @@ class TestBankStatement:
 
         self.pg_bank_stmnt.verify_file_status_from_module_history(testdata, file_details['filename'], file_details['ui_dateTime'], data_dict['no_of_page'])
 
-        file_history.update(file_details)
-        file_history.update(data_dict)
+        artifacts.publish("bs_image_upload", **file_details, **data_dict)
 
         self.pg_login.example_logout()
 
     
-    def test_verify_uploaded_image_should_show_under_support_portal(self, initialize_pages, testdata):
+    @pytest.mark.consumes("bs_image_upload")
+    def test_verify_uploaded_image_should_show_under_support_portal(self, initialize_pages, testdata, artifacts):
         '''
         Steps: - 
         1. Login into the Application and Navigate to Bank Statement section
@@ -309,12 +320,14 @@ class TestBankStatement:
         6. Submit that file, it should be Submitted and the output screen should be closed
         '''
 
+        upload = artifacts["bs_image_upload"]
+
         self.pg_login.example_login(
-            pytest.config['dev_url'], pytest.config['dev_login']['email'], pytest.config['dev_login']['password'])
+            pytest.app_url, pytest.app_login['email'], pytest.app_login['password'])
         
         self.pg_bank_stmnt.go_to_support_portal()
 
-        self.pg_bank_stmnt.search_filename_in_support_portal(file_history['filename'], file_history['ui_dateTime'])
+        self.pg_bank_stmnt.search_filename_in_support_portal(upload['filename'], upload['ui_dateTime'])
 
         self.pg_bank_stmnt.verify_bank_statement_extraction_output()
 
@@ -325,7 +338,8 @@ class TestBankStatement:
         self.pg_login.example_logout()
 
     
-    def test_verify_uploaded_image_should_enabled_from_module_history(self, initialize_pages, testdata):
+    @pytest.mark.consumes("bs_image_upload")
+    def test_verify_uploaded_image_should_enabled_from_module_history(self, initialize_pages, testdata, artifacts):
         '''
         Steps: - 
         1. Login into the Application and Navigate to Bank Statement section
@@ -333,51 +347,58 @@ class TestBankStatement:
         3. Status should show Completed Successfully
         4. Click on the Preview Button, Output file should be opened, then close it. Download the output file
         5. Zip Output file should be downloaded, Unzip it and verify Output excel file should be present
+        6. Output table shown by the Preview should match the Output excel file cell by cell
         '''
 
+        upload = artifacts["bs_image_upload"]
+
         self.pg_login.example_login(
-            pytest.config['dev_url'], pytest.config['dev_login']['email'], pytest.config['dev_login']['password'])
+            pytest.app_url, pytest.app_login['email'], pytest.app_login['password'])
         
         self.pg_home.select_section(testdata['section'])
 
         self.pg_home.verify_home_page_history_tab()
 
-        self.pg_bank_stmnt.verify_file_status_from_module_history(testdata, file_history['filename'], file_history['ui_dateTime'], file_history['no_of_page'])
+        self.pg_bank_stmnt.verify_file_status_from_module_history(testdata, upload['filename'], upload['ui_dateTime'], upload['no_of_page'])
 
         utils.move_all_download_file_to_current_directory(testdata['section'], testdata['option'])
 
-        self.pg_bank_stmnt.unzip_output_and_verify_excel(testdata['section'], testdata['option'], file_history['filename'])
+        self.pg_bank_stmnt.unzip_output_and_verify_excel(testdata['section'], testdata['option'], upload['filename'])
 
-        utils.remove_files(testdata['section'], testdata['option'])
+        self.pg_bank_stmnt.compare_output_table_with_excel(testdata['section'], testdata['option'], upload['filename'], upload['ui_dateTime'])
+
+        pytest.downloads.remove_saved()
 
         self.pg_login.example_logout()
 
-    @pytest.mark.parametrize("file_path", utils.get_list_of_testdata_path('bank_statement'))
-    def _test_verify_bank_statement_extraction_output(self, file_path, initialize_pages, testdata):
+    @pytest.mark.slow
+    @pytest.mark.batch
+    def test_verify_bank_statement_extraction_output(self, initialize_pages, testdata):
         '''
         Steps: - 
         1. Login into the Application and Navigate to Bank Statement section
-        2. Take all those files from respective folder, upload it one after another and wait until it is completed
-        3. Go to History Section, and check Output should be able to open for all the files
+        2. Take all those files from respective folder and upload them one after another, without waiting until each is completed
+        3. Go to History Section and track all the files together, each file is verified and its output downloaded as soon as it is completed
+        4. None of the files should fail the extraction
         '''
 
         self.pg_login.example_login(
-            pytest.config['dev_url'], pytest.config['dev_login']['email'], pytest.config['dev_login']['password'])
+            pytest.app_url, pytest.app_login['email'], pytest.app_login['password'])
 
         self.pg_home.select_section(testdata['section'])
 
-        data_dict = self.pg_bank_stmnt.bank_statement_extraction_section_upload(
-            testdata['option'], file_path)
-        
-        self.pg_bank_stmnt.verify_file_upload_message(testdata['1st_success_msg'])
+        documents = utils.find_testdata(testdata['option'])
 
-        file_details = self.pg_bank_stmnt.verify_uploaded_file_on_history_tab(testdata, data_dict['file_name'])
+        uploads = self.pg_bank_stmnt.upload_files_in_batch(testdata, [document['path'] for document in documents])
 
-        status = self.pg_bank_stmnt.verify_file_status_from_module_history(testdata, file_details['filename'], file_details['ui_dateTime'], data_dict['no_of_page'])
+        # Budget from the catalogue page counts, known before any file is uploaded
+        statuses = self.pg_bank_stmnt.verify_batch_file_statuses(
+            testdata, uploads, timeout=sum(document['pages'] or 1 for document in documents) * 55)
 
-        if status.strip().lower() == 'failed':
+        failed_files = [filename for filename, status in statuses.items() if status.strip().lower() == 'failed']
 
-            pytest.fail('Extraction Failed')
+        if failed_files:
 
-        file_history.update(file_details)
-        file_history.update(data_dict)
\ No newline at end of file
+            pytest.fail(f'Extraction Failed for {failed_files}')
+
+        self.pg_login.example_logout()
@@ -0,0 +1,193 @@
+import os
+import json
+import time
+import logging
+import platform
+import statistics
+from datetime import datetime
+from contextlib import contextmanager
+from helper import playwright_helper
+
+
+'''
+Framework overhead benchmark. The page-object flows run against the local mock app with zero artificial
+latency, so the wall time of a step is what the framework itself costs (helper waits, diagnostics,
+fixed sleeps, reporting). Every step is timed over several rounds, the medians are written to
+report/benchmark.json and compared with a stored baseline: a step slower than the baseline by more than
+the threshold is reported as a regression.
+Time the application really needs (e.g. the processing window of an uploaded file) is given to the
+step as app_seconds and is not counted as overhead.
+'''
+
+DEFAULT_BENCHMARK_CONFIG = {
+    'baseline': 'test_demo/data/benchmark_baseline.json',
+    'threshold_percent': 30,
+    'min_regression_seconds': 0.5
+}
+
+
+class BenchmarkRecorder:
+
+    def __init__(self):
+        self.samples = dict()
+
+    @contextmanager
+    def step(self, name: str):
+        """
+        Time one step of a flow, the same step name can be recorded by many tests and rounds
+
+        Args:
+            name: Step name, the key of the step in the results and the baseline
+
+        Yields:
+            dict: Sample of this run, set 'app_seconds' for time spent waiting on the application
+        """
+        sample = {'app_seconds': 0.0}
+        slept = _slept_seconds()
+        started = time.perf_counter()
+
+        try:
+            yield sample
+        finally:
+            sample['seconds'] = time.perf_counter() - started
+            sample['sleep_seconds'] = _slept_seconds() - slept
+            sample['overhead_seconds'] = max(0.0, sample['seconds'] - sample['app_seconds'])
+            self.samples.setdefault(name, list()).append(sample)
+            logging.info(f"Benchmark step '{name}' took {sample['seconds']:.3f}s, overhead {sample['overhead_seconds']:.3f}s")
+
+    def results(self):
+        """
+        Median timings of every recorded step
+
+        Returns:
+            dict: step name -> runs, median seconds, overhead, sleep and app seconds, min and max overhead
+        """
+        results = dict()
+
+        for name, samples in sorted(self.samples.items()):
+            overheads = [sample['overhead_seconds'] for sample in samples]
+            results[name] = {
+                'runs': len(samples),
+                'seconds': round(statistics.median(sample['seconds'] for sample in samples), 3),
+                'overhead_seconds': round(statistics.median(overheads), 3),
+                'sleep_seconds': round(statistics.median(sample['sleep_seconds'] for sample in samples), 3),
+                'app_seconds': round(statistics.median(sample['app_seconds'] for sample in samples), 3),
+                'min_overhead_seconds': round(min(overheads), 3),
+                'max_overhead_seconds': round(max(overheads), 3)
+            }
+
+        return results
+
+
+def get_benchmark_config(config=None):
+    """
+    Benchmark settings, 'benchmark' from config.json over the defaults
+
+    Args:
+        config: Configuration dictionary (default: empty, defaults only)
+
+    Returns:
+        dict: Benchmark settings
+    """
+    settings = dict(DEFAULT_BENCHMARK_CONFIG)
+    settings.update((config or {}).get('benchmark', {}))
+    return settings
+
+
+def write_results(path: str, results: dict, environment=None):
+    """
+    Write the step results of a run
+
+    Args:
+        path: Output JSON file
+        results: BenchmarkRecorder.results()
+        environment: Run details stored along the results (browser, launch profile, ...)
+
+    Returns:
+        str: Path of the written file
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    with open(path, 'w') as f:
+        json.dump({
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'environment': dict(environment or {}, python=platform.python_version(), platform=platform.platform()),
+            'total_overhead_seconds': round(sum(step['overhead_seconds'] for step in results.values()), 3),
+            'steps': results
+        }, f, indent=4)
+
+    return path
+
+
+def update_baseline(path: str, results: dict, environment=None):
+    """
+    Store the results as baseline, steps not run this time keep their previous baseline
+
+    Args:
+        path: Baseline JSON file
+        results: BenchmarkRecorder.results()
+        environment: Run details stored along the baseline
+
+    Returns:
+        str: Path of the written baseline
+    """
+    steps = load_baseline(path)
+    steps.update(results)
+    return write_results(path, steps, environment)
+
+
+def load_baseline(path: str):
+    """
+    Steps of the stored baseline
+
+    Args:
+        path: Baseline JSON file
+
+    Returns:
+        dict: step name -> baseline timings, empty when no baseline is stored yet
+    """
+    if not os.path.exists(path):
+        return {}
+
+    with open(path) as f:
+        return json.load(f).get('steps', {})
+
+
+def find_regressions(results: dict, baseline: dict, threshold_percent=30, min_regression_seconds=0.5):
+    """
+    Steps whose overhead grew beyond the threshold, steps without baseline are skipped.
+    Both limits have to be exceeded, so fast steps do not fail on a few milliseconds of jitter
+
+    Args:
+        results: BenchmarkRecorder.results()
+        baseline: load_baseline()
+        threshold_percent: Allowed growth of the overhead in percent
+        min_regression_seconds: Allowed growth of the overhead in seconds
+
+    Returns:
+        list: dicts with step, baseline, current and growth in percent, largest growth first
+    """
+    regressions = list()
+
+    for name, step in results.items():
+        if name not in baseline:
+            continue
+
+        expected = baseline[name]['overhead_seconds']
+        current = step['overhead_seconds']
+        growth = current - expected
+
+        if growth > min_regression_seconds and current > expected * (1 + threshold_percent / 100):
+            regressions.append({
+                'step': name,
+                'baseline_seconds': expected,
+                'current_seconds': current,
+                'growth_percent': round(100 * growth / expected, 1) if expected else None
+            })
+
+    return sorted(regressions, key=lambda regression: regression['current_seconds'] - regression['baseline_seconds'], reverse=True)
+
+
+def _slept_seconds():
+    """Total fixed sleep time of the project code so far"""
+    return playwright_helper.get_slept_seconds()
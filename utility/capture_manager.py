@@ -0,0 +1,191 @@
+import os
+import re
+import shutil
+import logging
+import tempfile
+from datetime import datetime
+
+
+'''
+Opt-in Playwright trace and video capture of the leased BrowserContext of a test (--capture_mode).
+  - always: every test is recorded and kept
+  - on-failure: every test is recorded, only failing tests are kept
+  - on-first-retry: only the first retry of a test is recorded (pytest-rerunfailures --reruns), kept when it fails
+The trace (screenshots, DOM snapshots, sources and network, already a compressed zip) is only written when the
+test is kept, tracing.stop() without a path discards it in the browser. Videos are recorded into a temporary
+folder and deleted there for the tests that are not kept, so passing tests write nothing to report/.
+Kept captures go to report/captures/<test>_<time>/, the oldest captures are evicted once the folder exceeds the
+disk budget (--capture_budget_mb).
+'''
+
+CAPTURE_DIR = os.path.join('report', 'captures')
+CAPTURE_MODES = ('off', 'always', 'on-failure', 'on-first-retry')
+DEFAULT_BUDGET_MB = 500
+
+
+class ContextCapture:
+
+    def __init__(self, mode: str, attempt=1, root=CAPTURE_DIR, budget_mb=DEFAULT_BUDGET_MB):
+        """
+        Args:
+            mode: One of CAPTURE_MODES
+            attempt: Run of the test, 1 for the first run, 2 for the first retry
+            root: Output folder of the kept captures (default: report/captures)
+            budget_mb: Disk budget of the output folder in MB
+        """
+        self.mode = mode
+        self.attempt = attempt
+        self.root = os.path.abspath(root)
+        self.budget_bytes = int(budget_mb * 1024 * 1024)
+        self.enabled = should_record(mode, attempt)
+        self.video_dir = tempfile.mkdtemp(prefix='pw_video_') if self.enabled else None
+        self.context = None
+
+    def context_options(self):
+        """
+        Returns:
+            dict: Extra Browser.new_context options, records the videos when capturing
+        """
+        return {'record_video_dir': self.video_dir} if self.enabled else {}
+
+    def start(self, context):
+        """Start tracing the leased context"""
+        if not self.enabled:
+            return
+        self.context = context
+        context.tracing.start(screenshots=True, snapshots=True, sources=True)
+
+    def stop(self, name: str, failed: bool, release):
+        """
+        Stop tracing, close the context through release and keep the trace and videos when required
+
+        Args:
+            name: Test name, used in the capture folder name
+            failed: True when the test failed in its setup or call phase
+            release: Callable closing the context, the videos are only complete once it is closed
+
+        Returns:
+            str: Capture folder, None when nothing was kept
+        """
+        if not self.enabled:
+            release()
+            return None
+
+        keep = should_keep(self.mode, failed)
+        folder = get_capture_path(self.root, name, self.attempt) if keep else None
+        videos = [page.video for page in self.context.pages if page.video]
+
+        try:
+            if keep:
+                self.context.tracing.stop(path=os.path.join(folder, 'trace.zip'))
+            else:
+                self.context.tracing.stop()
+        except Exception as err:
+            logging.warning(f'Trace of {name} could not be stopped: {err}')
+
+        release()
+
+        for index, video in enumerate(videos, start=1):
+            try:
+                if keep:
+                    video.save_as(os.path.join(folder, f'video_{index}.webm'))
+                video.delete()
+            except Exception as err:
+                logging.warning(f'Video of {name} could not be saved: {err}')
+
+        shutil.rmtree(self.video_dir, ignore_errors=True)
+
+        if keep:
+            logging.info(f'Trace and video of {name} kept in {folder}')
+            evicted = enforce_budget(self.root, self.budget_bytes, keep=(folder,))
+            if evicted:
+                logging.info(f'Capture budget exceeded, evicted {len(evicted)} oldest capture(s)')
+        return folder
+
+
+def should_record(mode: str, attempt=1):
+    """True when a test run is recorded in the capture mode"""
+    if mode in ('always', 'on-failure'):
+        return True
+    if mode == 'on-first-retry':
+        return attempt == 2
+    return False
+
+
+def should_keep(mode: str, failed: bool):
+    """True when the capture of a recorded run is kept"""
+    return mode == 'always' or failed
+
+
+def get_capture_path(root: str, name: str, attempt=1):
+    """
+    Unique capture folder of a test run, the folder is created
+
+    Args:
+        root: Output folder, e.g. report/captures
+        name: Test name, e.g. item.name
+        attempt: Run of the test
+
+    Returns:
+        str: e.g. report/captures/test_login_try2_20250101_101010_123456
+    """
+    safe_name = re.sub(r'[^\w.-]+', '_', name)[:100]
+    retry = f'_try{attempt}' if attempt > 1 else ''
+    folder = os.path.join(root, f"{safe_name}{retry}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}")
+    os.makedirs(folder, exist_ok=True)
+    return folder
+
+
+def enforce_budget(root: str, budget_bytes: int, keep=()):
+    """
+    Delete the oldest capture folders until the output folder fits the disk budget
+
+    Args:
+        root: Output folder of the captures
+        budget_bytes: Disk budget in bytes
+        keep: Folders never evicted, e.g. the capture just written
+
+    Returns:
+        list: Evicted folders
+    """
+    keep = {os.path.abspath(folder) for folder in keep}
+    captures = list()
+
+    try:
+        entries = list(os.scandir(root))
+    except FileNotFoundError:
+        return list()
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            try:
+                captures.append((entry.stat().st_mtime, get_folder_size(entry.path), os.path.abspath(entry.path)))
+            except FileNotFoundError:
+                # Evicted by another pytest-xdist worker meanwhile
+                continue
+
+    total = sum(size for _, size, _ in captures)
+    evicted = list()
+
+    for _, size, path in sorted(captures):
+        if total <= budget_bytes:
+            break
+        if path in keep:
+            continue
+        shutil.rmtree(path, ignore_errors=True)
+        total -= size
+        evicted.append(path)
+
+    return evicted
+
+
+def get_folder_size(path: str):
+    """Bytes of the files under a folder"""
+    size = 0
+    for folder, _, files in os.walk(path):
+        for file_name in files:
+            try:
+                size += os.path.getsize(os.path.join(folder, file_name))
+            except FileNotFoundError:
+                continue
+    return size
@@ -0,0 +1,126 @@
+import os
+import uuid
+import logging
+from datetime import datetime
+
+
+'''
+Deterministic download capture. Every page of a leased BrowserContext is watched with page.on('download'),
+Playwright keeps the file in the browser's own temporary downloads folder of that context, and the download is
+saved straight into download_output_file/<section>/<option> under a unique name with download.save_as
+(streamed over the connection when the browser runs in a browser server).
+Nothing in ~/Downloads is listed, renamed or moved, so parallel workers and concurrent downloads can not
+pick up each other's files.
+'''
+
+DOWNLOAD_DIR = 'download_output_file'
+
+
+class DownloadManager:
+
+    def __init__(self, context, root=DOWNLOAD_DIR):
+        """
+        Args:
+            context: Leased BrowserContext, its current and future pages are watched
+            root: Output folder (default: download_output_file/ in the working directory)
+        """
+        self.context = context
+        self.root = os.path.abspath(root)
+        self.saved = list()
+        self._pending = list()
+
+        for page in context.pages:
+            self._watch_page(page)
+        context.on('page', self._watch_page)
+
+    def save(self, download, section: str, option: str, document_type=''):
+        """
+        Save a download into download_output_file/<section>/<option>[/<document_type>] under a unique name
+
+        Args:
+            download: Playwright Download, e.g. the value of page.expect_download()
+            section: Section name, e.g. 'bank_statement'
+            option: Option name, e.g. 'bank_statement'
+            document_type: Optional sub folder (classification)
+
+        Returns:
+            dict: suggested_filename, url, path, section, option, document_type of the saved file
+        """
+        if download in self._pending:
+            self._pending.remove(download)
+
+        path = get_download_path(self.root, download.suggested_filename, section, option, document_type)
+        download.save_as(path)
+
+        record = {
+            'suggested_filename': download.suggested_filename,
+            'url': download.url,
+            'path': path,
+            'section': section,
+            'option': option,
+            'document_type': document_type
+        }
+        self.saved.append(record)
+        logging.info(f'Download {download.suggested_filename} saved to {path}')
+        return record
+
+    def save_pending(self, section: str, option: str, document_type=''):
+        """
+        Save every download of this context that was not saved yet, e.g. started without expect_download
+
+        Returns:
+            list: Records of the saved files, see save
+        """
+        return [self.save(download, section, option, document_type) for download in list(self._pending)]
+
+    def get_latest(self, section: str, option: str, document_type=''):
+        """
+        Last file saved by this context for a section, option and document type
+
+        Args:
+            section: Section name, e.g. 'bank_statement'
+            option: Option name, e.g. 'bank_statement'
+            document_type: Sub folder given to save, '' for the files saved without one
+
+        Returns:
+            dict: Record of the saved file, see save, None when nothing was saved
+        """
+        for record in reversed(self.saved):
+            if (record['section'], record['option'], record['document_type']) == (section, option, document_type):
+                return record
+        return None
+
+    def remove_saved(self):
+        """Delete the files saved by this context only, the files of other workers are left alone"""
+        for record in self.saved:
+            try:
+                os.remove(record['path'])
+            except FileNotFoundError:
+                pass
+        self.saved.clear()
+
+    def _watch_page(self, page):
+        page.on('download', self._pending.append)
+
+
+def get_download_path(root: str, suggested_filename: str, section: str, option: str, document_type=''):
+    """
+    Unique path for a download, the folder is created when missing
+
+    Args:
+        root: Output folder, e.g. download_output_file
+        suggested_filename: File name proposed by the application
+        section: Section name
+        option: Option name
+        document_type: Optional sub folder
+
+    Returns:
+        str: e.g. download_output_file/bank_statement/bank_statement/Statement_20250101_101010_1a2b3c4d.zip
+    """
+    folder = os.path.join(root, section, option, document_type) if document_type else os.path.join(root, section, option)
+    os.makedirs(folder, exist_ok=True)
+
+    stem, extension = os.path.splitext(os.path.basename(suggested_filename) or 'download')
+    # Time for the readers, uuid for the uniqueness across workers and concurrent downloads
+    unique_name = f"{stem}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}{extension}"
+    return os.path.join(folder, unique_name)
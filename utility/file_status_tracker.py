@@ -0,0 +1,208 @@
+import time
+import fnmatch
+import logging
+import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+
+'''
+Push-style file status tracking. The history/status API responses of the application are captured with
+page.on('response') and parsed, so a waiting test resolves as soon as the API reports a final status,
+without reading the history grid or re-clicking the tabs on a fixed interval.
+The API details come from 'file_status_api' in config.json, defaults below.
+'''
+
+DEFAULT_STATUS_API = {
+    'url_pattern': '**/history**',
+    'file_name_field': 'file_name',
+    'status_field': 'status',
+    'refresh_interval': 15
+}
+FINAL_STATUSES = ('completed', 'partially-done', 'failed')
+
+
+class FileStatusTracker:
+
+    def __init__(self, page, api_config=None):
+        """
+        Args:
+            page: Playwright page whose responses are tracked
+            api_config: Overrides of DEFAULT_STATUS_API (default: 'file_status_api' from config.json)
+        """
+        config = dict(DEFAULT_STATUS_API)
+        config.update(api_config if api_config is not None else getattr(pytest, 'config', {}).get('file_status_api', {}))
+
+        self.page = page
+        self.url_pattern = config['url_pattern']
+        self.file_name_field = config['file_name_field']
+        self.status_field = config['status_field']
+        self.refresh_interval = config['refresh_interval']
+        self.statuses = dict()
+        self.api_responses = 0
+        self._pending = list()
+        self._listening = False
+
+    def start(self):
+        """Start capturing the status API responses of the page"""
+        if not self._listening:
+            self.page.on('response', self._on_response)
+            self._listening = True
+
+    def stop(self):
+        """Stop capturing responses"""
+        if self._listening:
+            self.page.remove_listener('response', self._on_response)
+            self._listening = False
+
+    def get_status(self, filename: str):
+        """
+        Latest status reported by the API for a file
+
+        Args:
+            filename: Name of the uploaded file
+
+        Returns:
+            str: Normalized status ('processing', 'completed', ...), None when not reported yet
+        """
+        self._parse_pending()
+        return self.statuses.get(filename.strip().lower())
+
+    def forget(self, filename: str):
+        """
+        Drop the status known for a file name, called before the file is uploaded again, so the final status of an
+        earlier upload of the same name (e.g. a reused test file) does not resolve the wait for the new one.
+        The responses captured so far are parsed first, they describe the earlier uploads
+
+        Args:
+            filename: Name of the file about to be uploaded
+        """
+        self._parse_pending()
+        self.statuses.pop(filename.strip().lower(), None)
+
+    def wait_for_final_status(self, filename: str, timeout: int, refresh=None):
+        """
+        Wait until the API reports completed, partially-done or failed for a file
+
+        Args:
+            filename: Name of the uploaded file
+            timeout: Maximum wait time in seconds
+            refresh: Optional callable making the application request the status again (e.g. a tab switch),
+                     called when no status response arrived within refresh_interval seconds
+
+        Returns:
+            str: Final status, None when it was not reported within timeout, or when the API did not
+                 mention the file at all within two refresh intervals (caller falls back to the UI)
+        """
+        for _, status in self.iter_final_statuses([filename], timeout, refresh):
+            return status
+
+    def iter_final_statuses(self, filenames, timeout: int, refresh=None):
+        """
+        Track many files at once, every file is yielded as soon as the API reports its final status,
+        so the caller can verify or download it while the other files are still processing
+
+        Args:
+            filenames: Names of the uploaded files
+            timeout: Maximum wait time in seconds for all the files
+            refresh: Optional callable making the application request the status again (e.g. a tab switch),
+                     called when no status response arrived within refresh_interval seconds
+
+        Yields:
+            tuple: (filename, final status), status None when it was not reported within timeout, or when the
+                   API did not mention the file at all within two refresh intervals (caller falls back to the UI)
+        """
+        started = time.monotonic()
+        deadline = started + timeout
+        pending = list(filenames)
+
+        while pending:
+            for filename in list(pending):
+                status = self.get_status(filename)
+
+                if status in FINAL_STATUSES:
+                    logging.info(f'{filename} reached {status} according to the status API')
+                    pending.remove(filename)
+                    yield filename, status
+
+                elif status is None and time.monotonic() - started >= 2 * self.refresh_interval:
+                    logging.warning(f'Status API did not mention {filename}, check file_status_api in config.json')
+                    pending.remove(filename)
+                    yield filename, None
+
+            if not pending:
+                return
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                for filename in pending:
+                    logging.error(f'Status API did not report a final status for {filename} within {timeout}s, '
+                                  f'last status {self.get_status(filename)}')
+                    yield filename, None
+                return
+
+            try:
+                # Returns as soon as the next status response arrives, no fixed poll interval
+                self.page.wait_for_event(
+                    'response', predicate=self._is_status_response, timeout=min(remaining, self.refresh_interval)*1000
+                )
+            except PlaywrightTimeoutError:
+                if refresh is not None:
+                    logging.info(f'No status response for {self.refresh_interval}s, refreshing the history')
+                    refresh()
+
+    def _is_status_response(self, response):
+        """
+        True for responses of the status API
+        """
+        return response.request.method != 'OPTIONS' and fnmatch.fnmatch(response.url, self.url_pattern)
+
+    def _on_response(self, response):
+        """
+        Response listener, only collects the matching responses, bodies are read outside the event dispatch
+        """
+        if self._is_status_response(response):
+            self._pending.append(response)
+
+    def _parse_pending(self):
+        """
+        Read the collected responses in arrival order and update the status of every file they mention
+        """
+        while self._pending:
+            response = self._pending.pop(0)
+
+            try:
+                payload = response.json()
+            except Exception:
+                continue
+
+            self.api_responses += 1
+            seen = set()
+
+            # History is listed newest first, older uploads of the same file name must not win
+            for record in self._iter_records(payload):
+                name = str(record[self.file_name_field]).strip().lower()
+                if name not in seen:
+                    seen.add(name)
+                    self.statuses[name] = _normalize_status(record[self.status_field])
+
+    def _iter_records(self, payload):
+        """
+        Yield every object of the payload holding both the file name and the status field, at any depth
+        """
+        if isinstance(payload, dict):
+            if self.file_name_field in payload and self.status_field in payload:
+                yield payload
+            else:
+                for value in payload.values():
+                    yield from self._iter_records(value)
+
+        elif isinstance(payload, list):
+            for item in payload:
+                yield from self._iter_records(item)
+
+
+def _normalize_status(status):
+    """
+    API statuses to the data-testid values of the history grid, e.g. 'PARTIALLY_DONE' -> 'partially-done'
+    """
+    return str(status).strip().lower().replace('_', '-').replace(' ', '-')
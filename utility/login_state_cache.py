@@ -0,0 +1,100 @@
+import os
+import time
+import hashlib
+import logging
+from urllib.parse import urlparse
+
+
+'''
+Cache of authenticated Playwright storage state (cookies + local storage), keyed by environment and user.
+A test logs in through the UI once, the state is persisted to disk and injected into the next contexts,
+so following tests start already authenticated until the state expires or is rejected by the application.
+'''
+
+STATE_DIR = '.auth_state'
+DEFAULT_TTL_MINUTES = 30
+
+
+def get_state_path(url: str, email: str):
+    """
+    Path of the storage state file for an environment and user
+
+    Args:
+        url: Application URL, its host identifies the environment
+        email: User email
+
+    Returns:
+        str: Absolute path of the state file (may not exist yet)
+    """
+    env = urlparse(url).netloc or url
+    key = hashlib.sha1(f'{env}|{email.strip().lower()}'.encode('utf-8')).hexdigest()[:16]
+    file_name = f"{env.replace(':', '_').replace('/', '_')}_{key}.json"
+    return os.path.join(os.getcwd(), STATE_DIR, file_name)
+
+
+def get_cached_state(url: str, email: str, ttl_minutes=DEFAULT_TTL_MINUTES):
+    """
+    Get the cached storage state if present and not expired
+
+    Args:
+        url: Application URL
+        email: User email
+        ttl_minutes: Maximum age of the cached state (default: 30)
+
+    Returns:
+        str: Path of the state file, None when there is no valid cached state
+    """
+    state_path = get_state_path(url, email)
+
+    if not os.path.isfile(state_path):
+        return None
+
+    age = time.time() - os.path.getmtime(state_path)
+
+    if age > ttl_minutes * 60:
+        logging.info(f'Cached login state expired ({int(age)}s old), login required')
+        invalidate_state(url, email)
+        return None
+
+    return state_path
+
+
+def save_state(context, url: str, email: str):
+    """
+    Persist the storage state of an authenticated context
+
+    Args:
+        context: Playwright BrowserContext after a successful login
+        url: Application URL
+        email: User email
+
+    Returns:
+        str: Path of the saved state file
+    """
+    state_path = get_state_path(url, email)
+    os.makedirs(os.path.dirname(state_path), exist_ok=True)
+
+    # Write then rename, parallel workers never read a half written file
+    temp_path = f'{state_path}.{os.getpid()}.tmp'
+    context.storage_state(path=temp_path)
+    os.replace(temp_path, state_path)
+
+    logging.info(f'Login state cached for {email}')
+    return state_path
+
+
+def invalidate_state(url: str, email: str):
+    """
+    Remove the cached storage state, e.g. when the application rejected it
+
+    Args:
+        url: Application URL
+        email: User email
+    """
+    state_path = get_state_path(url, email)
+
+    try:
+        os.remove(state_path)
+        logging.info(f'Cached login state removed for {email}')
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,368 @@
+import os
+import json
+import math
+import sqlite3
+import hashlib
+import platform
+import statistics
+import xml.etree.ElementTree as ET
+from datetime import datetime
+
+
+'''
+Historical results store: every JUnit XML run is ingested into an embedded SQLite database with the per-test
+status, duration and step timings and the environment of the run, so durations and flakiness can be followed
+across runs. Ingesting streams the XML, a run is one transaction and the same report files are not ingested twice.
+Queries only read a window of the last runs through the indexes, so they stay fast with thousands of runs stored.
+'''
+
+DEFAULT_STORE_PATH = 'report/results.db'
+DEFAULT_WINDOW = 50
+FAILED_STATUSES = ('failed', 'errors')
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    run_key TEXT UNIQUE NOT NULL,
+    created TEXT NOT NULL,
+    environment TEXT,
+    total INTEGER DEFAULT 0,
+    passed INTEGER DEFAULT 0,
+    failed INTEGER DEFAULT 0,
+    skipped INTEGER DEFAULT 0,
+    errors INTEGER DEFAULT 0,
+    duration REAL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS tests (
+    id INTEGER PRIMARY KEY,
+    name TEXT UNIQUE NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    test_id INTEGER NOT NULL REFERENCES tests(id),
+    status TEXT NOT NULL,
+    duration REAL NOT NULL,
+    message TEXT
+);
+CREATE TABLE IF NOT EXISTS step_timings (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    test_id INTEGER NOT NULL REFERENCES tests(id),
+    step TEXT NOT NULL,
+    depth INTEGER NOT NULL,
+    calls INTEGER,
+    seconds REAL,
+    round_trips INTEGER,
+    sleep_seconds REAL
+);
+CREATE INDEX IF NOT EXISTS results_run ON results(run_id);
+CREATE INDEX IF NOT EXISTS results_test_run ON results(test_id, run_id);
+CREATE INDEX IF NOT EXISTS step_timings_run ON step_timings(run_id, depth);
+'''
+
+
+class ResultsStore:
+
+    def __init__(self, path=DEFAULT_STORE_PATH):
+        """
+        Args:
+            path: SQLite database file, created with the schema when missing
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+        self._test_ids = dict()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the database connection"""
+        self.connection.close()
+
+    def ingest_junit(self, xml_paths, environment=None):
+        """
+        Store one run made of one or more JUnit XML files (e.g. one per pytest-xdist worker)
+
+        Args:
+            xml_paths: JUnit XML file or list of files
+            environment: Run details (env, browser, launch profile, ...) stored as JSON
+
+        Returns:
+            int: Run id, None when these report files were already ingested or hold no testcase
+        """
+        xml_paths = [xml_paths] if isinstance(xml_paths, str) else list(xml_paths)
+        run_key = _get_run_key(xml_paths)
+        environment = dict(environment or {}, python=platform.python_version(), platform=platform.platform())
+
+        with self.connection:
+            if self.connection.execute('SELECT 1 FROM runs WHERE run_key = ?', (run_key,)).fetchone():
+                return None
+
+            run_id = self.connection.execute(
+                'INSERT INTO runs (run_key, created, environment) VALUES (?, ?, ?)',
+                (run_key, datetime.now().isoformat(timespec='seconds'), json.dumps(environment))
+            ).lastrowid
+            totals = {'total': 0, 'passed': 0, 'failed': 0, 'skipped': 0, 'errors': 0, 'duration': 0.0}
+            results, timings = list(), list()
+
+            for path in xml_paths:
+                for testcase in iter_testcases(path):
+                    test_id = self._get_test_id(f"{testcase['classname']}::{testcase['name']}")
+                    results.append((run_id, test_id, testcase['status'], testcase['duration'], testcase['message']))
+                    timings.extend(
+                        (run_id, test_id, span['step'], span.get('depth', 0), span.get('calls'), span.get('seconds'),
+                         span.get('round_trips'), span.get('sleep_seconds'))
+                        for span in testcase['step_timings']
+                    )
+
+                    totals['total'] += 1
+                    totals[testcase['status']] += 1
+                    totals['duration'] += testcase['duration']
+
+                    if len(results) >= 500:
+                        self._insert_results(results, timings)
+
+            self._insert_results(results, timings)
+
+            # An empty run (nothing selected, interrupted before the first test) would distort the trends
+            if not totals['total']:
+                self.connection.execute('DELETE FROM runs WHERE id = ?', (run_id,))
+                return None
+
+            self.connection.execute(
+                'UPDATE runs SET total = ?, passed = ?, failed = ?, skipped = ?, errors = ?, duration = ? WHERE id = ?',
+                (totals['total'], totals['passed'], totals['failed'], totals['skipped'], totals['errors'],
+                 round(totals['duration'], 3), run_id)
+            )
+
+        return run_id
+
+    def get_runs(self, limit=DEFAULT_WINDOW):
+        """
+        Latest runs, newest first
+
+        Returns:
+            list: dicts with id, created, environment and the totals of the run
+        """
+        rows = self.connection.execute(
+            'SELECT id, created, environment, total, passed, failed, skipped, errors, duration '
+            'FROM runs ORDER BY id DESC LIMIT ?', (limit,)
+        ).fetchall()
+
+        return [
+            {
+                'id': row[0], 'created': row[1], 'environment': json.loads(row[2] or '{}'), 'total': row[3],
+                'passed': row[4], 'failed': row[5], 'skipped': row[6], 'errors': row[7], 'duration': row[8]
+            }
+            for row in rows
+        ]
+
+    def get_duration_stats(self, window=DEFAULT_WINDOW):
+        """
+        Duration statistics of the passed results of every test over the last runs
+
+        Args:
+            window: Number of latest runs taken into account
+
+        Returns:
+            list: dicts with test, runs, p50, p95, last, trend_percent (recent half against older half
+                  of the runs, positive = getting slower) and durations in run order, slowest p95 first
+        """
+        durations = dict()
+        rows = self.connection.execute(
+            'SELECT tests.name, results.duration FROM results JOIN tests ON tests.id = results.test_id '
+            "WHERE results.run_id >= ? AND results.status = 'passed' ORDER BY results.test_id, results.run_id",
+            (self._get_window_start(window),)
+        )
+
+        for name, duration in rows:
+            durations.setdefault(name, list()).append(duration)
+
+        stats = list()
+        for name, values in durations.items():
+            ordered = sorted(values)
+            stats.append({
+                'test': name,
+                'runs': len(values),
+                'p50': round(_percentile(ordered, 50), 3),
+                'p95': round(_percentile(ordered, 95), 3),
+                'last': round(values[-1], 3),
+                'trend_percent': _get_trend_percent(values),
+                'durations': values
+            })
+
+        return sorted(stats, key=lambda stat: stat['p95'], reverse=True)
+
+    def get_flakiness(self, window=DEFAULT_WINDOW):
+        """
+        Failure and flip rates of every test over the last runs, skipped results are ignored.
+        A flip is a pass -> fail or fail -> pass change between two consecutive runs of the test
+
+        Args:
+            window: Number of latest runs taken into account
+
+        Returns:
+            dict: test name -> runs, failures, fail_rate, flips and flip_rate (in percent)
+        """
+        rows = self.connection.execute(
+            f'''
+            SELECT tests.name, COUNT(*), SUM(failed), SUM(previous IS NOT NULL AND previous != failed)
+            FROM (
+                SELECT test_id, status IN {FAILED_STATUSES} AS failed,
+                       LAG(status IN {FAILED_STATUSES}) OVER (PARTITION BY test_id ORDER BY run_id) AS previous
+                FROM results WHERE run_id >= ? AND status != 'skipped'
+            ) JOIN tests ON tests.id = test_id
+            GROUP BY test_id
+            ''',
+            (self._get_window_start(window),)
+        )
+
+        return {
+            name: {
+                'runs': runs,
+                'failures': failures,
+                'fail_rate': round(100 * failures / runs, 1),
+                'flips': flips,
+                'flip_rate': round(100 * flips / (runs - 1), 1) if runs > 1 else 0.0
+            }
+            for name, runs, failures, flips in rows
+        }
+
+    def get_step_stats(self, window=DEFAULT_WINDOW, depth=0, limit=15):
+        """
+        Wall time percentiles of the step timing spans over the last runs, all tests together
+
+        Args:
+            window: Number of latest runs taken into account
+            depth: Span depth, 0 = page-object methods called by the tests
+            limit: Number of steps returned
+
+        Returns:
+            list: dicts with step, samples, p50, p95 and mean round trips, slowest p95 first
+        """
+        samples = dict()
+        rows = self.connection.execute(
+            'SELECT step, seconds / calls, CAST(round_trips AS REAL) / calls FROM step_timings '
+            'WHERE run_id >= ? AND depth = ? AND calls > 0',
+            (self._get_window_start(window), depth)
+        )
+
+        for step, seconds, round_trips in rows:
+            sample = samples.setdefault(step.split(' > ')[-1], {'seconds': list(), 'round_trips': list()})
+            sample['seconds'].append(seconds)
+            sample['round_trips'].append(round_trips)
+
+        stats = list()
+        for step, sample in samples.items():
+            ordered = sorted(sample['seconds'])
+            stats.append({
+                'step': step,
+                'samples': len(ordered),
+                'p50': round(_percentile(ordered, 50), 3),
+                'p95': round(_percentile(ordered, 95), 3),
+                'round_trips': round(statistics.mean(sample['round_trips']), 1)
+            })
+
+        return sorted(stats, key=lambda stat: stat['p95'], reverse=True)[:limit]
+
+    def _get_window_start(self, window):
+        """Smallest run id of the last window runs, the queries filter on it through the run_id indexes"""
+        row = self.connection.execute(
+            'SELECT MIN(id) FROM (SELECT id FROM runs ORDER BY id DESC LIMIT ?)', (window,)
+        ).fetchone()
+        return row[0] or 0
+
+    def _get_test_id(self, name):
+        """Id of a test, inserted on first sight"""
+        if name not in self._test_ids:
+            self.connection.execute('INSERT OR IGNORE INTO tests (name) VALUES (?)', (name,))
+            self._test_ids[name] = self.connection.execute('SELECT id FROM tests WHERE name = ?', (name,)).fetchone()[0]
+        return self._test_ids[name]
+
+    def _insert_results(self, results, timings):
+        """Write the buffered rows and empty the buffers"""
+        self.connection.executemany('INSERT INTO results VALUES (?, ?, ?, ?, ?)', results)
+        self.connection.executemany('INSERT INTO step_timings VALUES (?, ?, ?, ?, ?, ?, ?, ?)', timings)
+        results.clear()
+        timings.clear()
+
+
+def iter_testcases(path):
+    """
+    Stream the testcases of a JUnit XML file, each one is dropped from the tree once read
+
+    Yields:
+        dict: classname, name, status, duration, message and step_timings of a testcase
+    """
+    open_elements = list()
+
+    for event, elem in ET.iterparse(path, events=('start', 'end')):
+        if event == 'start':
+            open_elements.append(elem)
+            continue
+
+        open_elements.pop()
+
+        if elem.tag in ('system-out', 'system-err'):
+            elem.clear()
+        elif elem.tag == 'testcase':
+            yield _read_testcase(elem)
+            elem.clear()
+            if open_elements:
+                open_elements[-1].remove(elem)
+
+
+def _read_testcase(testcase):
+    """Status, duration, failure message and step timings of a testcase element"""
+    status, message = 'passed', None
+
+    for tag, tag_status in (('failure', 'failed'), ('error', 'errors'), ('skipped', 'skipped')):
+        element = testcase.find(tag)
+        if element is not None:
+            status, message = tag_status, (element.get('message') or '')[:500]
+            break
+
+    step_timings = list()
+    for prop in testcase.iter('property'):
+        if prop.get('name') == 'step_timings':
+            try:
+                step_timings = json.loads(prop.get('value') or '[]')
+            except ValueError:
+                pass
+
+    return {
+        'classname': testcase.get('classname', ''),
+        'name': testcase.get('name', ''),
+        'status': status,
+        'duration': float(testcase.get('time', 0) or 0),
+        'message': message,
+        'step_timings': step_timings
+    }
+
+
+def _get_run_key(xml_paths):
+    """Identity of a run: path, size and modification time of its report files"""
+    key = hashlib.sha1()
+    for path in sorted(os.path.abspath(path) for path in xml_paths):
+        stat = os.stat(path)
+        key.update(f'{path}|{stat.st_size}|{stat.st_mtime_ns};'.encode('utf-8'))
+    return key.hexdigest()
+
+
+def _percentile(ordered, percent):
+    """Nearest-rank percentile of an ascending list"""
+    return ordered[max(0, math.ceil(percent / 100 * len(ordered)) - 1)]
+
+
+def _get_trend_percent(values):
+    """Median of the recent half of the runs against the older half in percent, None below 4 runs"""
+    if len(values) < 4:
+        return None
+
+    half = len(values) // 2
+    older, recent = statistics.median(values[:half]), statistics.median(values[-half:])
+    return round(100 * (recent - older) / older, 1) if older else None
@@ -0,0 +1,138 @@
+import os
+import json
+import queue
+import hashlib
+import logging
+import threading
+from datetime import datetime
+
+
+'''
+Content-addressed store of the failure screenshots. The frame is taken on the test thread (the sync Playwright API
+is bound to it) as bytes in the configured format and quality, the name is the SHA-256 of those bytes, and the
+file and its index line are written by a background thread, so the test does not wait for the disk.
+Identical frames (the same failure screen of a test run again and again) are stored once; caret and animations
+are frozen for the screenshot so an unchanged screen encodes to the same bytes.
+Every process appends to its own index_<worker>.jsonl, one line per run / test / frame, load_index merges them.
+'''
+
+SCREENSHOT_DIR = os.path.join('report', 'screenshots')
+SCREENSHOT_FORMATS = ('png', 'jpeg')
+DEFAULT_FORMAT = 'jpeg'
+DEFAULT_QUALITY = 70
+RUN_ID_ENV = 'SCREENSHOT_RUN_ID'
+EXTENSIONS = {'png': '.png', 'jpeg': '.jpg'}
+
+
+class ScreenshotStore:
+
+    def __init__(self, root=SCREENSHOT_DIR, image_format=DEFAULT_FORMAT, quality=DEFAULT_QUALITY, run_id=None):
+        """
+        Args:
+            root: Output folder (default: report/screenshots)
+            image_format: 'png' or 'jpeg'
+            quality: JPEG quality 0-100, not used for png
+            run_id: Run the frames belong to (default: SCREENSHOT_RUN_ID of the environment, else now)
+        """
+        self.root = os.path.abspath(root)
+        self.image_format = image_format
+        self.quality = quality
+        self.run_id = run_id or os.environ.get(RUN_ID_ENV) or datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.index_path = os.path.join(self.root, f"index_{os.environ.get('PYTEST_XDIST_WORKER', 'main')}.jsonl")
+        self._queue = queue.Queue()
+        self._worker = None
+
+    def capture(self, page, test: str):
+        """
+        Screenshot the page and queue it for writing
+
+        Args:
+            page: Playwright Page
+            test: Test id the frame belongs to, e.g. item.nodeid
+
+        Returns:
+            str: File name of the frame inside the store, e.g. 3f2a...c1.jpg
+        """
+        options = {'type': self.image_format, 'animations': 'disabled', 'caret': 'hide', 'scale': 'css'}
+        if self.image_format == 'jpeg':
+            options['quality'] = self.quality
+        return self.add(page.screenshot(**options), test)
+
+    def add(self, image: bytes, test: str):
+        """
+        Queue encoded frame bytes for writing
+
+        Args:
+            image: Encoded frame
+            test: Test id the frame belongs to
+
+        Returns:
+            str: File name of the frame inside the store
+        """
+        file_name = hashlib.sha256(image).hexdigest() + EXTENSIONS[self.image_format]
+
+        if self._worker is None:
+            os.makedirs(self.root, exist_ok=True)
+            self._worker = threading.Thread(target=self._write_frames, name='screenshot-writer', daemon=True)
+            self._worker.start()
+
+        self._queue.put((image, file_name, {
+            'run': self.run_id, 'test': test, 'frame': file_name, 'taken': datetime.now().isoformat(timespec='seconds')
+        }))
+        return file_name
+
+    def close(self):
+        """Write the queued frames and stop the background thread"""
+        if self._worker is not None:
+            self._queue.put(None)
+            self._worker.join()
+            self._worker = None
+
+    def _write_frames(self):
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                return
+
+            image, file_name, record = entry
+            try:
+                path = os.path.join(self.root, file_name)
+                if not os.path.exists(path):
+                    # Complete file or none, another worker may store the same frame meanwhile
+                    temp_path = f'{path}.{threading.get_ident()}.tmp'
+                    with open(temp_path, 'wb') as f:
+                        f.write(image)
+                    os.replace(temp_path, path)
+
+                with open(self.index_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(record) + '\n')
+            except OSError as err:
+                logging.warning(f"Screenshot {file_name} of {record['test']} not stored: {err}")
+
+
+def load_index(root=SCREENSHOT_DIR):
+    """
+    Frames of every run and test, merged from the index files of all the processes
+
+    Args:
+        root: Screenshot store folder
+
+    Returns:
+        dict: run id -> test id -> list of frame file names, in the order they were taken
+    """
+    index = dict()
+
+    try:
+        index_files = sorted(name for name in os.listdir(root) if name.startswith('index_') and name.endswith('.jsonl'))
+    except FileNotFoundError:
+        return index
+
+    records = list()
+    for name in index_files:
+        with open(os.path.join(root, name), encoding='utf-8') as f:
+            records.extend(json.loads(line) for line in f if line.strip())
+
+    for record in sorted(records, key=lambda record: record['taken']):
+        index.setdefault(record['run'], dict()).setdefault(record['test'], list()).append(record['frame'])
+
+    return index
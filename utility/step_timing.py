@@ -0,0 +1,223 @@
+import json
+import time
+import inspect
+import pkgutil
+import logging
+import functools
+import importlib
+import contextvars
+import pages
+from helper import playwright_helper
+
+try:
+    # Private Playwright API, only used to count the protocol messages; without it round trips stay 0
+    from playwright._impl._connection import Connection
+except ImportError:
+    Connection = None
+
+
+'''
+Step timing: the public methods of the page classes in pages/ and the public helpers of
+helper/playwright_helper.py are wrapped once per session, so every call becomes a span with its wall time,
+the Playwright round trips (protocol calls waiting for a reply) and the fixed sleep time spent meanwhile.
+Spans nest by call path, e.g. 'BankStatementPage.verify_history_sections > playwright_helper.is_element_present',
+and are summed per test while it runs, so a polling loop does not grow the record.
+Outside of a test the wrappers only call through.
+'''
+
+PROPERTY_NAME = 'step_timings'
+PATH_SEPARATOR = ' > '
+NOT_TIMED = ('fixed_sleep', 'enable_sleep_audit', 'disable_sleep_audit', 'get_sleep_audit', 'get_slept_seconds')
+
+_current_span = contextvars.ContextVar('step_timing_span', default=None)
+_get_slept_seconds = playwright_helper.get_slept_seconds
+_round_trips = 0
+_instrumented = False
+
+
+class StepTimer:
+
+    def __init__(self):
+        self.spans = dict()
+        self._token = None
+
+    def start(self):
+        """Collect the spans of the calls made from now on (in this thread / task)"""
+        self._token = _current_span.set((self, ''))
+
+    def stop(self):
+        """Stop collecting"""
+        if self._token is not None:
+            _current_span.reset(self._token)
+            self._token = None
+
+    def open_span(self, path: str):
+        """Register a span path in call order, so a parent is listed before its children"""
+        if path not in self.spans:
+            self.spans[path] = {'calls': 0, 'seconds': 0.0, 'round_trips': 0, 'sleep_seconds': 0.0}
+
+    def close_span(self, path: str, seconds: float, round_trips: int, sleep_seconds: float):
+        """Add one finished call to its span"""
+        span = self.spans[path]
+        span['calls'] += 1
+        span['seconds'] += seconds
+        span['round_trips'] += round_trips
+        span['sleep_seconds'] += sleep_seconds
+
+    def results(self):
+        """
+        Spans summed per call path, in call order
+
+        Returns:
+            list: dicts with step (call path), depth, calls, seconds, round_trips and sleep_seconds
+        """
+        return [
+            {
+                'step': path,
+                'depth': path.count(PATH_SEPARATOR),
+                'calls': span['calls'],
+                'seconds': round(span['seconds'], 3),
+                'round_trips': span['round_trips'],
+                'sleep_seconds': round(span['sleep_seconds'], 3)
+            }
+            for path, span in self.spans.items()
+        ]
+
+    def to_json(self):
+        """Results as compact JSON, the value of the JUnit XML testcase property"""
+        return json.dumps(self.results(), separators=(',', ':'))
+
+
+def instrument():
+    """
+    Wrap the public page-object methods and playwright_helper functions, only once per process
+
+    Returns:
+        int: Number of wrapped callables
+    """
+    global _instrumented
+
+    if _instrumented:
+        return 0
+
+    wrapped = 0
+
+    for module_info in pkgutil.iter_modules(pages.__path__):
+        module = importlib.import_module(f'{pages.__name__}.{module_info.name}')
+
+        for cls in vars(module).values():
+            if inspect.isclass(cls) and cls.__module__ == module.__name__:
+                for name, func in list(vars(cls).items()):
+                    if not name.startswith('_') and inspect.isfunction(func):
+                        setattr(cls, name, timed(f'{cls.__name__}.{name}', func))
+                        wrapped += 1
+
+    for name, func in list(vars(playwright_helper).items()):
+        if (not name.startswith('_') and name not in NOT_TIMED and inspect.isfunction(func)
+                and func.__module__ == playwright_helper.__name__):
+            setattr(playwright_helper, name, timed(f'playwright_helper.{name}', func))
+            wrapped += 1
+
+    _patch_round_trips()
+
+    _instrumented = True
+    logging.info(f'Step timing enabled for {wrapped} page-object methods and helpers')
+    return wrapped
+
+
+def timed(name: str, func):
+    """
+    Wrap a function (or coroutine function) into a span of the running StepTimer
+
+    Args:
+        name: Span name, e.g. 'exampleHomePage.select_section'
+        func: Function to wrap
+
+    Returns:
+        Wrapped function
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            current = _current_span.get()
+            if current is None:
+                return await func(*args, **kwargs)
+
+            span = _Span(current, name)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                span.close()
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        current = _current_span.get()
+        if current is None:
+            return func(*args, **kwargs)
+
+        span = _Span(current, name)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            span.close()
+
+    return wrapper
+
+
+class _Span:
+
+    __slots__ = ('timer', 'path', 'token', 'started', 'round_trips', 'slept')
+
+    def __init__(self, current, name):
+        self.timer, parent_path = current
+        self.path = f'{parent_path}{PATH_SEPARATOR}{name}' if parent_path else name
+        self.timer.open_span(self.path)
+        self.token = _current_span.set((self.timer, self.path))
+        self.round_trips = _round_trips
+        self.slept = _get_slept_seconds()
+        self.started = time.perf_counter()
+
+    def close(self):
+        seconds = time.perf_counter() - self.started
+        _current_span.reset(self.token)
+        self.timer.close_span(self.path, seconds, _round_trips - self.round_trips, _get_slept_seconds() - self.slept)
+
+
+def _patch_round_trips():
+    """
+    Count the round trips on the private Connection._send_message_to_server. When the installed Playwright
+    does not have it (or its no_reply parameter), the calls are left untouched and round trips stay 0
+    """
+    if Connection is None:
+        return
+
+    try:
+        send_message = Connection._send_message_to_server
+        parameters = list(inspect.signature(send_message).parameters)
+        # Position of no_reply in the arguments after self
+        no_reply_index = parameters.index('no_reply') - 1
+    except (AttributeError, TypeError, ValueError) as err:
+        logging.warning(f'Playwright round trips not counted, Connection._send_message_to_server not patchable: {err}')
+        return
+
+    Connection._send_message_to_server = _count_round_trips(send_message, no_reply_index)
+
+
+def _count_round_trips(send_message, no_reply_index):
+    """
+    Count every protocol message that waits for a reply, events and no-reply messages are not round trips.
+    The arguments are forwarded as they are, so the wrapper does not depend on the private signature
+    """
+    @functools.wraps(send_message)
+    def wrapper(self, *args, **kwargs):
+        global _round_trips
+        no_reply = kwargs['no_reply'] if 'no_reply' in kwargs else (
+            args[no_reply_index] if len(args) > no_reply_index else False)
+        if not no_reply:
+            _round_trips += 1
+        return send_message(self, *args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,235 @@
+import io
+import os
+import re
+import csv
+import zipfile
+from datetime import datetime, date
+from openpyxl import load_workbook
+
+
+'''
+Cell level comparison of the extraction output grid of the UI (bsTable) with the workbook of the downloaded zip.
+Both sides are streamed: the grid in chunks of rows (playwright_helper.iter_table_cells), the workbook row by row
+with openpyxl in read-only mode. Columns are aligned by header name (or an alias), rows by position. The workbook
+carries more columns than the grid shows (statement level and internal ones such as TRANSACTION_COORDINATES or
+CONFIDENCE), those are only reported, while every grid column must align with a workbook column. Only the counters and the
+first max_diffs differences are kept in memory, every difference is written to the optional CSV report, so
+statements with tens of thousands of transactions are compared in bounded memory.
+'''
+
+DEFAULT_MAX_DIFFS = 100
+NUMBER_TOLERANCE = 0.005
+DATE_FORMATS = ('%m/%d/%Y', '%m-%d-%Y', '%Y-%m-%d', '%d/%m/%Y', '%m/%d/%y')
+WORKBOOK_EXTENSIONS = ('.xlsx', '.xlsm')
+
+
+def compare_tables(ui_headers, ui_row_chunks, excel_rows, max_diffs=DEFAULT_MAX_DIFFS, report_path=None,
+                   column_aliases=None):
+    """
+    Compare the UI grid with the workbook rows
+
+    Args:
+        ui_headers: Header texts of the grid
+        ui_row_chunks: Iterable of row chunks of the grid, e.g. playwright_helper.iter_table_cells
+        excel_rows: Iterator of the workbook rows, the first one holding the headers, e.g. iter_excel_rows
+        max_diffs: Number of differences kept in the result, all of them go to the report
+        report_path: Optional CSV file receiving every difference (row, column, ui, excel)
+        column_aliases: Grid header -> workbook header for the columns whose names differ beyond case, spaces and punctuation
+
+    Returns:
+        dict: columns (aligned header pairs), ui_only_columns, excel_only_columns, ui_rows, excel_rows,
+              compared_cells, diff_count, diffs (first max_diffs) and match (every grid column aligned, same number
+              of rows and no cell differences; the workbook only columns are only reported)
+    """
+    excel_rows = iter(excel_rows)
+    excel_headers = [_to_text(value) for value in next(excel_rows, [])]
+    columns, ui_only, excel_only = align_columns(ui_headers, excel_headers, column_aliases)
+
+    result = {
+        'columns': [(ui_headers[ui_index], excel_headers[excel_index]) for ui_index, excel_index in columns],
+        'ui_only_columns': [ui_headers[index] for index in ui_only],
+        'excel_only_columns': [excel_headers[index] for index in excel_only],
+        'ui_rows': 0,
+        'excel_rows': 0,
+        'compared_cells': 0,
+        'diff_count': 0,
+        'diffs': list()
+    }
+
+    report_file = None
+    writer = None
+    if report_path:
+        os.makedirs(os.path.dirname(os.path.abspath(report_path)), exist_ok=True)
+        report_file = open(report_path, 'w', newline='', encoding='utf-8')
+        writer = csv.writer(report_file)
+        writer.writerow(['row', 'column', 'ui', 'excel'])
+
+    def add_diff(row, column, ui_value, excel_value):
+        result['diff_count'] += 1
+        if len(result['diffs']) < max_diffs:
+            result['diffs'].append({'row': row, 'column': column, 'ui': ui_value, 'excel': excel_value})
+        if writer:
+            writer.writerow([row, column, ui_value, excel_value])
+
+    try:
+        for ui_rows in ui_row_chunks:
+            for ui_row in ui_rows:
+                # Rows numbered like the workbook, the header is row 1
+                row_number = result['ui_rows'] + 2
+                result['ui_rows'] += 1
+                excel_row = _next_data_row(excel_rows)
+
+                if excel_row is None:
+                    add_diff(row_number, '*', ' | '.join(ui_row), '<missing row>')
+                    continue
+
+                result['excel_rows'] += 1
+                for ui_index, excel_index in columns:
+                    ui_value = ui_row[ui_index] if ui_index < len(ui_row) else ''
+                    excel_value = excel_row[excel_index] if excel_index < len(excel_row) else None
+                    result['compared_cells'] += 1
+
+                    if not cells_equal(ui_value, excel_value):
+                        add_diff(row_number, ui_headers[ui_index], ui_value, _to_text(excel_value))
+
+        # Workbook rows the grid does not show
+        for excel_row in iter(lambda: _next_data_row(excel_rows), None):
+            result['excel_rows'] += 1
+            add_diff(result['excel_rows'] + 1, '*', '<missing row>', ' | '.join(_to_text(value) for value in excel_row))
+
+    finally:
+        if report_file:
+            report_file.close()
+
+    result['match'] = (bool(columns) and not ui_only and result['ui_rows'] == result['excel_rows']
+                       and not result['diff_count'])
+    return result
+
+
+def align_columns(ui_headers, excel_headers, column_aliases=None):
+    """
+    Pair the columns of both sides by normalized header name (case, spaces and punctuation ignored),
+    a grid header found in column_aliases is paired with its workbook header
+
+    Returns:
+        tuple: (list of (ui index, excel index) pairs, ui indexes without match, excel indexes without match)
+    """
+    excel_by_name = dict()
+    for index, header in enumerate(excel_headers):
+        excel_by_name.setdefault(_normalize_header(header), index)
+
+    aliases = {_normalize_header(ui): _normalize_header(excel) for ui, excel in (column_aliases or {}).items()}
+
+    pairs, ui_only = list(), list()
+    for index, header in enumerate(ui_headers):
+        name = _normalize_header(header)
+        excel_index = excel_by_name.pop(name, None)
+        if excel_index is None and name in aliases:
+            excel_index = excel_by_name.pop(aliases[name], None)
+        if excel_index is None:
+            ui_only.append(index)
+        else:
+            pairs.append((index, excel_index))
+
+    excel_only = sorted(index for name, index in excel_by_name.items() if name)
+    return pairs, ui_only, excel_only
+
+
+def cells_equal(ui_value: str, excel_value):
+    """
+    True when the grid text shows the workbook value: numbers within NUMBER_TOLERANCE
+    (thousand separators, currency and (negative) notation ignored), dates in any of DATE_FORMATS, text trimmed.
+    An empty cell and a 0 amount are the same, the workbook writes 0 for the debit / credit the grid leaves empty
+    """
+    ui_text = (ui_value or '').strip()
+
+    if excel_value is None or excel_value == '':
+        return ui_text == '' or _parse_number(ui_text) == 0
+
+    if ui_text == '' and _is_number(excel_value):
+        return excel_value == 0
+
+    if isinstance(excel_value, (datetime, date)):
+        excel_date = excel_value.date() if isinstance(excel_value, datetime) else excel_value
+        return _parse_date(ui_text) == excel_date
+
+    ui_number = _parse_number(ui_text)
+    excel_number = excel_value if _is_number(excel_value) else _parse_number(str(excel_value))
+    if ui_number is not None and excel_number is not None:
+        return abs(ui_number - excel_number) <= NUMBER_TOLERANCE
+
+    return ' '.join(ui_text.split()) == ' '.join(str(excel_value).split())
+
+
+def iter_excel_rows(zip_path: str, sheet_name=None):
+    """
+    Stream the rows of the first workbook of an output zip, the workbook is read from memory, nothing is extracted
+
+    Args:
+        zip_path: Downloaded output zip
+        sheet_name: Sheet to read (default: the first sheet)
+
+    Yields:
+        tuple: Cell values of every row, the header row first
+    """
+    with zipfile.ZipFile(zip_path) as archive:
+        members = [name for name in archive.namelist() if name.lower().endswith(WORKBOOK_EXTENSIONS)]
+        if not members:
+            raise AssertionError(f'No workbook found in {zip_path}, members: {archive.namelist()}')
+        # openpyxl needs a seekable file, the compressed member is read into memory once
+        workbook_bytes = io.BytesIO(archive.read(members[0]))
+
+    workbook = load_workbook(workbook_bytes, read_only=True, data_only=True)
+    try:
+        sheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+        yield from sheet.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def _next_data_row(rows):
+    """Next workbook row holding a value, None at the end"""
+    for row in rows:
+        if any(value is not None and value != '' for value in row):
+            return row
+    return None
+
+
+def _normalize_header(header):
+    return re.sub(r'[^0-9a-z]+', '', str(header or '').lower())
+
+
+def _to_text(value):
+    if value is None:
+        return ''
+    if isinstance(value, datetime):
+        return value.strftime('%m/%d/%Y') if value.time() == datetime.min.time() else value.isoformat(sep=' ')
+    if isinstance(value, date):
+        return value.strftime('%m/%d/%Y')
+    return str(value).strip()
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _parse_number(text: str):
+    """'$1,234.50' -> 1234.5, '(12.00)' -> -12.0, None when the text is not a number"""
+    cleaned = text.strip().replace(',', '').replace('$', '').replace(' ', '')
+    negative = cleaned.startswith('(') and cleaned.endswith(')')
+    if negative:
+        cleaned = cleaned[1:-1]
+    try:
+        number = float(cleaned)
+    except ValueError:
+        return None
+    return -number if negative else number
+
+
+def _parse_date(text: str):
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, date_format).date()
+        except ValueError:
+            continue
+    return None
@@ -0,0 +1,188 @@
+import time
+import logging
+from collections import OrderedDict
+
+
+'''
+Explicit dependencies between tests. A producer test is marked @pytest.mark.produces('<artifact>') and publishes
+what it created (uploaded file name, upload date-time, page count, ...) through the 'artifacts' fixture, a consumer
+test is marked @pytest.mark.consumes('<artifact>') and reads it from the same fixture.
+At collection the consumers are ordered after their producers and every connected chain becomes one xdist_group,
+so independent chains run in parallel and a chain is never split across workers or shards.
+A consumer whose producer failed, was skipped or did not run is skipped instead of waiting for a file that never came.
+'''
+
+PRODUCES_MARKER = 'produces'
+CONSUMES_MARKER = 'consumes'
+
+
+class ArtifactRegistry:
+
+    def __init__(self):
+        self.artifacts = dict()
+        self.failures = dict()
+
+    def publish(self, name: str, producer: str, values: dict):
+        """
+        Store an artifact, published again it replaces the previous values
+
+        Args:
+            name: Artifact name, e.g. 'bs_pdf_upload'
+            producer: Node id of the producer test
+            values: What the producer created
+        """
+        self.artifacts[name] = {'producer': producer, 'published': time.time(), 'values': dict(values)}
+        self.failures.pop(name, None)
+        logging.info(f"Artifact '{name}' published by {producer}: {values}")
+
+    def mark_failed(self, name: str, producer: str, reason: str):
+        """Record that the producer of an artifact did not pass, values it published before failing are dropped"""
+        self.artifacts.pop(name, None)
+        self.failures[name] = f'{producer} {reason}'
+
+    def get(self, name: str):
+        """
+        Values of a published artifact
+
+        Args:
+            name: Artifact name
+
+        Returns:
+            dict: Published values, None when not published
+        """
+        artifact = self.artifacts.get(name)
+        return dict(artifact['values']) if artifact else None
+
+    def get_missing_reason(self, name: str):
+        """
+        Why an artifact is not available
+
+        Args:
+            name: Artifact name
+
+        Returns:
+            str: Skip reason, None when the artifact is published
+        """
+        if name in self.artifacts:
+            return None
+        if name in self.failures:
+            return f"producer of '{name}' did not pass: {self.failures[name]}"
+        return f"artifact '{name}' was not published, its producer did not run or did not publish it"
+
+
+class ArtifactView:
+    """
+    Per-test view of the registry, returned by the 'artifacts' fixture.
+    A test only publishes the artifacts it produces and only reads the artifacts it consumes
+    """
+
+    def __init__(self, registry: ArtifactRegistry, nodeid: str, produces, consumes):
+        self.registry = registry
+        self.nodeid = nodeid
+        self.produces = produces
+        self.consumes = consumes
+
+    def publish(self, name: str, **values):
+        """
+        Publish an artifact of this test
+
+        Args:
+            name: Artifact name, declared with @pytest.mark.produces
+            values: What the test created, e.g. filename, ui_dateTime, no_of_page
+        """
+        if name not in self.produces:
+            raise ValueError(f"{self.nodeid} publishes '{name}' without @pytest.mark.produces('{name}')")
+        self.registry.publish(name, self.nodeid, values)
+
+    def __getitem__(self, name: str):
+        if name not in self.consumes:
+            raise KeyError(f"{self.nodeid} reads '{name}' without @pytest.mark.consumes('{name}')")
+        return self.registry.get(name)
+
+
+def get_marker_names(item, marker_name: str):
+    """
+    Artifact names of all the produces / consumes marks of a test (class and function level)
+
+    Args:
+        item: pytest item
+        marker_name: PRODUCES_MARKER or CONSUMES_MARKER
+
+    Returns:
+        list: Artifact names
+    """
+    names = list()
+    for mark in item.iter_markers(marker_name):
+        for name in mark.args:
+            if name not in names:
+                names.append(name)
+    return names
+
+
+def order_by_dependencies(items):
+    """
+    Move every consumer after the producers of its artifacts, otherwise the collection order is kept
+
+    Args:
+        items: Collected pytest items
+
+    Returns:
+        list: Ordered items
+    """
+    producers = dict()
+    for item in items:
+        for name in get_marker_names(item, PRODUCES_MARKER):
+            producers.setdefault(name, list()).append(item)
+
+    ordered = OrderedDict()
+    visiting = set()
+
+    def visit(item):
+        if item.nodeid in ordered or item.nodeid in visiting:
+            return
+        visiting.add(item.nodeid)
+        for name in get_marker_names(item, CONSUMES_MARKER):
+            for producer in producers.get(name, []):
+                visit(producer)
+        visiting.discard(item.nodeid)
+        ordered[item.nodeid] = item
+
+    for item in items:
+        visit(item)
+
+    return list(ordered.values())
+
+
+def get_dependency_groups(items):
+    """
+    Connected producer / consumer chains, each chain is named after its first artifact
+
+    Args:
+        items: Collected pytest items
+
+    Returns:
+        dict: node id -> chain name, only for tests that produce or consume an artifact
+    """
+    parents = dict()
+
+    def find(name):
+        while parents.setdefault(name, name) != name:
+            parents[name] = parents[parents[name]]
+            name = parents[name]
+        return name
+
+    item_names = dict()
+    for item in items:
+        names = get_marker_names(item, PRODUCES_MARKER) + get_marker_names(item, CONSUMES_MARKER)
+        if names:
+            item_names[item.nodeid] = names
+            for name in names[1:]:
+                parents[find(name)] = find(names[0])
+
+    # The first artifact of a chain in collection order names it, stable across workers
+    chain_names = dict()
+    for names in item_names.values():
+        for name in names:
+            chain_names.setdefault(find(name), name)
+
+    return {nodeid: chain_names[find(names[0])] for nodeid, names in item_names.items()}
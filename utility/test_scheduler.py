@@ -0,0 +1,230 @@
+import re
+import glob
+import heapq
+import logging
+import statistics
+from collections import OrderedDict
+from utility.results_store import ResultsStore, iter_testcases
+
+
+'''
+Duration-aware test scheduling. Historical durations (results store, previous JUnit XML reports) are used to
+pack the tests longest-processing-time (LPT) first: under pytest-xdist the longest pending work unit goes to
+the next free worker, with --shard the tests are split into static shards of about equal total duration.
+Tests tied together by an xdist_group mark (upload -> support portal -> module history) form one work unit,
+they are never split and keep their collection order.
+'''
+
+
+class DurationIndex:
+
+    def __init__(self, durations: dict):
+        """
+        Args:
+            durations: JUnit key ('classname::name') -> seconds, see load_durations
+        """
+        self.durations = durations
+        # Runs started from another directory report other classnames, the bare test name is the fallback
+        names = dict()
+        for key, seconds in durations.items():
+            names.setdefault(key.split('::')[-1], list()).append(seconds)
+        self.by_name = {name: values[0] for name, values in names.items() if len(values) == 1}
+        self.default = statistics.median(durations.values()) if durations else 1.0
+
+    def get(self, nodeid: str):
+        """
+        Historical duration of a test
+
+        Args:
+            nodeid: pytest node id, an xdist '@group' suffix is ignored
+
+        Returns:
+            float: Seconds, None when the test has no history
+        """
+        key = get_junit_key(nodeid)
+        if key in self.durations:
+            return self.durations[key]
+        return self.by_name.get(key.split('::')[-1])
+
+    def estimate(self, nodeids):
+        """
+        Expected duration of a work unit, tests without history count as the median test
+
+        Args:
+            nodeids: Node ids of the unit
+
+        Returns:
+            float: Seconds
+        """
+        total = 0.0
+        for nodeid in nodeids:
+            seconds = self.get(nodeid)
+            total += self.default if seconds is None else seconds
+        return total
+
+
+# The duration scheduler overrides the private LoadGroupScheduling._assign_work_unit, xdist is pinned to the version
+# it was written against in requirements.txt. Without that method the plain loadgroup scheduling is used.
+TESTED_XDIST_VERSION = '3.6.1'
+
+
+def make_duration_scheduler(config, log, durations):
+    """
+    pytest-xdist loadgroup scheduling with the work units handed out longest first, instead of largest test count first.
+    xdist is imported here, --shard and serial runs do not need it
+
+    Args:
+        config: pytest config object
+        log: xdist scheduler log
+        durations: Historical durations (DurationIndex)
+
+    Returns:
+        LoadGroupScheduling: The duration scheduler, the plain loadgroup one when xdist changed the private method
+    """
+    import xdist
+    from xdist.scheduler import LoadGroupScheduling
+
+    if not callable(getattr(LoadGroupScheduling, '_assign_work_unit', None)):
+        logging.warning(
+            f'pytest-xdist {xdist.__version__} has no LoadGroupScheduling._assign_work_unit (written against '
+            f'{TESTED_XDIST_VERSION}), the work units are not ordered by duration'
+        )
+        return LoadGroupScheduling(config, log)
+
+    class DurationScheduling(LoadGroupScheduling):
+
+        def __init__(self):
+            super().__init__(config, log)
+            self._ordered = False
+
+        def _assign_work_unit(self, node):
+            # The work queue is complete on the first assignment, order it once by expected duration
+            if not self._ordered:
+                units = sorted(self.workqueue.items(), key=lambda unit: -durations.estimate(unit[1]))
+                self.workqueue.clear()
+                self.workqueue.update(units)
+                self._ordered = True
+                logging.info(f'Duration schedule of {len(units)} work units, longest first')
+
+            super()._assign_work_unit(node)
+
+    return DurationScheduling()
+
+
+def get_junit_key(nodeid: str):
+    """
+    JUnit XML 'classname::name' of a pytest node id, as written by the junitxml plugin
+    e.g. 'test_demo/test_x.py::TestX::test_y[1]' -> 'test_demo.test_x.TestX::test_y[1]'
+    """
+    if nodeid.rfind('@') > nodeid.rfind(']'):
+        nodeid = nodeid.rsplit('@', 1)[0]
+
+    names = nodeid.split('::')
+    names[0] = re.sub(r'\.py$', '', names[0].replace('/', '.'))
+    return f"{'.'.join(names[:-1])}::{names[-1]}"
+
+
+def load_durations(store_path=None, xml_patterns=()):
+    """
+    Median historical duration of every test, from the results store and from previous JUnit XML reports.
+    Skipped results are ignored, the results store wins over the XML reports
+
+    Args:
+        store_path: SQLite results store, None to skip it
+        xml_patterns: Glob patterns of previous JUnit XML reports
+
+    Returns:
+        dict: JUnit key ('classname::name') -> seconds
+    """
+    samples = dict()
+
+    for pattern in xml_patterns:
+        for path in sorted(glob.glob(pattern)):
+            try:
+                for testcase in iter_testcases(path):
+                    if testcase['status'] != 'skipped':
+                        samples.setdefault(f"{testcase['classname']}::{testcase['name']}", list()).append(testcase['duration'])
+            except Exception as err:
+                logging.warning(f'Durations not read from {path}: {err}')
+
+    durations = {key: statistics.median(values) for key, values in samples.items()}
+
+    if store_path:
+        with ResultsStore(store_path) as store:
+            durations.update({stat['test']: stat['p50'] for stat in store.get_duration_stats()})
+
+    return durations
+
+
+def get_work_units(items):
+    """
+    Split the collected tests into work units: one per xdist_group, one per other test, in collection order
+
+    Args:
+        items: Collected pytest items
+
+    Returns:
+        OrderedDict: unit name -> list of items
+    """
+    units = OrderedDict()
+
+    for item in items:
+        group = item.get_closest_marker('xdist_group')
+        name = f"@{group.args[0] if group.args else group.kwargs.get('name')}" if group else item.nodeid
+        units.setdefault(name, list()).append(item)
+
+    return units
+
+
+def plan_shards(unit_durations: dict, shard_count: int):
+    """
+    Longest-processing-time-first packing: every unit, longest first, goes to the shard with the least load
+
+    Args:
+        unit_durations: unit name -> expected seconds, in collection order (ties keep that order)
+        shard_count: Number of shards
+
+    Returns:
+        list: per shard, a dict with the unit names and the expected seconds
+    """
+    shards = [{'units': list(), 'seconds': 0.0} for _ in range(shard_count)]
+    loads = [(0.0, index) for index in range(shard_count)]
+
+    for name, seconds in sorted(unit_durations.items(), key=lambda unit: -unit[1]):
+        load, index = heapq.heappop(loads)
+        shards[index]['units'].append(name)
+        shards[index]['seconds'] += seconds
+        heapq.heappush(loads, (load + seconds, index))
+
+    return shards
+
+
+def select_shard(items, durations: DurationIndex, shard_index: int, shard_count: int):
+    """
+    Tests of one shard, the others are to be deselected
+
+    Args:
+        items: Collected pytest items
+        durations: Historical durations
+        shard_index: 1-based shard number
+        shard_count: Number of shards
+
+    Returns:
+        tuple: (selected items in collection order, deselected items, expected seconds of the shard)
+    """
+    units = get_work_units(items)
+    # Skipped tests (e.g. the benchmarks without --benchmark) cost nothing
+    shards = plan_shards(
+        OrderedDict(
+            (name, durations.estimate([item.nodeid for item in unit if not item.get_closest_marker('skip')]))
+            for name, unit in units.items()
+        ),
+        shard_count
+    )
+    selected_units = set(shards[shard_index - 1]['units'])
+
+    selected, deselected = list(), list()
+    for name, unit in units.items():
+        (selected if name in selected_units else deselected).extend(unit)
+
+    return selected, deselected, shards[shard_index - 1]['seconds']
@@ -0,0 +1,309 @@
+import os
+import json
+import struct
+import hashlib
+import logging
+from PyPDF2 import PdfReader
+
+
+'''
+Catalogue of the test documents under testdata/. The metadata of every file (category, extension, size,
+SHA-256 content hash, PDF page count, image dimensions) is indexed once and persisted to CATALOGUE_PATH;
+on the next refresh only files whose size or mtime changed are read again.
+Tests select documents by criteria (category, type, page range, size) instead of listing directories,
+and processing budgets can use the real page counts before the file is uploaded.
+'''
+
+TESTDATA_DIR = 'testdata'
+CATALOGUE_PATH = '.testdata_catalogue.json'
+CATALOGUE_VERSION = 1
+IMAGE_EXTENSIONS = ('jpg', 'jpeg', 'png', 'gif', 'bmp')
+# JPEG start-of-frame markers, they hold the image size (DHT, JPG and DAC share the range but do not)
+JPEG_SOF_MARKERS = set(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+_catalogue = None
+
+
+class TestdataCatalogue:
+
+    # Not a pytest test class, despite the name
+    __test__ = False
+
+    def __init__(self, root=TESTDATA_DIR, index_path=CATALOGUE_PATH):
+        """
+        Args:
+            root: Test documents directory (default: testdata/ in the working directory)
+            index_path: Persisted index (default: .testdata_catalogue.json in the working directory)
+        """
+        self.root = os.path.abspath(root)
+        self.index_path = os.path.abspath(index_path)
+        self.entries = dict()
+
+    def refresh(self):
+        """
+        Bring the index up to date with the files on disk, unchanged files (same size and mtime) are not read again
+
+        Returns:
+            dict: Number of 'indexed', 'reused' and 'removed' files
+        """
+        known = self._load_index()
+        entries = dict()
+        counts = {'indexed': 0, 'reused': 0, 'removed': 0}
+
+        for path in self._iter_files(self.root):
+            file = os.path.relpath(path, self.root).replace(os.sep, '/')
+            stat = os.stat(path)
+            entry = known.get(file)
+
+            if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+                counts['reused'] += 1
+            else:
+                entry = get_file_metadata(path, self.root)
+                entry.update(file=file, mtime_ns=stat.st_mtime_ns)
+                counts['indexed'] += 1
+
+            entry['path'] = path
+            entries[file] = entry
+
+        counts['removed'] = len(set(known) - set(entries))
+        self.entries = entries
+
+        if counts['indexed'] or counts['removed']:
+            self._save_index()
+
+        logging.info(f'Testdata catalogue: {len(entries)} files, {counts}')
+        return counts
+
+    def find(self, category=None, extensions=None, min_pages=None, max_pages=None, min_size=None, max_size=None):
+        """
+        Documents matching all the given criteria, sorted by file
+
+        Args:
+            category: Folder under testdata/, e.g. 'bank_statement' or 'classification/invoice'
+            extensions: Extension or list of extensions without the dot, e.g. 'pdf' or ['jpg', 'png']
+            min_pages: Minimum page count
+            max_pages: Maximum page count
+            min_size: Minimum file size in bytes
+            max_size: Maximum file size in bytes
+
+        Returns:
+            list: Catalogue entries (file, path, category, name, extension, size, sha256, pages, width, height)
+        """
+        if isinstance(extensions, str):
+            extensions = [extensions]
+        extensions = {extension.lower().lstrip('.') for extension in extensions} if extensions else None
+
+        matches = list()
+
+        for file, entry in sorted(self.entries.items()):
+            if category is not None and entry['category'] != category.strip('/').lower():
+                continue
+            if extensions is not None and entry['extension'] not in extensions:
+                continue
+            if min_pages is not None and (entry['pages'] or 0) < min_pages:
+                continue
+            if max_pages is not None and (entry['pages'] is None or entry['pages'] > max_pages):
+                continue
+            if min_size is not None and entry['size'] < min_size:
+                continue
+            if max_size is not None and entry['size'] > max_size:
+                continue
+            matches.append(dict(entry))
+
+        return matches
+
+    def get(self, path: str):
+        """
+        Catalogue entry of a document
+
+        Args:
+            path: Absolute path, or path relative to testdata/
+
+        Returns:
+            dict: Catalogue entry, None when the file is not in the catalogue
+        """
+        if os.path.isabs(path):
+            path = os.path.relpath(path, self.root)
+        entry = self.entries.get(path.replace(os.sep, '/'))
+        return dict(entry) if entry else None
+
+    def _load_index(self):
+        """Persisted entries by file, empty when there is no index yet or it was written by another version"""
+        try:
+            with open(self.index_path) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if index.get('version') != CATALOGUE_VERSION or index.get('root') != self.root:
+            return {}
+        return index.get('files', {})
+
+    def _save_index(self):
+        """Persist the entries, the absolute paths are derived from the root on load"""
+        files = {file: {key: value for key, value in entry.items() if key != 'path'} for file, entry in self.entries.items()}
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+
+        # Written next to the index and renamed, so a parallel worker never reads a partial file
+        temp_path = f'{self.index_path}.{os.getpid()}.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump({'version': CATALOGUE_VERSION, 'root': self.root, 'files': files}, f, indent=2)
+        os.replace(temp_path, self.index_path)
+
+    def _iter_files(self, directory):
+        """Every regular file below a directory, hidden files and folders excluded"""
+        if not os.path.isdir(directory):
+            return
+
+        with os.scandir(directory) as entries:
+            for entry in sorted(entries, key=lambda entry: entry.name):
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir():
+                    yield from self._iter_files(entry.path)
+                elif entry.is_file():
+                    yield entry.path
+
+
+def get_catalogue(refresh=False):
+    """
+    Catalogue of the working directory's testdata/, refreshed on first use in this process
+
+    Args:
+        refresh: Check the files on disk again
+
+    Returns:
+        TestdataCatalogue: Up to date catalogue
+    """
+    global _catalogue
+
+    if _catalogue is None or _catalogue.root != os.path.abspath(TESTDATA_DIR):
+        _catalogue = TestdataCatalogue()
+        refresh = True
+
+    if refresh:
+        _catalogue.refresh()
+
+    return _catalogue
+
+
+def get_file_metadata(path: str, root=TESTDATA_DIR):
+    """
+    Read the metadata of one document
+
+    Args:
+        path: File path
+        root: Test documents directory, the folder below it is the category
+
+    Returns:
+        dict: category, name, extension, size, sha256, pages (None when unknown), width and height (images only)
+    """
+    name = os.path.basename(path)
+    extension = os.path.splitext(name)[1].lower().lstrip('.')
+    category = os.path.relpath(os.path.dirname(os.path.abspath(path)), os.path.abspath(root)).replace(os.sep, '/').lower()
+
+    metadata = {
+        'category': '' if category == '.' else category,
+        'name': name,
+        'extension': extension,
+        'size': os.path.getsize(path),
+        'sha256': get_file_hash(path),
+        'pages': None,
+        'width': None,
+        'height': None
+    }
+
+    if extension == 'pdf':
+        metadata['pages'] = get_pdf_page_count(path)
+
+    elif extension in IMAGE_EXTENSIONS:
+        metadata['pages'] = 1
+        size = get_image_size(path)
+        if size:
+            metadata['width'], metadata['height'] = size
+
+    return metadata
+
+
+def get_file_hash(path: str, chunk_size=1024 * 1024):
+    """SHA-256 of the file content, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_pdf_page_count(path: str):
+    """
+    Page count of a PDF
+
+    Returns:
+        int: Number of pages, None when the PDF can not be read (e.g. encrypted or damaged)
+    """
+    try:
+        return len(PdfReader(path).pages)
+    except Exception as err:
+        logging.warning(f'Page count of {path} not read: {err}')
+        return None
+
+
+def get_image_size(path: str):
+    """
+    Width and height of a PNG, GIF, BMP or JPEG image, read from its header
+
+    Returns:
+        tuple: (width, height), None when the format is not recognized
+    """
+    with open(path, 'rb') as f:
+        head = f.read(26)
+
+        if head[:8] == b'\x89PNG\r\n\x1a\n':
+            return struct.unpack('>II', head[16:24])
+
+        if head[:6] in (b'GIF87a', b'GIF89a'):
+            return struct.unpack('<HH', head[6:10])
+
+        if head[:2] == b'BM':
+            width, height = struct.unpack('<ii', head[18:26])
+            return width, abs(height)
+
+        if head[:2] == b'\xff\xd8':
+            f.seek(2)
+            return _read_jpeg_size(f)
+
+    return None
+
+
+def _read_jpeg_size(f):
+    """
+    Walk the JPEG segments up to the start-of-frame, which holds the size
+    """
+    while True:
+        byte = f.read(1)
+        while byte and byte != b'\xff':
+            byte = f.read(1)
+        while byte == b'\xff':
+            byte = f.read(1)
+        if not byte:
+            return None
+
+        marker = byte[0]
+
+        # Markers without a length field
+        if marker == 0x01 or 0xD0 <= marker <= 0xD9:
+            continue
+
+        length_bytes = f.read(2)
+        if len(length_bytes) < 2:
+            return None
+        length = struct.unpack('>H', length_bytes)[0]
+
+        if marker in JPEG_SOF_MARKERS:
+            frame = f.read(5)
+            if len(frame) < 5:
+                return None
+            height, width = struct.unpack('>HH', frame[1:5])
+            return width, height
+
+        f.seek(length - 2, os.SEEK_CUR)
@@ -1,63 +1,106 @@
 import os
-import time
 import shutil
 import random
-import inspect
 import logging
 import random
 import string
-from pathlib import Path
+import pytest
 from datetime import datetime, timezone
+from utility import testdata_catalogue
 
 
-def get_testdata_path(option: str, file_extn = ''):
-    cur_dir = os.getcwd()
-    caller_func_name = inspect.stack()[1][3]
-    
-    if 'classification' not in caller_func_name:
-        
-        file_path = os.path.join(cur_dir, 'testdata', option)
-        cur_file = os.listdir(file_path)
+TESTDATA_SEED_ENV = 'TESTDATA_SEED'
 
-        if len(file_extn) > 1:
-            specific_files = [file for file in cur_file if file.lower().endswith('.'+file_extn)]
-            temp_fileName = random.choice(specific_files)
-            return os.path.join(file_path, temp_fileName)
-        
-        else:
+_testdata_seed = None
+_testdata_draws = dict()
 
-            temp_fileName = random.choice(os.listdir(file_path))
-            # temp_fileName = '4_BankForm_ACH.pdf'
-            return os.path.join(file_path, temp_fileName)
 
-    else:
-        
-        file_path = os.path.join(cur_dir, 'testdata', 'classification', option)
-        cur_file = random.choice(os.listdir(file_path))
-        # cur_file = '60_new.pdf'
-        full_filePath = os.path.join(file_path, cur_file)
+def get_testdata_path(option: str, file_extn = '', category = ''):
+    '''
+    Pick one test document
+
+    Args:
+        option: Folder of the documents, e.g. 'bank_statement', or the document type for category 'classification'
+        file_extn: Only documents with this extension, e.g. 'pdf' (default: all)
+        category: '' for testdata/<option>, 'classification' for testdata/classification/<option>
+
+    Returns:
+        str: Absolute path of the document
+    '''
+    folder = f'{category}/{option}' if category else option
+    documents = find_testdata(folder, file_extn if len(file_extn) > 1 else None)
+    # temp_fileName = '4_BankForm_ACH.pdf'
+    full_filePath = sample_testdata(documents)['path']
+
+    if category:
         logging.warning(f'The file Path to be found {full_filePath} !!!')
-        return full_filePath
+
+    return full_filePath
+
+def set_testdata_seed(seed):
+    '''
+    Make the document sampling reproducible, None for unseeded random sampling
+
+    Args:
+        seed: Any int or str, e.g. the --testdata_seed of the run
+    '''
+    global _testdata_seed
+    _testdata_seed = seed
+    _testdata_draws.clear()
+
+def sample_testdata(documents, key = None):
+    '''
+    Pick one of the documents. With a seed every test gets the same document on every run,
+    whatever the test order or the pytest-xdist worker, as the pick depends on the seed, the test and the draw only
+
+    Args:
+        documents: Candidates, e.g. the result of find_testdata
+        key: Identity of the draw (default: the running test, from PYTEST_CURRENT_TEST)
+
+    Returns:
+        Picked document
+    '''
+    if _testdata_seed is None:
+        return random.choice(documents)
+
+    # 'test_demo/test_x.py::TestX::test_y (call)', set by pytest for the running test
+    key = key or os.environ.get('PYTEST_CURRENT_TEST', '').rsplit(' ', 1)[0]
+    draw = _testdata_draws[key] = _testdata_draws.get(key, -1) + 1
+    return random.Random(f'{_testdata_seed}|{key}|{draw}').choice(documents)
 
 def get_list_of_testdata_path(option: str, document_type = ''):
-    
-    cur_dir = os.getcwd()
 
     if len(document_type) == 0:
 
-        file_path = os.path.join(cur_dir, 'testdata', option)
-        list_of_files = os.listdir(file_path)
-        lst_of_full_filePath = [os.path.join(file_path, rel_file_path) for rel_file_path in list_of_files]
-        return lst_of_full_filePath
+        return [document['path'] for document in find_testdata(option)]
             
     else:
 
-        file_path = os.path.join(cur_dir, 'testdata', 'classification', document_type.lower())
-        logging.info(f'The File Path including document type is {file_path}')
-        list_of_files = os.listdir(file_path)
-        lst_of_full_filePath = [os.path.join(file_path, rel_file_path) for rel_file_path in list_of_files]
+        lst_of_full_filePath = [document['path'] for document in find_testdata(f'classification/{document_type.lower()}')]
         logging.info(f'List Of Full File Path is {lst_of_full_filePath}')
         return lst_of_full_filePath
+
+def find_testdata(category: str, extensions=None, **criteria):
+    '''
+    Test documents of a testdata/ folder from the testdata catalogue, no directory listing
+
+    Args:
+        category: Folder under testdata/, e.g. 'bank_statement' or 'classification/invoice'
+        extensions: Extension or list of extensions, e.g. 'pdf' (default: all)
+        criteria: min_pages, max_pages, min_size, max_size (bytes)
+
+    Returns:
+        list: Catalogue entries with path, extension, size, sha256, pages, width and height
+
+    Raises:
+        FileNotFoundError: No document matches
+    '''
+    documents = testdata_catalogue.get_catalogue().find(category, extensions, **criteria)
+
+    if not documents:
+        raise FileNotFoundError(f'No test document in testdata/{category} matches extensions={extensions} {criteria}')
+
+    return documents
         
 def remove_files(section: str, option: str):
         
@@ -106,52 +149,28 @@ def remove_files(section: str, option: str):
     #             logging.error(f'Unable to remove {file_name}', exc_info=True)
                 
 def move_all_download_file_to_current_directory(section: str, option: str, document_type = ''):
-    
-    downloads_dir = str(Path.home() / "Downloads")
-    working_dir = os.getcwd()
-    dst_file_name = os.path.join(working_dir, 'download_output_file', section, option)
-    new_dst_file_name = os.path.join(working_dir, 'download_output_file', section, option, document_type)
-    current_time = time.time()
-    time_window = 80
-    recent_files = []
-    all_files_names_list = os.listdir(downloads_dir)
+    '''
+    Save the downloads of the running test that are not saved yet into download_output_file/<section>/<option>,
+    from the Playwright download events of its context (utility/download_manager.py), ~/Downloads is not scanned
+
+    Args:
+        section: Section name, e.g. 'bank_statement'
+        option: Option name, e.g. 'bank_statement'
+        document_type: Optional sub folder (classification)
+
+    Returns:
+        dict: 'rename_filename' and 'rename_fullpath' of the latest download, empty when nothing was downloaded
+    '''
+    pytest.downloads.save_pending(section, option, document_type)
+    latest = pytest.downloads.get_latest(section, option, document_type)
     data_dict = dict()
 
-    for file_name in all_files_names_list:
-        temp_file_path = os.path.join(downloads_dir, file_name)
-        
-        if os.path.isfile(temp_file_path):
-            modification_time = os.path.getmtime(temp_file_path)
-            
-            if current_time - modification_time <= time_window:
-                current_utc_time = datetime.now(timezone.utc).strftime('%H%M%S%f')
-                temp_list = file_name.split('.')
-                temp_file_name = temp_list[0]+current_utc_time
-                new_file_name = temp_file_name +'.'+ temp_list[-1]
-                new_full_filePath = os.path.join(downloads_dir, new_file_name)
-                os.rename(temp_file_path, new_full_filePath)
-                recent_files.append(new_full_filePath)
-                logging.info('Recent Downloaded file detected')
-    
-    if len(recent_files) >= 1:
-        
-        if len(document_type) == 0:
-            
-            for file_path in recent_files:
-                shutil.move(file_path, dst_file_name)
-                logging.info('File Moved Successfully')
-                
-        elif len(document_type) >= 1:
-            
-            for file_path in recent_files:
-                shutil.move(file_path, new_dst_file_name)
-                logging.info('Classification Section File Moved Successfully')
-    else:
-        
+    if latest is None:
         logging.error('No Recent Downloaded file is added')
+        return data_dict
 
-    data_dict['rename_filename'] = new_file_name
-    data_dict['rename_fullpath'] = new_full_filePath
+    data_dict['rename_filename'] = os.path.basename(latest['path'])
+    data_dict['rename_fullpath'] = latest['path']
     return data_dict
 
 def generate_random_bank_name():
@@ -0,0 +1,128 @@
+import io
+import stat
+import zlib
+import zipfile
+from openpyxl import load_workbook
+
+
+'''
+In-memory verification of the downloaded output zips. The archive is checked from its central directory and
+every member is read once to verify its CRC; the Excel members are opened from memory with openpyxl in
+read-only mode and summarised (sheet names, row counts, headers). Nothing is extracted to disk, so there is no
+extracted_output/ tree to clean up afterwards.
+'''
+
+EXCEL_EXTENSIONS = ('.xlsx', '.xls', '.xlsm', '.xlsb')
+# Formats openpyxl reads, the binary .xls / .xlsb workbooks are only listed
+OPENPYXL_EXTENSIONS = ('.xlsx', '.xlsm')
+
+
+def verify_output_zip(zip_file, excel_extensions=EXCEL_EXTENSIONS):
+    """
+    Validate an output zip and summarise its Excel workbooks
+
+    Args:
+        zip_file: Path of the zip, or a binary file object
+        excel_extensions: Member extensions treated as Excel workbooks
+
+    Returns:
+        dict: members (name, size, compressed_size), excel_files (member names),
+              workbooks (member -> sheets -> rows, columns, headers) and errors (empty when the zip is valid)
+    """
+    report = {'members': list(), 'excel_files': list(), 'workbooks': dict(), 'errors': list()}
+
+    try:
+        # Opening parses the central directory, a truncated or damaged archive fails here
+        archive = zipfile.ZipFile(zip_file, 'r')
+    except (zipfile.BadZipFile, OSError) as err:
+        report['errors'].append(f'Not a valid zip archive: {err}')
+        return report
+
+    with archive:
+        for info in archive.infolist():
+            report['members'].append({'name': info.filename, 'size': info.file_size, 'compressed_size': info.compress_size})
+
+            error = get_member_error(info)
+            if error:
+                report['errors'].append(error)
+                continue
+            if info.is_dir():
+                continue
+
+            try:
+                # Reading to the end verifies the CRC-32 of the member
+                content = archive.read(info)
+            except (zipfile.BadZipFile, zlib.error, EOFError, RuntimeError, OSError) as err:
+                report['errors'].append(f'{info.filename}: {err}')
+                continue
+
+            if info.filename.lower().endswith(excel_extensions):
+                report['excel_files'].append(info.filename)
+
+                if info.filename.lower().endswith(OPENPYXL_EXTENSIONS):
+                    try:
+                        report['workbooks'][info.filename] = summarize_workbook(io.BytesIO(content))
+                    except Exception as err:
+                        report['errors'].append(f'{info.filename}: not a readable workbook: {err}')
+
+    return report
+
+
+def get_member_error(info: zipfile.ZipInfo):
+    """
+    Reason a zip member is not acceptable in an output archive
+
+    Args:
+        info: Member of the central directory
+
+    Returns:
+        str: Error message, None when the member is fine
+    """
+    name = info.filename.replace('\\', '/')
+
+    if name.startswith('/') or '..' in name.split('/'):
+        return f'{info.filename}: unsafe member path'
+    if info.flag_bits & 0x1:
+        return f'{info.filename}: encrypted member'
+    if stat.S_ISLNK(info.external_attr >> 16):
+        return f'{info.filename}: symbolic link member'
+    if info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED, zipfile.ZIP_BZIP2, zipfile.ZIP_LZMA):
+        return f'{info.filename}: unsupported compression {info.compress_type}'
+    return None
+
+
+def summarize_workbook(workbook_file):
+    """
+    Sheet names, row counts and headers of a workbook, rows are streamed and not kept
+
+    Args:
+        workbook_file: Binary file object of an .xlsx / .xlsm workbook
+
+    Returns:
+        dict: sheet name -> rows (including the header row), columns and headers
+    """
+    workbook = load_workbook(workbook_file, read_only=True, data_only=True)
+
+    try:
+        sheets = dict()
+
+        for sheet in workbook.worksheets:
+            headers, rows, columns = list(), 0, 0
+
+            for row in sheet.iter_rows(values_only=True):
+                # Read-only sheets may report trailing empty rows, only rows holding a value count
+                if not any(value is not None and value != '' for value in row):
+                    continue
+                if not rows:
+                    headers = list(row)
+                    while headers and headers[-1] in (None, ''):
+                        headers.pop()
+                rows += 1
+                columns = max(columns, len(row))
+
+            sheets[sheet.title] = {'rows': rows, 'columns': columns, 'headers': headers}
+
+        return sheets
+
+    finally:
+        workbook.close()